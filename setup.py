@@ -48,7 +48,12 @@ setup(
     },
     include_package_data=True,
     package_data={
-        "leximood": ["data/*.json", "data/*.txt"],
+        "leximood": ["data/*.json", "data/*.txt", "data/*.lxm"],
+    },
+    entry_points={
+        "console_scripts": [
+            "leximood=leximood.cli:main",
+        ],
     },
     keywords="persian sentiment analysis nlp text processing emotion detection",
     project_urls={
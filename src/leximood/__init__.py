@@ -6,12 +6,24 @@ __version__ = "0.1.0"
 __author__ = "LexiMood Team"
 __email__ = "info@leximood.com"
 
-from .analyzer import analyze_text
+from .analyzer import analyze_batch, analyze_text, analyze_texts
+from .batch import BatchResult
 from .config import AnalysisConfig
-from .models import AnalysisResult
+from .heavy_hitters import KeywordAggregator
+from .models import AnalysisResult, SentenceResult
+from .parallel import ParallelAnalyzer
+from .async_analyzer import AsyncAnalyzer, analyze_text_async
 
 __all__ = [
     "analyze_text",
-    "AnalysisConfig", 
+    "analyze_texts",
+    "analyze_batch",
+    "BatchResult",
+    "AnalysisConfig",
+    "KeywordAggregator",
     "AnalysisResult",
-] 
\ No newline at end of file
+    "SentenceResult",
+    "ParallelAnalyzer",
+    "AsyncAnalyzer",
+    "analyze_text_async",
+]
\ No newline at end of file
@@ -0,0 +1,8 @@
+"""
+Allow running the command-line interface with ``python -m leximood``.
+"""
+
+import sys
+from .cli import main
+
+sys.exit(main())
\ No newline at end of file
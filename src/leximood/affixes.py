@@ -0,0 +1,46 @@
+"""
+Affix tries used by the rule-based Persian stemmer.
+"""
+
+from typing import Dict, Iterable, List
+
+TERMINAL_MARKER = ""
+
+
+class AffixTrie:
+    def __init__(self, affixes: Iterable[str], match_from_end: bool = False):
+        self._root: Dict[str, Dict] = {}
+        self._match_from_end = match_from_end
+        for affix in affixes:
+            self._insert(affix)
+    
+    @classmethod
+    def for_prefixes(cls, prefixes: Iterable[str]) -> "AffixTrie":
+        return cls(prefixes)
+    
+    @classmethod
+    def for_suffixes(cls, suffixes: Iterable[str]) -> "AffixTrie":
+        return cls(suffixes, match_from_end=True)
+    
+    def match_lengths(self, word: str) -> List[int]:
+        lengths = []
+        node = self._root
+        for depth, char in enumerate(self._walk_order(word), 1):
+            node = node.get(char)
+            if node is None:
+                break
+            if TERMINAL_MARKER in node:
+                lengths.append(depth)
+        return lengths
+    
+    def _insert(self, affix: str):
+        if not affix:
+            return
+        
+        node = self._root
+        for char in self._walk_order(affix):
+            node = node.setdefault(char, {})
+        node[TERMINAL_MARKER] = {}
+    
+    def _walk_order(self, text: str) -> Iterable[str]:
+        return reversed(text) if self._match_from_end else text
\ No newline at end of file
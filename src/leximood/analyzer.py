@@ -2,37 +2,407 @@
 Main analyzer module for LexiMood sentiment analysis.
 """
 
-from typing import Optional
+import threading
+from collections import Counter, OrderedDict
+from dataclasses import replace
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from .config import AnalysisConfig, AnalysisLevel
-from .models import AnalysisResult, SentimentLabel
+from .models import AnalysisResult, SentenceResult, SentimentLabel, TokenizedDocument
+from .batch import BatchResult, BatchResultBuilder
+from .cache import CachedAnalysis, ResultCache, ResultCacheKey, hash_fingerprint, hash_text
+from .sqlite_cache import SQLiteResultCache
 from .preprocessor import TextPreprocessor
 from .sentiment import SentimentAnalyzer
 from .keywords import KeywordExtractor
+from .document_frequency import DocumentFrequencyIndex, OnlineDocumentFrequencies
+from .streaming import StreamingDocument, TextChunks, TextSource
+from .heavy_hitters import KeywordAggregator
+from .resources import ResourceRegistry, get_resource_registry
 from .constants import (
     SENTIMENT_POSITIVE_THRESHOLD, SENTIMENT_NEGATIVE_THRESHOLD,
     CONFIDENCE_SCORE_MULTIPLIER, KEYWORD_CONFIDENCE_FACTOR, KEYWORD_COUNT_DIVISOR,
-    CONFIDENCE_MAX
+    CONFIDENCE_MAX, DEFAULT_BATCH_SIZE, MIN_BATCH_SIZE, ANALYZER_CACHE_SIZE,
+    DEFAULT_STREAM_CHUNK_SIZE, MIN_STREAM_CHUNK_SIZE, EMPTY_STRING
 )
 
 
 class Analyzer:
-    def __init__(self, config: Optional[AnalysisConfig] = None):
-        self.config = config or AnalysisConfig()
-        self.preprocessor = TextPreprocessor()
-        self.sentiment_analyzer = SentimentAnalyzer()
-        self.keyword_extractor = KeywordExtractor()
+    def __init__(
+        self,
+        config: Optional[AnalysisConfig] = None,
+        registry: Optional[ResourceRegistry] = None,
+        result_cache: Optional[Union[ResultCache, SQLiteResultCache]] = None
+    ):
+        self._config = replace(config) if config is not None else AnalysisConfig()
+        self._include_keywords = self._config.include_keywords
+        self._max_keywords = self._config.max_keywords
+        self._include_text = self._config.include_text
+        self._analysis_level = self._config.analysis_level.value
+        self._vectorized_scoring = self._config.vectorized_scoring
+        self._registry = registry or get_resource_registry()
+        self._result_cache = result_cache
+        self._validate_result_cache()
+        self._preprocessor = TextPreprocessor(self._registry)
+        self._sentiment_analyzer = SentimentAnalyzer(self._registry)
+        self._document_frequency_index = self._load_document_frequency_index()
+        self._keyword_extractor = KeywordExtractor(
+            self._registry, self._document_frequency_index, self._config.keyword_weighting,
+            self._create_online_document_frequencies()
+        )
+        self._config_key = self._create_config_key()
+    
+    @property
+    def config(self) -> AnalysisConfig:
+        return replace(self._config)
+    
+    @property
+    def analysis_level(self) -> str:
+        return self._analysis_level
+    
+    @property
+    def registry(self) -> ResourceRegistry:
+        return self._registry
+    
+    @property
+    def result_cache(self) -> Optional[Union[ResultCache, SQLiteResultCache]]:
+        return self._result_cache
+    
+    @property
+    def preprocessor(self) -> TextPreprocessor:
+        return self._preprocessor
+    
+    @property
+    def sentiment_analyzer(self) -> SentimentAnalyzer:
+        return self._sentiment_analyzer
+    
+    @property
+    def keyword_extractor(self) -> KeywordExtractor:
+        return self._keyword_extractor
     
     def analyze(self, text: str) -> AnalysisResult:
         if not self._is_valid_input_text(text):
             raise ValueError("Text cannot be empty")
         
-        processed_text = self.preprocessor.preprocess(text)
-        sentiment_score = self.sentiment_analyzer.analyze(processed_text)
+        processed_text = self._preprocessor.preprocess(text)
+        return self._analyze_processed_text(processed_text, text)
+    
+    def analyze_texts(
+        self,
+        texts: Iterable[str],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        keyword_aggregator: Optional[KeywordAggregator] = None
+    ) -> List[AnalysisResult]:
+        return list(self.iter_analyze_texts(texts, batch_size, keyword_aggregator))
+    
+    def iter_analyze_texts(
+        self,
+        texts: Iterable[str],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        keyword_aggregator: Optional[KeywordAggregator] = None
+    ) -> Iterator[AnalysisResult]:
+        self._validate_batch_size(batch_size)
+        return self._iter_batch_results(texts, batch_size, keyword_aggregator)
+    
+    def analyze_batch(
+        self,
+        texts: Iterable[str],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        include_texts: bool = False,
+        keyword_aggregator: Optional[KeywordAggregator] = None
+    ) -> BatchResult:
+        builder = BatchResultBuilder(self._analysis_level, include_texts)
+        builder.extend(self.iter_analyze_texts(texts, batch_size, keyword_aggregator))
+        return builder.build()
+    
+    def build_document_frequency_index(
+        self, texts: Iterable[str], index: Optional[DocumentFrequencyIndex] = None
+    ) -> DocumentFrequencyIndex:
+        if index is None:
+            index = DocumentFrequencyIndex()
+        
+        for text in texts:
+            if not self._is_valid_input_text(text):
+                continue
+            document = self._preprocessor.tokenize_document(text)
+            self._keyword_extractor.index_document(document, index)
+        return index
+    
+    def analyze_stream(
+        self,
+        source: TextSource,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+        keyword_aggregator: Optional[KeywordAggregator] = None
+    ) -> AnalysisResult:
+        self._validate_chunk_size(chunk_size)
+        document = StreamingDocument(
+            self._sentiment_analyzer,
+            self._keyword_extractor if self._include_keywords or keyword_aggregator is not None else None,
+            self._analysis_level == AnalysisLevel.SENTENCE.value
+        )
+        
+        chunks = TextChunks(source, chunk_size)
+        for normalized_text in self._preprocessor.normalize_stream(chunks):
+            document.feed(normalized_text)
+        document.finish()
+        
+        if not chunks.has_text:
+            raise ValueError("Text cannot be empty")
+        result = self._create_stream_result(document)
+        if keyword_aggregator is not None:
+            keyword_aggregator.add(result.sentiment, self._keyword_extractor.remove_stop_words(document.word_counts))
+        return result
+    
+    def _load_document_frequency_index(self) -> Optional[DocumentFrequencyIndex]:
+        if self._config.document_frequency_index is None:
+            return None
+        return self._registry.document_frequency_index(self._config.document_frequency_index)
+    
+    def _create_online_document_frequencies(self) -> Optional[OnlineDocumentFrequencies]:
+        if not self._config.online_keyword_weighting:
+            return None
+        return OnlineDocumentFrequencies(half_life=self._config.document_frequency_half_life)
+    
+    def _validate_result_cache(self):
+        if self._result_cache is None or not self._config.online_keyword_weighting:
+            return
+        
+        raise ValueError("result_cache cannot be used with online_keyword_weighting")
+    
+    def _create_config_key(self) -> str:
+        if self._document_frequency_index is None:
+            return hash_fingerprint(self._config.result_fingerprint())
+        return hash_fingerprint((self._config.result_fingerprint(), self._document_frequency_index.version))
+    
+    def _create_stream_result(self, document: StreamingDocument) -> AnalysisResult:
+        sentiment_score = document.score
+        keywords = self._extract_keywords_from_counts_if_enabled(document.word_counts)
+        confidence = self._calculate_confidence_score(sentiment_score, len(keywords))
+        return self._create_analysis_result(
+            self._determine_sentiment_label(sentiment_score), sentiment_score, keywords, confidence,
+            EMPTY_STRING, self._create_sentence_results(document.sentence_scores)
+        )
+    
+    def _iter_batch_results(
+        self, texts: Iterable[str], batch_size: int, keyword_aggregator: Optional[KeywordAggregator]
+    ) -> Iterator[AnalysisResult]:
+        for batch in self._split_into_batches(texts, batch_size):
+            yield from self._analyze_batch(batch, keyword_aggregator)
+    
+    def _analyze_processed_text(self, processed_text: str, original_text: str) -> AnalysisResult:
+        if self._result_cache is None:
+            return self._compute_analysis_result(processed_text, original_text)
+        
+        cache_key = self._create_result_cache_key(processed_text)
+        cached_analysis = self._result_cache.get(cache_key)
+        if cached_analysis is not None:
+            return self._restore_cached_result(cached_analysis, original_text)
+        
+        result = self._compute_analysis_result(processed_text, original_text)
+        self._result_cache.put(cache_key, self._create_cached_analysis(result))
+        return result
+    
+    def _compute_analysis_result(self, processed_text: str, original_text: str) -> AnalysisResult:
+        return self._analyze_document(self._tokenize_processed_text(processed_text), original_text)
+    
+    def _tokenize_processed_text(self, processed_text: str) -> TokenizedDocument:
+        return self._preprocessor.tokenize_preprocessed(
+            processed_text, self._analysis_level == AnalysisLevel.SENTENCE.value
+        )
+    
+    def _analyze_document(self, document: TokenizedDocument, original_text: str) -> AnalysisResult:
+        if self._analysis_level == AnalysisLevel.SENTENCE.value:
+            return self._analyze_document_sentences(document, original_text)
+        
+        sentiment_score = self._sentiment_analyzer.analyze_document(document)
+        return self._build_analysis_result(document, sentiment_score, [], original_text)
+    
+    def _analyze_document_sentences(self, document: TokenizedDocument, original_text: str) -> AnalysisResult:
+        sentiment_score, sentence_scores = self._sentiment_analyzer.analyze_document_sentences(document)
+        sentence_texts = [document.sentence_text(span) for span in document.sentences]
+        sentences = self._create_sentence_results(zip(sentence_texts, sentence_scores))
+        return self._build_analysis_result(document, sentiment_score, sentences, original_text)
+    
+    def _create_sentence_results(self, sentence_scores: Iterable[Tuple[str, float]]) -> List[SentenceResult]:
+        return [
+            SentenceResult(sentence_text, self._determine_sentiment_label(score), score)
+            for sentence_text, score in sentence_scores
+        ]
+    
+    def _build_analysis_result(
+        self,
+        document: TokenizedDocument,
+        sentiment_score: float,
+        sentences: List[SentenceResult],
+        original_text: str
+    ) -> AnalysisResult:
         sentiment_label = self._determine_sentiment_label(sentiment_score)
-        keywords = self._extract_keywords_if_enabled(processed_text)
+        keywords = self._extract_keywords_if_enabled(document)
         confidence = self._calculate_confidence_score(sentiment_score, len(keywords))
         return self._create_analysis_result(
-            sentiment_label, sentiment_score, keywords, confidence, text
+            sentiment_label, sentiment_score, keywords, confidence, original_text, sentences
+        )
+    
+    def _validate_batch_size(self, batch_size: int):
+        if batch_size >= MIN_BATCH_SIZE:
+            return
+        
+        raise ValueError(f"batch_size must be at least {MIN_BATCH_SIZE}")
+    
+    def _validate_chunk_size(self, chunk_size: int):
+        if chunk_size >= MIN_STREAM_CHUNK_SIZE:
+            return
+        
+        raise ValueError(f"chunk_size must be at least {MIN_STREAM_CHUNK_SIZE}")
+    
+    def _split_into_batches(self, texts: Iterable[str], batch_size: int) -> Iterator[List[str]]:
+        iterator = iter(texts)
+        batch = list(islice(iterator, batch_size))
+        while batch:
+            yield batch
+            batch = list(islice(iterator, batch_size))
+    
+    def _analyze_batch(
+        self, batch: List[str], keyword_aggregator: Optional[KeywordAggregator] = None
+    ) -> List[AnalysisResult]:
+        processed_texts = [self._preprocess_input_text(text) for text in batch]
+        cache_keys = self._create_result_cache_keys(processed_texts)
+        cached_analyses = self._lookup_cached_analyses(cache_keys)
+        results_by_processed_text: Dict[str, AnalysisResult] = {}
+        pending_texts: Dict[str, str] = {}
+        new_cache_entries = {}
+        
+        for text, processed_text in zip(batch, processed_texts):
+            if processed_text in results_by_processed_text or processed_text in pending_texts:
+                continue
+            cached_analysis = cached_analyses.get(cache_keys.get(processed_text))
+            if cached_analysis is not None:
+                results_by_processed_text[processed_text] = self._restore_cached_result(cached_analysis, text)
+            else:
+                pending_texts[processed_text] = text
+        
+        pending_documents = {
+            processed_text: self._tokenize_processed_text(processed_text) for processed_text in pending_texts
+        }
+        pending_results = self._compute_analysis_results(list(pending_documents.values()), list(pending_texts.values()))
+        for processed_text, result in zip(pending_texts, pending_results):
+            results_by_processed_text[processed_text] = result
+            cache_key = cache_keys.get(processed_text)
+            if cache_key is not None:
+                new_cache_entries[cache_key] = self._create_cached_analysis(result)
+        
+        self._store_cached_analyses(new_cache_entries)
+        batch_results = self._collect_batch_results(batch, processed_texts, results_by_processed_text)
+        if keyword_aggregator is not None:
+            self._aggregate_keywords(keyword_aggregator, processed_texts, batch_results, pending_documents)
+        return batch_results
+    
+    def _compute_analysis_results(
+        self, documents: List[TokenizedDocument], original_texts: List[str]
+    ) -> List[AnalysisResult]:
+        if not self._vectorized_scoring:
+            return [self._analyze_document(document, text) for document, text in zip(documents, original_texts)]
+        if self._analysis_level == AnalysisLevel.SENTENCE.value:
+            return self._compute_vectorized_sentence_analysis_results(documents, original_texts)
+        
+        sentiment_scores = self._sentiment_analyzer.analyze_documents(documents)
+        return [
+            self._build_analysis_result(document, sentiment_score, [], text)
+            for document, sentiment_score, text in zip(documents, sentiment_scores, original_texts)
+        ]
+    
+    def _compute_vectorized_sentence_analysis_results(
+        self, documents: List[TokenizedDocument], original_texts: List[str]
+    ) -> List[AnalysisResult]:
+        results = []
+        for document, (sentiment_score, sentence_scores), text in zip(
+            documents, self._sentiment_analyzer.analyze_documents_sentences(documents), original_texts
+        ):
+            sentence_texts = [document.sentence_text(span) for span in document.sentences]
+            sentences = self._create_sentence_results(zip(sentence_texts, sentence_scores))
+            results.append(self._build_analysis_result(document, sentiment_score, sentences, text))
+        return results
+    
+    def _collect_batch_results(
+        self, batch: List[str], processed_texts: List[str], results_by_processed_text: Dict[str, AnalysisResult]
+    ) -> List[AnalysisResult]:
+        batch_results = []
+        returned_texts = set()
+        for text, processed_text in zip(batch, processed_texts):
+            shared_result = results_by_processed_text[processed_text]
+            if processed_text in returned_texts:
+                batch_results.append(self._reuse_analysis_result(shared_result, text))
+            else:
+                returned_texts.add(processed_text)
+                batch_results.append(shared_result)
+        return batch_results
+    
+    def _aggregate_keywords(
+        self,
+        keyword_aggregator: KeywordAggregator,
+        processed_texts: List[str],
+        results: List[AnalysisResult],
+        documents: Dict[str, TokenizedDocument]
+    ):
+        word_counts_by_text: Dict[str, Dict[str, int]] = {}
+        for processed_text, result in zip(processed_texts, results):
+            word_counts = word_counts_by_text.get(processed_text)
+            if word_counts is None:
+                word_counts = self._count_keyword_candidates(documents.get(processed_text), processed_text)
+                word_counts_by_text[processed_text] = word_counts
+            keyword_aggregator.add(result.sentiment, word_counts)
+    
+    def _count_keyword_candidates(self, document: Optional[TokenizedDocument], processed_text: str) -> Dict[str, int]:
+        if document is None:
+            document = self._preprocessor.tokenize_preprocessed(processed_text)
+        return self._keyword_extractor.remove_stop_words(self._keyword_extractor.count_words(document.lowered_tokens))
+    
+    def _preprocess_input_text(self, text: str) -> str:
+        if not self._is_valid_input_text(text):
+            raise ValueError("Text cannot be empty")
+        return self._preprocessor.preprocess(text)
+    
+    def _reuse_analysis_result(self, result: AnalysisResult, original_text: str) -> AnalysisResult:
+        return self._create_analysis_result(
+            result.sentiment, result.score, list(result.keywords), result.confidence, original_text,
+            list(result.sentences)
+        )
+    
+    def _create_result_cache_key(self, processed_text: str) -> ResultCacheKey:
+        config_key, lexicon_version = self._result_cache_namespace()
+        return (hash_text(processed_text), config_key, lexicon_version)
+    
+    def _create_result_cache_keys(self, processed_texts: List[str]) -> Dict[str, ResultCacheKey]:
+        if self._result_cache is None:
+            return {}
+        
+        config_key, lexicon_version = self._result_cache_namespace()
+        return {
+            processed_text: (hash_text(processed_text), config_key, lexicon_version)
+            for processed_text in processed_texts
+        }
+    
+    def _result_cache_namespace(self) -> Tuple[str, str]:
+        return self._config_key, self._registry.lexicon_store().version
+    
+    def _lookup_cached_analyses(self, cache_keys: Dict[str, ResultCacheKey]) -> Dict[ResultCacheKey, CachedAnalysis]:
+        if not cache_keys:
+            return {}
+        return self._result_cache.get_many(cache_keys.values())
+    
+    def _store_cached_analyses(self, cache_entries: Dict[ResultCacheKey, CachedAnalysis]):
+        if cache_entries:
+            self._result_cache.put_many(cache_entries.items())
+    
+    def _create_cached_analysis(self, result: AnalysisResult) -> CachedAnalysis:
+        return CachedAnalysis(
+            result.sentiment, result.score, tuple(result.keywords), result.confidence, tuple(result.sentences)
+        )
+    
+    def _restore_cached_result(self, cached_analysis: CachedAnalysis, original_text: str) -> AnalysisResult:
+        return self._create_analysis_result(
+            cached_analysis.sentiment, cached_analysis.score, list(cached_analysis.keywords),
+            cached_analysis.confidence, original_text, list(cached_analysis.sentences)
         )
     
     def _is_valid_input_text(self, text: str) -> bool:
@@ -45,13 +415,19 @@ class Analyzer:
             return SentimentLabel.NEGATIVE
         return SentimentLabel.NEUTRAL
     
-    def _extract_keywords_if_enabled(self, processed_text: str) -> list:
-        if not self.config.include_keywords:
+    def _extract_keywords_from_counts_if_enabled(self, word_counts: Counter) -> List[str]:
+        if not self._include_keywords:
             return []
         
-        return self.keyword_extractor.extract(
-            processed_text, 
-            max_keywords=self.config.max_keywords
+        return self._keyword_extractor.extract_from_counts(word_counts, self._max_keywords)
+    
+    def _extract_keywords_if_enabled(self, document: TokenizedDocument) -> list:
+        if not self._include_keywords:
+            return []
+        
+        return self._keyword_extractor.extract_from_document(
+            document,
+            max_keywords=self._max_keywords
         )
     
     def _calculate_confidence_score(self, sentiment_score: float, keyword_count: int) -> float:
@@ -69,34 +445,87 @@ class Analyzer:
         return keyword_factor * KEYWORD_CONFIDENCE_FACTOR
     
     def _create_analysis_result(
-        self, 
-        sentiment_label: SentimentLabel, 
-        sentiment_score: float, 
-        keywords: list, 
-        confidence: float, 
-        original_text: str
+        self,
+        sentiment_label: SentimentLabel,
+        sentiment_score: float,
+        keywords: list,
+        confidence: float,
+        original_text: str,
+        sentences: List[SentenceResult]
     ) -> AnalysisResult:
-        return AnalysisResult(
-            sentiment=sentiment_label,
-            score=sentiment_score,
-            keywords=keywords,
-            confidence=confidence,
-            text=original_text,
-            analysis_level=self.config.analysis_level.value
+        return AnalysisResult.from_trusted_values(
+            sentiment_label, sentiment_score, keywords, confidence,
+            original_text if self._include_text else EMPTY_STRING, self._analysis_level, sentences
         )
 
 
 _global_analyzer_instance = None
+_analyzer_cache: "OrderedDict[Tuple, Analyzer]" = OrderedDict()
+_analyzer_cache_lock = threading.Lock()
 
 
 def analyze_text(text: str, config: Optional[AnalysisConfig] = None) -> AnalysisResult:
+    return _get_global_analyzer(config).analyze(text)
+
+
+def analyze_texts(
+    texts: Iterable[str],
+    config: Optional[AnalysisConfig] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    keyword_aggregator: Optional[KeywordAggregator] = None
+) -> List[AnalysisResult]:
+    return _get_global_analyzer(config).analyze_texts(texts, batch_size, keyword_aggregator)
+
+
+def analyze_batch(
+    texts: Iterable[str],
+    config: Optional[AnalysisConfig] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    include_texts: bool = False,
+    keyword_aggregator: Optional[KeywordAggregator] = None
+) -> BatchResult:
+    return _get_global_analyzer(config).analyze_batch(texts, batch_size, include_texts, keyword_aggregator)
+
+
+def _get_global_analyzer(config: Optional[AnalysisConfig]) -> Analyzer:
+    if config is not None:
+        return _get_cached_analyzer(config)
+    
+    return _get_default_analyzer()
+
+
+def _get_default_analyzer() -> Analyzer:
     global _global_analyzer_instance
     
-    if _should_create_new_analyzer(config):
-        _global_analyzer_instance = Analyzer(config)
+    analyzer = _global_analyzer_instance
+    if analyzer is not None:
+        return analyzer
+    
+    analyzer = Analyzer()
+    with _analyzer_cache_lock:
+        if _global_analyzer_instance is None:
+            _global_analyzer_instance = analyzer
+        return _global_analyzer_instance
+
+
+def _get_cached_analyzer(config: AnalysisConfig) -> Analyzer:
+    cache_key = config.fingerprint()
+    analyzer = _lookup_cached_analyzer(cache_key)
+    if analyzer is not None:
+        return analyzer
     
-    return _global_analyzer_instance.analyze(text)
+    analyzer = Analyzer(config)
+    with _analyzer_cache_lock:
+        analyzer = _analyzer_cache.setdefault(cache_key, analyzer)
+        _analyzer_cache.move_to_end(cache_key)
+        if len(_analyzer_cache) > ANALYZER_CACHE_SIZE:
+            _analyzer_cache.popitem(last=False)
+        return analyzer
 
 
-def _should_create_new_analyzer(config: Optional[AnalysisConfig]) -> bool:
-    return _global_analyzer_instance is None or config is not None 
\ No newline at end of file
+def _lookup_cached_analyzer(cache_key: Tuple) -> Optional[Analyzer]:
+    with _analyzer_cache_lock:
+        analyzer = _analyzer_cache.get(cache_key)
+        if analyzer is not None:
+            _analyzer_cache.move_to_end(cache_key)
+        return analyzer
\ No newline at end of file
@@ -0,0 +1,206 @@
+"""
+Asyncio interface that coalesces concurrent analysis requests into micro-batches.
+
+Batching state belongs to one event loop at a time; an analyzer used from a new loop
+drops the timer and requests left behind by the previous one. The analyzers behind
+analyze_text_async are kept per thread, so loops running in different threads never
+share them.
+"""
+
+import asyncio
+import multiprocessing
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import replace
+from functools import partial
+from typing import Iterable, List, Optional, Set, Tuple
+from .analyzer import Analyzer
+from .config import AnalysisConfig
+from .models import AnalysisResult
+from .parallel import FORK_START_METHOD, _analyze_chunk, _initialize_worker
+from .constants import (
+    DEFAULT_MICRO_BATCH_SIZE, DEFAULT_MICRO_BATCH_WAIT_MS, MIN_BATCH_SIZE,
+    MILLISECONDS_PER_SECOND, ANALYZER_CACHE_SIZE
+)
+
+
+class AsyncAnalyzer:
+    def __init__(
+        self,
+        config: Optional[AnalysisConfig] = None,
+        max_batch_size: int = DEFAULT_MICRO_BATCH_SIZE,
+        max_wait_ms: float = DEFAULT_MICRO_BATCH_WAIT_MS,
+        workers: Optional[int] = None,
+        use_processes: bool = False
+    ):
+        self.analyzer = Analyzer(config)
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.workers = workers
+        self.use_processes = use_processes
+        self.batch_count = 0
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._running_batches: Set[asyncio.Future] = set()
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._executor: Optional[Executor] = None
+        self._validate_max_batch_size()
+        self._validate_max_wait_ms()
+    
+    async def __aenter__(self) -> "AsyncAnalyzer":
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+    
+    async def analyze(self, text: str) -> AnalysisResult:
+        if not self._is_valid_input_text(text):
+            raise ValueError("Text cannot be empty")
+        
+        loop = asyncio.get_running_loop()
+        self._bind_loop(loop)
+        future = loop.create_future()
+        self._pending.append((text, future))
+        
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_wait_ms / MILLISECONDS_PER_SECOND, self._flush)
+        
+        return await future
+    
+    async def analyze_many(self, texts: Iterable[str]) -> List[AnalysisResult]:
+        return list(await asyncio.gather(*(self.analyze(text) for text in texts)))
+    
+    async def close(self):
+        self._bind_loop(asyncio.get_running_loop())
+        self._flush()
+        if self._running_batches:
+            await asyncio.wait(self._running_batches)
+        
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+    
+    def _validate_max_batch_size(self):
+        if self.max_batch_size >= MIN_BATCH_SIZE:
+            return
+        
+        raise ValueError(f"max_batch_size must be at least {MIN_BATCH_SIZE}")
+    
+    def _validate_max_wait_ms(self):
+        if self.max_wait_ms >= 0:
+            return
+        
+        raise ValueError("max_wait_ms cannot be negative")
+    
+    def _is_valid_input_text(self, text: str) -> bool:
+        return text is not None and text.strip() != ""
+    
+    def _bind_loop(self, loop: asyncio.AbstractEventLoop):
+        if self._loop is loop:
+            return
+        
+        self._flush_handle = None
+        self._pending = []
+        self._running_batches = set()
+        self._loop = loop
+    
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        
+        batch = [(text, future) for text, future in self._pending if not future.done()]
+        self._pending = []
+        if not batch:
+            return
+        
+        texts = [text for text, _ in batch]
+        batch_future = asyncio.get_running_loop().run_in_executor(
+            self._get_executor(), self._get_batch_function(), texts
+        )
+        self.batch_count += 1
+        self._running_batches.add(batch_future)
+        batch_future.add_done_callback(partial(self._resolve_batch, batch))
+    
+    def _resolve_batch(self, batch: List[Tuple[str, asyncio.Future]], batch_future: asyncio.Future):
+        self._running_batches.discard(batch_future)
+        if batch_future.cancelled():
+            self._cancel_batch(batch)
+            return
+        
+        error = batch_future.exception()
+        
+        for index, (_, future) in enumerate(batch):
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(batch_future.result()[index])
+    
+    def _cancel_batch(self, batch: List[Tuple[str, asyncio.Future]]):
+        for _, future in batch:
+            future.cancel()
+    
+    def _get_batch_function(self):
+        if self.use_processes:
+            return _analyze_chunk
+        return self._analyze_batch
+    
+    def _analyze_batch(self, texts: List[str]) -> List[AnalysisResult]:
+        return self.analyzer.analyze_texts(texts, len(texts))
+    
+    def _get_executor(self) -> Optional[Executor]:
+        if self._executor is None and self._needs_own_executor():
+            self._executor = self._create_executor()
+        return self._executor
+    
+    def _needs_own_executor(self) -> bool:
+        return self.use_processes or self.workers is not None
+    
+    def _create_executor(self) -> Executor:
+        if not self.use_processes:
+            return ThreadPoolExecutor(self.workers)
+        
+        self.analyzer.registry.preload()
+        if FORK_START_METHOD in multiprocessing.get_all_start_methods():
+            return ProcessPoolExecutor(
+                self.workers, multiprocessing.get_context(FORK_START_METHOD),
+                _initialize_worker, (self.analyzer, None)
+            )
+        
+        return ProcessPoolExecutor(self.workers, None, _initialize_worker, (None, self.analyzer.config))
+
+
+_global_async_analyzers = threading.local()
+
+
+async def analyze_text_async(text: str, config: Optional[AnalysisConfig] = None) -> AnalysisResult:
+    return await _get_global_async_analyzer(config).analyze(text)
+
+
+def _get_global_async_analyzer(config: Optional[AnalysisConfig]) -> AsyncAnalyzer:
+    cache_key = None if config is None else config.fingerprint()
+    async_analyzers = _get_thread_async_analyzers()
+    
+    async_analyzer = async_analyzers.get(cache_key)
+    if async_analyzer is not None:
+        async_analyzers.move_to_end(cache_key)
+        return async_analyzer
+    
+    async_analyzer = AsyncAnalyzer(None if config is None else replace(config))
+    async_analyzers[cache_key] = async_analyzer
+    if len(async_analyzers) > ANALYZER_CACHE_SIZE:
+        async_analyzers.popitem(last=False)
+    return async_analyzer
+
+
+def _get_thread_async_analyzers() -> "OrderedDict[Optional[Tuple], AsyncAnalyzer]":
+    async_analyzers = getattr(_global_async_analyzers, "analyzers", None)
+    if async_analyzers is None:
+        async_analyzers = OrderedDict()
+        _global_async_analyzers.analyzers = async_analyzers
+    return async_analyzers
\ No newline at end of file
@@ -0,0 +1,195 @@
+"""
+Columnar storage of batch analysis results backed by NumPy arrays.
+"""
+
+from array import array
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Union
+import numpy as np
+from .models import AnalysisResult, SentenceResult, SentimentLabel
+
+SENTIMENT_LABELS = tuple(SentimentLabel)
+SENTIMENT_LABEL_CODES = {label: code for code, label in enumerate(SENTIMENT_LABELS)}
+FLOAT32_TYPECODE = "f"
+UINT8_TYPECODE = "B"
+INT32_TYPECODE = "i"
+INT64_TYPECODE = "q"
+
+
+class BatchColumns(NamedTuple):
+    scores: np.ndarray
+    confidences: np.ndarray
+    label_codes: np.ndarray
+    keyword_offsets: np.ndarray
+    keyword_ids: np.ndarray
+    keyword_vocabulary: List[str]
+    sentence_offsets: np.ndarray
+    sentence_scores: np.ndarray
+    sentence_label_codes: np.ndarray
+    sentence_texts: List[str]
+    texts: Optional[List[str]]
+
+
+class BatchResult:
+    def __init__(self, columns: BatchColumns, analysis_level: str, start: int = 0, stop: Optional[int] = None):
+        self.columns = columns
+        self.analysis_level = analysis_level
+        self._start = start
+        self._stop = len(columns.scores) if stop is None else stop
+    
+    @property
+    def scores(self) -> np.ndarray:
+        return self.columns.scores[self._start:self._stop]
+    
+    @property
+    def confidences(self) -> np.ndarray:
+        return self.columns.confidences[self._start:self._stop]
+    
+    @property
+    def label_codes(self) -> np.ndarray:
+        return self.columns.label_codes[self._start:self._stop]
+    
+    @property
+    def keyword_offsets(self) -> np.ndarray:
+        return self.columns.keyword_offsets[self._start:self._stop + 1]
+    
+    @property
+    def sentiments(self) -> List[SentimentLabel]:
+        return [SENTIMENT_LABELS[code] for code in self.label_codes.tolist()]
+    
+    def keywords(self, index: int) -> List[str]:
+        row = self._row_index(index)
+        columns = self.columns
+        keyword_ids = columns.keyword_ids[columns.keyword_offsets[row]:columns.keyword_offsets[row + 1]]
+        return [columns.keyword_vocabulary[keyword_id] for keyword_id in keyword_ids.tolist()]
+    
+    def sentences(self, index: int) -> List[SentenceResult]:
+        row = self._row_index(index)
+        columns = self.columns
+        first, last = columns.sentence_offsets[row:row + 2].tolist()
+        return [
+            SentenceResult(columns.sentence_texts[position], SENTIMENT_LABELS[label_code], score)
+            for position, label_code, score in zip(
+                range(first, last),
+                columns.sentence_label_codes[first:last].tolist(),
+                columns.sentence_scores[first:last].tolist()
+            )
+        ]
+    
+    def text(self, index: int) -> str:
+        if self.columns.texts is None:
+            return ""
+        return self.columns.texts[self._row_index(index)]
+    
+    def to_pandas(self):
+        import pandas as pd
+        
+        data = {
+            "sentiment": pd.Categorical.from_codes(
+                self.label_codes, categories=[label.value for label in SENTIMENT_LABELS]
+            ),
+            "score": self.scores,
+            "confidence": self.confidences,
+            "keywords": [self.keywords(index) for index in range(len(self))],
+        }
+        if self.columns.texts is not None:
+            data["text"] = self.columns.texts[self._start:self._stop]
+        return pd.DataFrame(data)
+    
+    def __len__(self) -> int:
+        return self._stop - self._start
+    
+    def __getitem__(self, index: Union[int, slice]) -> Union[AnalysisResult, "BatchResult"]:
+        if isinstance(index, slice):
+            return self._slice(index)
+        return self._create_row_view(index)
+    
+    def __iter__(self) -> Iterator[AnalysisResult]:
+        for index in range(len(self)):
+            yield self._create_row_view(index)
+    
+    def _row_index(self, index: int) -> int:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("BatchResult index out of range")
+        return self._start + index
+    
+    def _slice(self, index: slice) -> "BatchResult":
+        start, stop, step = index.indices(len(self))
+        if step == 1:
+            return BatchResult(self.columns, self.analysis_level, self._start + start, self._start + max(start, stop))
+        
+        builder = BatchResultBuilder(self.analysis_level, self.columns.texts is not None)
+        builder.extend(self._create_row_view(position) for position in range(start, stop, step))
+        return builder.build()
+    
+    def _create_row_view(self, index: int) -> AnalysisResult:
+        row = self._row_index(index)
+        columns = self.columns
+        return AnalysisResult.from_trusted_values(
+            SENTIMENT_LABELS[columns.label_codes[row]], float(columns.scores[row]), self.keywords(index),
+            float(columns.confidences[row]), self.text(index), self.analysis_level, self.sentences(index)
+        )
+
+
+class BatchResultBuilder:
+    def __init__(self, analysis_level: str, include_texts: bool = False):
+        self.analysis_level = analysis_level
+        self.include_texts = include_texts
+        self._scores = array(FLOAT32_TYPECODE)
+        self._confidences = array(FLOAT32_TYPECODE)
+        self._label_codes = array(UINT8_TYPECODE)
+        self._keyword_offsets = array(INT64_TYPECODE, [0])
+        self._keyword_ids = array(INT32_TYPECODE)
+        self._keyword_vocabulary: List[str] = []
+        self._keyword_id_by_word: Dict[str, int] = {}
+        self._sentence_offsets = array(INT64_TYPECODE, [0])
+        self._sentence_scores = array(FLOAT32_TYPECODE)
+        self._sentence_label_codes = array(UINT8_TYPECODE)
+        self._sentence_texts: List[str] = []
+        self._texts: Optional[List[str]] = [] if include_texts else None
+    
+    def append(self, result: AnalysisResult):
+        self._scores.append(result.score)
+        self._confidences.append(result.confidence)
+        self._label_codes.append(SENTIMENT_LABEL_CODES[result.sentiment])
+        self._keyword_ids.extend(self._get_keyword_id(keyword) for keyword in result.keywords)
+        self._keyword_offsets.append(len(self._keyword_ids))
+        self._append_sentences(result.sentences)
+        if self._texts is not None:
+            self._texts.append(result.text)
+    
+    def extend(self, results: Iterable[AnalysisResult]):
+        for result in results:
+            self.append(result)
+    
+    def build(self) -> BatchResult:
+        columns = BatchColumns(
+            scores=np.frombuffer(self._scores, dtype=np.float32),
+            confidences=np.frombuffer(self._confidences, dtype=np.float32),
+            label_codes=np.frombuffer(self._label_codes, dtype=np.uint8),
+            keyword_offsets=np.frombuffer(self._keyword_offsets, dtype=np.int64),
+            keyword_ids=np.frombuffer(self._keyword_ids, dtype=np.int32),
+            keyword_vocabulary=self._keyword_vocabulary,
+            sentence_offsets=np.frombuffer(self._sentence_offsets, dtype=np.int64),
+            sentence_scores=np.frombuffer(self._sentence_scores, dtype=np.float32),
+            sentence_label_codes=np.frombuffer(self._sentence_label_codes, dtype=np.uint8),
+            sentence_texts=self._sentence_texts,
+            texts=self._texts
+        )
+        return BatchResult(columns, self.analysis_level)
+    
+    def _get_keyword_id(self, keyword: str) -> int:
+        keyword_id = self._keyword_id_by_word.get(keyword)
+        if keyword_id is None:
+            keyword_id = len(self._keyword_vocabulary)
+            self._keyword_id_by_word[keyword] = keyword_id
+            self._keyword_vocabulary.append(keyword)
+        return keyword_id
+    
+    def _append_sentences(self, sentences: List[SentenceResult]):
+        for sentence in sentences:
+            self._sentence_scores.append(sentence.score)
+            self._sentence_label_codes.append(SENTIMENT_LABEL_CODES[sentence.sentiment])
+            self._sentence_texts.append(sentence.text)
+        self._sentence_offsets.append(len(self._sentence_texts))
\ No newline at end of file
@@ -0,0 +1,25 @@
+"""
+Little-endian array and string-table helpers shared by the binary lexicon and index formats.
+"""
+
+import sys
+from array import array
+from typing import List, Tuple
+
+UINT32_SIZE = 4
+
+
+def build_string_table(words: List[bytes]) -> Tuple[array, bytes]:
+    offsets = array('I', [0])
+    for word in words:
+        offsets.append(offsets[-1] + len(word))
+    return offsets, b"".join(words)
+
+
+def to_little_endian(values: array) -> array:
+    if sys.byteorder == 'little':
+        return values
+    
+    swapped = array(values.typecode, values)
+    swapped.byteswap()
+    return swapped
\ No newline at end of file
@@ -0,0 +1,141 @@
+"""
+In-memory cache of analysis results keyed by normalized text, configuration and lexicon version.
+"""
+
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, Iterable, NamedTuple, Optional, Tuple
+from .models import SentenceResult, SentimentLabel
+from .constants import (
+    DEFAULT_RESULT_CACHE_SIZE, MIN_RESULT_CACHE_SIZE, RESULT_CACHE_DIGEST_SIZE, CONFIG_KEY_DIGEST_SIZE
+)
+
+ResultCacheKey = Tuple[bytes, str, str]
+
+
+class CachedAnalysis(NamedTuple):
+    sentiment: SentimentLabel
+    score: float
+    keywords: Tuple[str, ...]
+    confidence: float
+    sentences: Tuple[SentenceResult, ...] = ()
+
+
+class ResultCache:
+    def __init__(self, max_entries: int = DEFAULT_RESULT_CACHE_SIZE, max_bytes: Optional[int] = None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, CachedAnalysis]" = OrderedDict()
+        self._entry_sizes: Dict[Hashable, int] = {}
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self._validate_max_entries()
+        self._validate_max_bytes()
+    
+    def get(self, key: Hashable) -> Optional[CachedAnalysis]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+    
+    def put(self, key: Hashable, entry: CachedAnalysis):
+        entry_size = estimate_entry_size(key, entry)
+        
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = entry
+            self._entry_sizes[key] = entry_size
+            self._total_bytes += entry_size
+            self._evict_over_capacity()
+    
+    def get_many(self, keys: Iterable[Hashable]) -> Dict[Hashable, CachedAnalysis]:
+        found = {}
+        for key in keys:
+            entry = self.get(key)
+            if entry is not None:
+                found[key] = entry
+        return found
+    
+    def put_many(self, entries: Iterable[Tuple[Hashable, CachedAnalysis]]):
+        for key, entry in entries:
+            self.put(key, entry)
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._entry_sizes.clear()
+            self._total_bytes = 0
+            self.hits = 0
+            self.misses = 0
+    
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "bytes": self._total_bytes
+            }
+    
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+    
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def _validate_max_entries(self):
+        if self.max_entries >= MIN_RESULT_CACHE_SIZE:
+            return
+        
+        raise ValueError(f"max_entries must be at least {MIN_RESULT_CACHE_SIZE}")
+    
+    def _validate_max_bytes(self):
+        if self.max_bytes is None or self.max_bytes > 0:
+            return
+        
+        raise ValueError("max_bytes must be positive")
+    
+    def _discard(self, key: Hashable):
+        if key not in self._entries:
+            return
+        
+        del self._entries[key]
+        self._total_bytes -= self._entry_sizes.pop(key)
+    
+    def _evict_over_capacity(self):
+        while len(self._entries) > self.max_entries or self._exceeds_max_bytes():
+            key, _ = self._entries.popitem(last=False)
+            self._total_bytes -= self._entry_sizes.pop(key)
+    
+    def _exceeds_max_bytes(self) -> bool:
+        return self.max_bytes is not None and self._total_bytes > self.max_bytes
+
+
+def hash_text(text: str) -> bytes:
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=RESULT_CACHE_DIGEST_SIZE).digest()
+
+
+def hash_fingerprint(fingerprint: Tuple) -> str:
+    return hashlib.blake2b(repr(fingerprint).encode('utf-8'), digest_size=CONFIG_KEY_DIGEST_SIZE).hexdigest()
+
+
+def estimate_entry_size(key: Hashable, entry: CachedAnalysis) -> int:
+    keyword_size = sum(sys.getsizeof(keyword) for keyword in entry.keywords)
+    sentence_size = sum(sys.getsizeof(sentence) + sys.getsizeof(sentence.text) for sentence in entry.sentences)
+    return (
+        sys.getsizeof(key) + sys.getsizeof(entry) + sys.getsizeof(entry.keywords) + keyword_size
+        + sys.getsizeof(entry.sentences) + sentence_size
+    )
\ No newline at end of file
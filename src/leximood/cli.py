@@ -0,0 +1,347 @@
+"""
+Command-line interface for running LexiMood over large text streams.
+
+    leximood analyze [FILE ...] [--format {auto,text,jsonl,csv}] [--text-field NAME]
+                     [--workers N] [--batch-size N] [--output FILE]
+                     [--document-frequency-index PATH] [--keyword-weighting {tfidf,bm25}]
+    leximood serve [--host HOST] [--port PORT | --unix-socket PATH] [--workers N] [--processes]
+                   [--max-batch-size N] [--max-wait-ms MS]
+                   [--document-frequency-index PATH] [--keyword-weighting {tfidf,bm25}]
+    leximood keywords [FILE ...] [--format {auto,text,jsonl,csv}] [--text-field NAME] [--top K]
+                      [--capacity N] [--workers N] [--batch-size N] [--output FILE]
+    leximood index build [FILE ...] [--format {auto,text,jsonl,csv}] [--text-field NAME] --output PATH
+    leximood index merge INDEX [INDEX ...] --output PATH
+"""
+
+import argparse
+import bz2
+import csv
+import gzip
+import json
+import lzma
+import os
+import sys
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, TextIO
+from .analyzer import Analyzer
+from .config import AnalysisConfig, AnalysisLevel, KeywordWeighting
+from .document_frequency import DocumentFrequencyIndex
+from .heavy_hitters import HeavyHitter, KeywordAggregator
+from .models import AnalysisResult
+from .parallel import ParallelAnalyzer
+from .server import AnalysisServer, run_server
+from .constants import (
+    DEFAULT_BATCH_SIZE, DEFAULT_TEXT_FIELD, MIN_PARALLEL_WORKERS,
+    DEFAULT_SERVER_HOST, DEFAULT_SERVER_PORT, DEFAULT_MICRO_BATCH_SIZE, DEFAULT_MICRO_BATCH_WAIT_MS,
+    DEFAULT_HEAVY_HITTER_CAPACITY, DEFAULT_TOP_KEYWORDS
+)
+
+STANDARD_STREAM_PATH = "-"
+AUTO_FORMAT = "auto"
+TEXT_FORMAT = "text"
+JSONL_FORMAT = "jsonl"
+CSV_FORMAT = "csv"
+INPUT_FORMATS = (AUTO_FORMAT, TEXT_FORMAT, JSONL_FORMAT, CSV_FORMAT)
+FORMATS_BY_EXTENSION = {".jsonl": JSONL_FORMAT, ".ndjson": JSONL_FORMAT, ".csv": CSV_FORMAT}
+COMPRESSED_OPENERS: Dict[str, Callable] = {".gz": gzip.open, ".bz2": bz2.open, ".xz": lzma.open}
+TEXT_ENCODING = "utf-8"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = _create_parser()
+    args = parser.parse_args(argv)
+    
+    try:
+        return args.handler(args)
+    except ValueError as e:
+        print(f"leximood: error: {e}", file=sys.stderr)
+        return 1
+    except BrokenPipeError:
+        _silence_standard_output()
+        return 1
+    except OSError as e:
+        print(f"leximood: error: {_describe_os_error(e)}", file=sys.stderr)
+        return 1
+
+
+def _describe_os_error(error: OSError) -> str:
+    if error.filename is None:
+        return str(error)
+    return f"{error.filename}: {error.strerror}"
+
+
+def _silence_standard_output():
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, sys.stdout.fileno())
+    os.close(devnull)
+
+
+def _create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="leximood", description="LexiMood Persian sentiment analysis")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    analyze_parser = subparsers.add_parser("analyze", help="Analyze texts and write one JSON result per line")
+    _add_input_arguments(analyze_parser)
+    analyze_parser.add_argument("--workers", type=int, default=MIN_PARALLEL_WORKERS, help="Number of worker processes")
+    analyze_parser.add_argument(
+        "--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+        help="Number of texts analyzed per batch"
+    )
+    analyze_parser.add_argument(
+        "--output", "-o", default=STANDARD_STREAM_PATH,
+        help="Output file (default: standard output)"
+    )
+    _add_keyword_weighting_arguments(analyze_parser)
+    _add_scoring_arguments(analyze_parser)
+    analyze_parser.set_defaults(handler=_run_analyze)
+    
+    serve_parser = subparsers.add_parser("serve", help="Serve analysis requests over HTTP")
+    serve_parser.add_argument("--host", default=DEFAULT_SERVER_HOST, help="Address to listen on")
+    serve_parser.add_argument("--port", type=int, default=DEFAULT_SERVER_PORT, help="TCP port to listen on")
+    serve_parser.add_argument("--unix-socket", help="Listen on this Unix-domain socket instead of TCP")
+    serve_parser.add_argument("--workers", type=int, help="Number of analysis threads or processes")
+    serve_parser.add_argument("--processes", action="store_true", help="Run analysis in worker processes")
+    serve_parser.add_argument(
+        "--max-batch-size", type=int, default=DEFAULT_MICRO_BATCH_SIZE,
+        help="Maximum number of texts analyzed together"
+    )
+    serve_parser.add_argument(
+        "--max-wait-ms", type=float, default=DEFAULT_MICRO_BATCH_WAIT_MS,
+        help="Maximum time a request waits for its batch to fill"
+    )
+    _add_keyword_weighting_arguments(serve_parser)
+    _add_scoring_arguments(serve_parser)
+    serve_parser.set_defaults(handler=_run_serve)
+    
+    keywords_parser = subparsers.add_parser(
+        "keywords", help="Report the most frequent keywords of a corpus per sentiment as JSON"
+    )
+    _add_input_arguments(keywords_parser)
+    keywords_parser.add_argument("--top", type=int, default=DEFAULT_TOP_KEYWORDS, help="Keywords reported per sentiment")
+    keywords_parser.add_argument(
+        "--capacity", type=int, default=DEFAULT_HEAVY_HITTER_CAPACITY,
+        help="Counters kept per sentiment; larger values tighten the error bound"
+    )
+    keywords_parser.add_argument("--workers", type=int, default=MIN_PARALLEL_WORKERS, help="Number of worker processes")
+    keywords_parser.add_argument(
+        "--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+        help="Number of texts analyzed per batch"
+    )
+    keywords_parser.add_argument(
+        "--output", "-o", default=STANDARD_STREAM_PATH,
+        help="Output file (default: standard output)"
+    )
+    keywords_parser.set_defaults(handler=_run_keywords)
+    
+    index_parser = subparsers.add_parser("index", help="Build and merge document frequency indexes")
+    index_subparsers = index_parser.add_subparsers(dest="index_command", required=True)
+    
+    build_parser = index_subparsers.add_parser("build", help="Count document frequencies over a corpus")
+    _add_input_arguments(build_parser)
+    build_parser.add_argument("--output", "-o", required=True, help="Path of the index to write")
+    build_parser.set_defaults(handler=_run_index_build)
+    
+    merge_parser = index_subparsers.add_parser("merge", help="Combine indexes built from corpus shards")
+    merge_parser.add_argument("indexes", nargs="+", help="Indexes to merge")
+    merge_parser.add_argument("--output", "-o", required=True, help="Path of the merged index")
+    merge_parser.set_defaults(handler=_run_index_merge)
+    
+    return parser
+
+
+def _add_input_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument(
+        "inputs", nargs="*", default=[STANDARD_STREAM_PATH],
+        help="Input files, optionally compressed with gzip, bzip2 or xz (default: standard input)"
+    )
+    parser.add_argument(
+        "--format", choices=INPUT_FORMATS, default=AUTO_FORMAT,
+        help="Input format; auto picks jsonl or csv from the file extension and plain text otherwise"
+    )
+    parser.add_argument(
+        "--text-field", default=DEFAULT_TEXT_FIELD,
+        help="Field holding the text in JSONL records or the CSV header"
+    )
+
+
+def _add_keyword_weighting_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument(
+        "--document-frequency-index",
+        help="Document frequency index used to weight keywords (see 'leximood index build')"
+    )
+    parser.add_argument(
+        "--keyword-weighting", choices=[weighting.value for weighting in KeywordWeighting],
+        default=KeywordWeighting.TF_IDF.value, help="Keyword weighting used with a document frequency index"
+    )
+
+
+def _add_scoring_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument(
+        "--vectorized-scoring", action="store_true",
+        help="Score each batch with NumPy over vocabulary ids instead of word by word"
+    )
+
+
+def _create_config(args: argparse.Namespace) -> AnalysisConfig:
+    return AnalysisConfig(
+        document_frequency_index=args.document_frequency_index,
+        keyword_weighting=KeywordWeighting(args.keyword_weighting),
+        vectorized_scoring=args.vectorized_scoring
+    )
+
+
+def _run_analyze(args: argparse.Namespace) -> int:
+    texts = _iter_input_texts(args.inputs, args.format, args.text_field)
+    
+    with ParallelAnalyzer(_create_config(args), args.workers, args.batch_size) as parallel_analyzer:
+        with _open_output(args.output) as output:
+            _write_results(parallel_analyzer.iter_analyze(texts), output)
+    return 0
+
+
+def _run_serve(args: argparse.Namespace) -> int:
+    server = AnalysisServer(
+        _create_config(args), args.host, args.port, args.unix_socket,
+        args.max_batch_size, args.max_wait_ms, args.workers, args.processes
+    )
+    address = args.unix_socket or f"http://{args.host}:{args.port}"
+    print(f"Serving LexiMood analysis on {address}", file=sys.stderr)
+    run_server(server)
+    return 0
+
+
+def _run_keywords(args: argparse.Namespace) -> int:
+    texts = _iter_input_texts(args.inputs, args.format, args.text_field)
+    keyword_aggregator = KeywordAggregator(args.capacity)
+    config = AnalysisConfig(analysis_level=AnalysisLevel.DOCUMENT, include_keywords=False, include_text=False)
+    
+    with ParallelAnalyzer(config, args.workers, args.batch_size) as parallel_analyzer:
+        deque(parallel_analyzer.iter_analyze(texts, keyword_aggregator), maxlen=0)
+    with _open_output(args.output) as output:
+        json.dump(_format_top_keywords(keyword_aggregator, args.top), output, ensure_ascii=False)
+        output.write("\n")
+    return 0
+
+
+def _format_top_keywords(keyword_aggregator: KeywordAggregator, top: int) -> Dict[str, dict]:
+    return {
+        sentiment.value: {
+            "documents": keyword_aggregator.document_counts[sentiment],
+            "keywords": [_format_heavy_hitter(heavy_hitter) for heavy_hitter in heavy_hitters]
+        }
+        for sentiment, heavy_hitters in keyword_aggregator.top_by_sentiment(top).items()
+    }
+
+
+def _format_heavy_hitter(heavy_hitter: HeavyHitter) -> Dict[str, object]:
+    return {"word": heavy_hitter.word, "count": heavy_hitter.count, "error": heavy_hitter.error}
+
+
+def _run_index_build(args: argparse.Namespace) -> int:
+    texts = _iter_input_texts(args.inputs, args.format, args.text_field)
+    index = Analyzer().build_document_frequency_index(texts)
+    index.save(args.output)
+    print(f"Indexed {index.document_count} documents and {len(index)} words to {args.output}", file=sys.stderr)
+    return 0
+
+
+def _run_index_merge(args: argparse.Namespace) -> int:
+    index = DocumentFrequencyIndex()
+    for path in args.indexes:
+        index.merge(DocumentFrequencyIndex.load(path))
+    index.save(args.output)
+    print(f"Merged {index.document_count} documents and {len(index)} words to {args.output}", file=sys.stderr)
+    return 0
+
+
+def _iter_input_texts(paths: Iterable[str], input_format: str, text_field: str) -> Iterator[str]:
+    for path in paths:
+        path_format = _resolve_input_format(path, input_format)
+        with _open_input(path) as stream:
+            yield from _read_texts(stream, path_format, text_field, path)
+
+
+def _resolve_input_format(path: str, input_format: str) -> str:
+    if input_format != AUTO_FORMAT:
+        return input_format
+    
+    base_path, extension = os.path.splitext(path)
+    if extension in COMPRESSED_OPENERS:
+        extension = os.path.splitext(base_path)[1]
+    return FORMATS_BY_EXTENSION.get(extension.lower(), TEXT_FORMAT)
+
+
+@contextmanager
+def _open_input(path: str) -> Iterator[TextIO]:
+    if path == STANDARD_STREAM_PATH:
+        yield sys.stdin
+        return
+    
+    opener = COMPRESSED_OPENERS.get(os.path.splitext(path)[1], open)
+    with opener(path, "rt", encoding=TEXT_ENCODING, newline="") as stream:
+        yield stream
+
+
+@contextmanager
+def _open_output(path: str) -> Iterator[TextIO]:
+    if path == STANDARD_STREAM_PATH:
+        yield sys.stdout
+        sys.stdout.flush()
+        return
+    
+    with open(path, "w", encoding=TEXT_ENCODING) as stream:
+        yield stream
+
+
+def _read_texts(stream: TextIO, input_format: str, text_field: str, path: str) -> Iterator[str]:
+    if input_format == JSONL_FORMAT:
+        return _read_jsonl_texts(stream, text_field, path)
+    if input_format == CSV_FORMAT:
+        return _read_csv_texts(stream, text_field, path)
+    return (line.rstrip("\r\n") for line in stream if line.strip())
+
+
+def _read_jsonl_texts(stream: TextIO, text_field: str, path: str) -> Iterator[str]:
+    for line_number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"{path}:{line_number}: invalid JSON: {e}")
+        yield _get_text_field(record, text_field, f"{path}:{line_number}")
+
+
+def _read_csv_texts(stream: TextIO, text_field: str, path: str) -> Iterator[str]:
+    reader = csv.DictReader(stream)
+    if reader.fieldnames is None:
+        return
+    if text_field not in reader.fieldnames:
+        raise ValueError(f"{path}: CSV header has no '{text_field}' column")
+    
+    for record in reader:
+        yield _get_text_field(record, text_field, f"{path}:{reader.line_num}")
+
+
+def _get_text_field(record: object, text_field: str, location: str) -> str:
+    if not isinstance(record, dict) or text_field not in record:
+        raise ValueError(f"{location}: record has no '{text_field}' field")
+    
+    text = record[text_field]
+    if not isinstance(text, str):
+        raise ValueError(f"{location}: '{text_field}' field is not a string")
+    if not text.strip():
+        raise ValueError(f"{location}: '{text_field}' field is empty")
+    return text
+
+
+def _write_results(results: Iterable[AnalysisResult], output: TextIO):
+    for result in results:
+        output.write(json.dumps(result.to_dict(), ensure_ascii=False))
+        output.write("\n")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -2,12 +2,12 @@
 Configuration classes for LexiMood sentiment analysis.
 """
 
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, fields
+from typing import Optional, Tuple
 from enum import Enum
 from .constants import (
     DEFAULT_MAX_KEYWORDS, DEFAULT_CONFIDENCE_THRESHOLD,
-    MIN_KEYWORDS_REQUIRED, CONFIDENCE_MIN, CONFIDENCE_MAX
+    MIN_KEYWORDS_REQUIRED, CONFIDENCE_MIN, CONFIDENCE_MAX, DEFAULT_DOCUMENT_FREQUENCY_HALF_LIFE
 )
 
 
@@ -20,6 +20,11 @@ class Language(Enum):
     PERSIAN = "persian"
 
 
+class KeywordWeighting(Enum):
+    TF_IDF = "tfidf"
+    BM25 = "bm25"
+
+
 @dataclass
 class AnalysisConfig:
     analysis_level: AnalysisLevel = AnalysisLevel.SENTENCE
@@ -27,10 +32,23 @@ class AnalysisConfig:
     include_keywords: bool = True
     max_keywords: int = DEFAULT_MAX_KEYWORDS
     confidence_threshold: float = DEFAULT_CONFIDENCE_THRESHOLD
+    include_text: bool = True
+    document_frequency_index: Optional[str] = None
+    keyword_weighting: KeywordWeighting = KeywordWeighting.TF_IDF
+    online_keyword_weighting: bool = False
+    document_frequency_half_life: Optional[float] = DEFAULT_DOCUMENT_FREQUENCY_HALF_LIFE
+    vectorized_scoring: bool = False
     
     def __post_init__(self):
         self._validate_max_keywords()
         self._validate_confidence_threshold()
+        self._validate_keyword_weighting()
+    
+    def fingerprint(self) -> Tuple:
+        return tuple(getattr(self, field.name) for field in fields(self))
+    
+    def result_fingerprint(self) -> Tuple:
+        return (self.analysis_level, self.language, self.include_keywords, self.max_keywords, self.keyword_weighting)
     
     def _validate_max_keywords(self):
         if self.max_keywords >= MIN_KEYWORDS_REQUIRED:
@@ -42,4 +60,10 @@ class AnalysisConfig:
         if CONFIDENCE_MIN <= self.confidence_threshold <= CONFIDENCE_MAX:
             return
         
-        raise ValueError(f"confidence_threshold must be between {CONFIDENCE_MIN} and {CONFIDENCE_MAX}") 
\ No newline at end of file
+        raise ValueError(f"confidence_threshold must be between {CONFIDENCE_MIN} and {CONFIDENCE_MAX}")
+    
+    def _validate_keyword_weighting(self):
+        if self.online_keyword_weighting and self.document_frequency_index is not None:
+            raise ValueError("online_keyword_weighting cannot be combined with document_frequency_index")
+        if self.document_frequency_half_life is not None and self.document_frequency_half_life <= 0:
+            raise ValueError("document_frequency_half_life must be positive")
\ No newline at end of file
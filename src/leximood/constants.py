@@ -2,6 +2,14 @@
 Constants for LexiMood sentiment analysis.
 """
 
+import os
+
+# Data Files
+DATA_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+SENTIMENT_LEXICON_FILENAME = "persian_sentiment_lexicon.json"
+PERSIAN_ROOTS_FILENAME = "persian_roots.json"
+COMPILED_LEXICON_EXTENSION = ".lxm"
+
 # Sentiment Analysis Constants
 SENTIMENT_POSITIVE_THRESHOLD = 0.1
 SENTIMENT_NEGATIVE_THRESHOLD = -0.1
@@ -20,13 +28,68 @@ DEFAULT_MAX_KEYWORDS = 5
 DEFAULT_CONFIDENCE_THRESHOLD = 0.5
 MIN_KEYWORDS_REQUIRED = 1
 
+# Batch Processing Defaults
+DEFAULT_BATCH_SIZE = 1000
+MIN_BATCH_SIZE = 1
+
+# Analyzer Cache Defaults
+ANALYZER_CACHE_SIZE = 32
+
+# Result Cache Defaults
+DEFAULT_RESULT_CACHE_SIZE = 10000
+MIN_RESULT_CACHE_SIZE = 1
+RESULT_CACHE_DIGEST_SIZE = 16
+CONFIG_KEY_DIGEST_SIZE = 8
+SQLITE_CACHE_BATCH_SIZE = 500
+
+# Streaming Analysis Defaults
+DEFAULT_STREAM_CHUNK_SIZE = 65536
+MIN_STREAM_CHUNK_SIZE = 1
+
+# Online Document Frequency Defaults
+DEFAULT_SKETCH_WIDTH = 65536
+DEFAULT_SKETCH_DEPTH = 4
+DEFAULT_DOCUMENT_FREQUENCY_HALF_LIFE = 24 * 3600.0
+DEFAULT_SNAPSHOT_INTERVAL = 1000
+MIN_SKETCH_WIDTH = 1
+MIN_SKETCH_DEPTH = 1
+MIN_SNAPSHOT_INTERVAL = 1
+SKETCH_POSITION_CACHE_SIZE = 65536
+
+# Heavy Hitter Defaults
+DEFAULT_HEAVY_HITTER_CAPACITY = 10000
+MIN_HEAVY_HITTER_CAPACITY = 1
+DEFAULT_TOP_KEYWORDS = 100
+
+# Parallel Processing Defaults
+DEFAULT_PARALLEL_CHUNK_SIZE = 500
+MIN_PARALLEL_WORKERS = 1
+MAX_PENDING_CHUNKS_PER_WORKER = 2
+
+# Async Micro-Batching Defaults
+DEFAULT_MICRO_BATCH_SIZE = 32
+DEFAULT_MICRO_BATCH_WAIT_MS = 5.0
+MILLISECONDS_PER_SECOND = 1000
+
+# Analysis Server Defaults
+DEFAULT_SERVER_HOST = "127.0.0.1"
+DEFAULT_SERVER_PORT = 8080
+MAX_REQUEST_BODY_SIZE = 16 * 1024 * 1024
+MAX_REQUEST_HEADERS = 100
+
+# Command Line Defaults
+DEFAULT_TEXT_FIELD = "text"
+
 # Text Processing Constants
 SINGLE_SPACE = ' '
 EMPTY_STRING = ''
 MIN_WORD_LENGTH_FOR_PROCESSING = 2
 MAX_WORD_LENGTH_FOR_NORMALIZATION = 10
 FREQUENCY_BOOST_FACTOR = 10
+SENTIMENT_KEYWORD_BOOST_FACTOR = 2.0
 MIN_WORD_LENGTH_FOR_KEYWORD_EXTRACTION = 2
+BM25_TERM_SATURATION = 1.2
+BM25_LENGTH_NORMALIZATION = 0.75
 
 # Unicode Control Character Ranges
 CONTROL_CHARACTERS_START = 0x00
@@ -98,4 +161,7 @@ PERSIAN_VERB_PREFIXES = [
 ]
 
 # Minimum word length for stemming
-MIN_WORD_LENGTH_FOR_STEMMING = 3 
\ No newline at end of file
+MIN_WORD_LENGTH_FOR_STEMMING = 3
+
+# Maximum number of memoized word stems per preprocessor
+STEM_CACHE_SIZE = 65536
\ No newline at end of file
@@ -0,0 +1,336 @@
+"""
+Corpus document frequencies used for TF-IDF and BM25 keyword weighting.
+
+An index is built in one streaming pass over a corpus, can be merged with indexes
+built from other shards and is stored as a compressed, sorted string table:
+    
+    leximood index build CORPUS.jsonl --output CORPUS.lxdf
+    leximood index merge SHARD-1.lxdf SHARD-2.lxdf --output CORPUS.lxdf
+
+Live feeds use online document frequencies instead: a count-min sketch of fixed
+size whose counts decay exponentially, read through periodically published snapshots.
+"""
+
+import hashlib
+import math
+import os
+import struct
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from array import array
+from collections import Counter
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+import numpy as np
+from .binary_tables import UINT32_SIZE, build_string_table, to_little_endian
+from .constants import (
+    DEFAULT_SKETCH_WIDTH, DEFAULT_SKETCH_DEPTH, DEFAULT_DOCUMENT_FREQUENCY_HALF_LIFE,
+    DEFAULT_SNAPSHOT_INTERVAL, MIN_SKETCH_WIDTH, MIN_SKETCH_DEPTH, MIN_SNAPSHOT_INTERVAL,
+    SKETCH_POSITION_CACHE_SIZE
+)
+
+DOCUMENT_FREQUENCY_MAGIC = b"LXMDDFI\x00"
+DOCUMENT_FREQUENCY_FORMAT_VERSION = 1
+DOCUMENT_FREQUENCY_HEADER = struct.Struct("<8sIQQII16s")
+DOCUMENT_FREQUENCY_DIGEST_SIZE = 16
+BM25_IDF_SMOOTHING = 0.5
+SKETCH_HASH_SIZE = 8
+SKETCH_RESCALE_LIMIT = 2.0 ** 64
+
+
+class DocumentFrequencyWeights(ABC):
+    @property
+    @abstractmethod
+    def document_count(self) -> float:
+        ...
+    
+    @property
+    @abstractmethod
+    def total_word_count(self) -> float:
+        ...
+    
+    @property
+    def average_document_length(self) -> float:
+        if self.document_count == 0:
+            return 0.0
+        return self.total_word_count / self.document_count
+    
+    @abstractmethod
+    def document_frequency(self, word: str) -> float:
+        ...
+    
+    def idf(self, word: str) -> float:
+        return math.log((1 + self.document_count) / (1 + self.document_frequency(word))) + 1.0
+    
+    def bm25_idf(self, word: str) -> float:
+        document_frequency = self.document_frequency(word)
+        return math.log(
+            1.0 + (self.document_count - document_frequency + BM25_IDF_SMOOTHING)
+            / (document_frequency + BM25_IDF_SMOOTHING)
+        )
+
+
+class DocumentFrequencyIndex(DocumentFrequencyWeights):
+    def __init__(self):
+        self._document_count = 0
+        self._total_word_count = 0
+        self._document_frequencies: Counter = Counter()
+        self._version: Optional[str] = None
+    
+    @property
+    def document_count(self) -> int:
+        return self._document_count
+    
+    @property
+    def total_word_count(self) -> int:
+        return self._total_word_count
+    
+    @property
+    def version(self) -> str:
+        if self._version is None:
+            self._version = _calculate_version(self._serialize_body())
+        return self._version
+    
+    def add_document(self, words: Iterable[str]):
+        words = list(words)
+        self._document_frequencies.update(set(words))
+        self._document_count += 1
+        self._total_word_count += len(words)
+        self._version = None
+    
+    def merge(self, other: "DocumentFrequencyIndex"):
+        self._document_frequencies.update(other._document_frequencies)
+        self._document_count += other.document_count
+        self._total_word_count += other.total_word_count
+        self._version = None
+    
+    def document_frequency(self, word: str) -> int:
+        return self._document_frequencies.get(word, 0)
+    
+    def save(self, path: str):
+        body = self._serialize_body()
+        header = DOCUMENT_FREQUENCY_HEADER.pack(
+            DOCUMENT_FREQUENCY_MAGIC, DOCUMENT_FREQUENCY_FORMAT_VERSION,
+            self.document_count, self.total_word_count, len(self._document_frequencies),
+            len(body), bytes.fromhex(_calculate_version(body))
+        )
+        
+        temporary_path = path + ".tmp"
+        with open(temporary_path, 'wb') as f:
+            f.write(header)
+            f.write(body)
+        os.replace(temporary_path, path)
+    
+    @classmethod
+    def load(cls, path: str) -> "DocumentFrequencyIndex":
+        with open(path, 'rb') as f:
+            data = f.read()
+        
+        if len(data) < DOCUMENT_FREQUENCY_HEADER.size:
+            raise ValueError(f"{path} is not a LexiMood document frequency index")
+        magic, format_version, document_count, total_word_count, entry_count, body_size, digest = (
+            DOCUMENT_FREQUENCY_HEADER.unpack_from(data, 0)
+        )
+        _validate_header(path, magic, format_version)
+        body = data[DOCUMENT_FREQUENCY_HEADER.size:DOCUMENT_FREQUENCY_HEADER.size + body_size]
+        
+        index = cls()
+        index._document_count = document_count
+        index._total_word_count = total_word_count
+        index._document_frequencies = Counter(_parse_body(path, body, entry_count))
+        index._version = digest.hex()
+        return index
+    
+    def __contains__(self, word: object) -> bool:
+        return word in self._document_frequencies
+    
+    def __len__(self) -> int:
+        return len(self._document_frequencies)
+    
+    def _serialize_body(self) -> bytes:
+        words = sorted(word.encode('utf-8') for word in self._document_frequencies)
+        document_frequencies = array('I', (self._document_frequencies[word.decode('utf-8')] for word in words))
+        offsets, blob = build_string_table(words)
+        return zlib.compress(
+            to_little_endian(document_frequencies).tobytes() + to_little_endian(offsets).tobytes() + blob
+        )
+
+
+class DocumentFrequencySnapshot(DocumentFrequencyWeights):
+    def __init__(
+        self,
+        counters: np.ndarray,
+        document_count: float,
+        total_word_count: float,
+        created_at: float,
+        sketch_positions: Callable[[str], Tuple[int, ...]]
+    ):
+        self.counters = counters
+        self.created_at = created_at
+        self._document_count = document_count
+        self._total_word_count = total_word_count
+        self._flat_counters = counters.reshape(-1)
+        self._sketch_positions = sketch_positions
+    
+    @property
+    def document_count(self) -> float:
+        return self._document_count
+    
+    @property
+    def total_word_count(self) -> float:
+        return self._total_word_count
+    
+    def document_frequency(self, word: str) -> float:
+        flat_counters = self._flat_counters
+        estimate = min(flat_counters[position] for position in self._sketch_positions(word))
+        return min(float(estimate), self.document_count)
+
+
+class OnlineDocumentFrequencies:
+    def __init__(
+        self,
+        width: int = DEFAULT_SKETCH_WIDTH,
+        depth: int = DEFAULT_SKETCH_DEPTH,
+        half_life: Optional[float] = DEFAULT_DOCUMENT_FREQUENCY_HALF_LIFE,
+        snapshot_interval: int = DEFAULT_SNAPSHOT_INTERVAL,
+        clock: Callable[[], float] = time.time
+    ):
+        self._validate_dimensions(width, depth)
+        self._validate_half_life(half_life)
+        self._validate_snapshot_interval(snapshot_interval)
+        self.width = width
+        self.depth = depth
+        self.half_life = half_life
+        self.snapshot_interval = snapshot_interval
+        self._clock = clock
+        self._cached_positions = lru_cache(maxsize=SKETCH_POSITION_CACHE_SIZE)(self._compute_positions)
+        self._counters = np.zeros((depth, width), dtype=np.float64)
+        self._document_weight = 0.0
+        self._word_weight = 0.0
+        self._origin = clock()
+        self._updates_since_snapshot = 0
+        self._lock = threading.Lock()
+        self._snapshot = self._create_snapshot(self._origin)
+    
+    @property
+    def memory_size(self) -> int:
+        return self._counters.nbytes + self._snapshot.counters.nbytes
+    
+    def add_document(self, words: Iterable[str]):
+        self.add_word_counts(Counter(words))
+    
+    def add_word_counts(self, word_counts: Mapping[str, int]):
+        flat_positions = self._flat_positions(word_counts)
+        word_count = sum(word_counts.values())
+        
+        with self._lock:
+            increment = self._current_increment(self._clock())
+            self._counters.reshape(-1)[flat_positions] += increment
+            self._document_weight += increment
+            self._word_weight += word_count * increment
+            self._updates_since_snapshot += 1
+    
+    def snapshot(self) -> DocumentFrequencySnapshot:
+        if self._updates_since_snapshot < self.snapshot_interval:
+            return self._snapshot
+        
+        with self._lock:
+            if self._updates_since_snapshot >= self.snapshot_interval:
+                self._publish_snapshot()
+            return self._snapshot
+    
+    def publish(self) -> DocumentFrequencySnapshot:
+        with self._lock:
+            self._publish_snapshot()
+            return self._snapshot
+    
+    def _publish_snapshot(self):
+        self._snapshot = self._create_snapshot(self._clock())
+        self._updates_since_snapshot = 0
+    
+    def _flat_positions(self, words: Iterable[str]) -> np.ndarray:
+        positions = set()
+        for word in words:
+            positions.update(self._cached_positions(word))
+        return np.fromiter(positions, dtype=np.int64, count=len(positions))
+    
+    def _compute_positions(self, word: str) -> Tuple[int, ...]:
+        digest = hashlib.blake2b(word.encode('utf-8'), digest_size=SKETCH_HASH_SIZE).digest()
+        first_hash = int.from_bytes(digest[:4], 'little')
+        second_hash = int.from_bytes(digest[4:], 'little') | 1
+        return tuple(row * self.width + (first_hash + row * second_hash) % self.width for row in range(self.depth))
+    
+    def _current_increment(self, now: float) -> float:
+        if self.half_life is None:
+            return 1.0
+        
+        increment = 2.0 ** ((now - self._origin) / self.half_life)
+        if increment < SKETCH_RESCALE_LIMIT:
+            return increment
+        
+        self._rescale(increment)
+        self._origin = now
+        return 1.0
+    
+    def _rescale(self, increment: float):
+        self._counters /= increment
+        self._document_weight /= increment
+        self._word_weight /= increment
+    
+    def _create_snapshot(self, now: float) -> DocumentFrequencySnapshot:
+        scale = 1.0 / self._current_increment(now)
+        return DocumentFrequencySnapshot(
+            np.multiply(self._counters, scale, dtype=np.float32),
+            self._document_weight * scale, self._word_weight * scale, now, self._cached_positions
+        )
+    
+    def _validate_dimensions(self, width: int, depth: int):
+        if width < MIN_SKETCH_WIDTH:
+            raise ValueError(f"width must be at least {MIN_SKETCH_WIDTH}")
+        if depth < MIN_SKETCH_DEPTH:
+            raise ValueError(f"depth must be at least {MIN_SKETCH_DEPTH}")
+    
+    def _validate_half_life(self, half_life: Optional[float]):
+        if half_life is None or half_life > 0:
+            return
+        
+        raise ValueError("half_life must be positive")
+    
+    def _validate_snapshot_interval(self, snapshot_interval: int):
+        if snapshot_interval >= MIN_SNAPSHOT_INTERVAL:
+            return
+        
+        raise ValueError(f"snapshot_interval must be at least {MIN_SNAPSHOT_INTERVAL}")
+
+
+def _validate_header(path: str, magic: bytes, format_version: int):
+    if magic != DOCUMENT_FREQUENCY_MAGIC:
+        raise ValueError(f"{path} is not a LexiMood document frequency index")
+    if format_version != DOCUMENT_FREQUENCY_FORMAT_VERSION:
+        raise ValueError(f"Unsupported document frequency index format version: {format_version}")
+
+
+def _parse_body(path: str, body: bytes, entry_count: int) -> Dict[str, int]:
+    try:
+        table = zlib.decompress(body)
+    except zlib.error as e:
+        raise ValueError(f"{path} is corrupted: {e}")
+    
+    offsets_start = entry_count * UINT32_SIZE
+    blob_start = offsets_start + (entry_count + 1) * UINT32_SIZE
+    if len(table) < blob_start:
+        raise ValueError(f"{path} is corrupted: truncated string table")
+    
+    document_frequencies = to_little_endian(array('I', table[:offsets_start]))
+    offsets = to_little_endian(array('I', table[offsets_start:blob_start]))
+    return dict(zip(_split_string_table(table[blob_start:], offsets), document_frequencies))
+
+
+def _split_string_table(blob: bytes, offsets: array) -> List[str]:
+    return [blob[offsets[i]:offsets[i + 1]].decode('utf-8') for i in range(len(offsets) - 1)]
+
+
+def _calculate_version(body: bytes) -> str:
+    return hashlib.blake2b(body, digest_size=DOCUMENT_FREQUENCY_DIGEST_SIZE).hexdigest()
\ No newline at end of file
@@ -0,0 +1,102 @@
+"""
+Bounded-memory corpus keyword counts split by sentiment, based on mergeable Misra-Gries summaries.
+"""
+
+import heapq
+from operator import itemgetter
+from typing import Dict, List, Mapping, NamedTuple, Optional
+from .models import SentimentLabel
+from .constants import DEFAULT_HEAVY_HITTER_CAPACITY, MIN_HEAVY_HITTER_CAPACITY
+
+
+class HeavyHitter(NamedTuple):
+    word: str
+    count: int
+    error: int
+
+
+class MisraGriesSummary:
+    def __init__(self, capacity: int = DEFAULT_HEAVY_HITTER_CAPACITY):
+        self._validate_capacity(capacity)
+        self.capacity = capacity
+        self.total = 0
+        self.error = 0
+        self._counters: Dict[str, int] = {}
+    
+    def add(self, word: str, count: int = 1):
+        self._counters[word] = self._counters.get(word, 0) + count
+        self.total += count
+        self._compact_if_full()
+    
+    def add_counts(self, word_counts: Mapping[str, int]):
+        counters = self._counters
+        for word, count in word_counts.items():
+            counters[word] = counters.get(word, 0) + count
+        self.total += sum(word_counts.values())
+        self._compact_if_full()
+    
+    def merge(self, other: "MisraGriesSummary"):
+        self.add_counts(other._counters)
+        self.total += other.total - sum(other._counters.values())
+        self.error += other.error
+    
+    def estimate(self, word: str) -> int:
+        return self._counters.get(word, 0)
+    
+    def top(self, k: int) -> List[HeavyHitter]:
+        return [
+            HeavyHitter(word, count, self.error)
+            for word, count in heapq.nlargest(k, self._counters.items(), key=itemgetter(1))
+        ]
+    
+    def compact(self):
+        if len(self._counters) <= self.capacity:
+            return
+        
+        threshold = heapq.nlargest(self.capacity + 1, self._counters.values())[-1]
+        self._counters = {word: count - threshold for word, count in self._counters.items() if count > threshold}
+        self.error += threshold
+    
+    def __len__(self) -> int:
+        return len(self._counters)
+    
+    def _compact_if_full(self):
+        if len(self._counters) > 2 * self.capacity:
+            self.compact()
+    
+    def _validate_capacity(self, capacity: int):
+        if capacity >= MIN_HEAVY_HITTER_CAPACITY:
+            return
+        
+        raise ValueError(f"capacity must be at least {MIN_HEAVY_HITTER_CAPACITY}")
+
+
+class KeywordAggregator:
+    def __init__(self, capacity: int = DEFAULT_HEAVY_HITTER_CAPACITY):
+        self.capacity = capacity
+        self.document_counts: Dict[SentimentLabel, int] = {label: 0 for label in SentimentLabel}
+        self._summaries = {label: MisraGriesSummary(capacity) for label in SentimentLabel}
+    
+    def add(self, sentiment: SentimentLabel, word_counts: Mapping[str, int]):
+        self._summaries[sentiment].add_counts(word_counts)
+        self.document_counts[sentiment] += 1
+    
+    def merge(self, other: "KeywordAggregator"):
+        for label in SentimentLabel:
+            self._summaries[label].merge(other._summaries[label])
+            self.document_counts[label] += other.document_counts[label]
+    
+    def summary(self, sentiment: SentimentLabel) -> MisraGriesSummary:
+        return self._summaries[sentiment]
+    
+    def top(self, k: int, sentiment: Optional[SentimentLabel] = None) -> List[HeavyHitter]:
+        if sentiment is not None:
+            return self._summaries[sentiment].top(k)
+        
+        combined = MisraGriesSummary(self.capacity)
+        for summary in self._summaries.values():
+            combined.merge(summary)
+        return combined.top(k)
+    
+    def top_by_sentiment(self, k: int) -> Dict[SentimentLabel, List[HeavyHitter]]:
+        return {label: summary.top(k) for label, summary in self._summaries.items()}
\ No newline at end of file
@@ -2,108 +2,170 @@
 Keyword extraction module for Persian text.
 """
 
-import re
-import json
-import os
-from typing import List, Dict, Set
+import heapq
+from typing import List, Dict, FrozenSet, Iterable, Iterator, Mapping, Optional, Tuple
 from collections import Counter
+from operator import itemgetter
 from .constants import (
     PERSIAN_STOP_WORDS, MIN_WORD_LENGTH_FOR_KEYWORD_EXTRACTION,
-    MAX_WORD_LENGTH_FOR_NORMALIZATION, FREQUENCY_BOOST_FACTOR
+    MAX_WORD_LENGTH_FOR_NORMALIZATION, FREQUENCY_BOOST_FACTOR,
+    BM25_TERM_SATURATION, BM25_LENGTH_NORMALIZATION, SENTIMENT_KEYWORD_BOOST_FACTOR
 )
+from .config import KeywordWeighting
+from .document_frequency import DocumentFrequencyIndex, DocumentFrequencyWeights, OnlineDocumentFrequencies
+from .resources import ResourceRegistry, get_resource_registry
+from .models import TokenizedDocument
+from .patterns import WORD_PATTERN
 
 
 class KeywordExtractor:
-    def __init__(self):
-        self.sentiment_words = self._load_sentiment_words()
-        self.stop_words = PERSIAN_STOP_WORDS
+    def __init__(
+        self,
+        registry: Optional[ResourceRegistry] = None,
+        document_frequency_index: Optional[DocumentFrequencyIndex] = None,
+        weighting: KeywordWeighting = KeywordWeighting.TF_IDF,
+        online_document_frequencies: Optional[OnlineDocumentFrequencies] = None
+    ):
+        self._registry = registry or get_resource_registry()
+        self._lexicon_store = self._registry.lexicon_store()
+        self._stop_words = frozenset(PERSIAN_STOP_WORDS)
+        self._document_frequency_index = document_frequency_index
+        self._weighting = weighting
+        self._online_document_frequencies = online_document_frequencies
+    
+    @property
+    def stop_words(self) -> FrozenSet[str]:
+        return self._stop_words
+    
+    @property
+    def document_frequency_index(self) -> Optional[DocumentFrequencyIndex]:
+        return self._document_frequency_index
+    
+    @property
+    def weighting(self) -> KeywordWeighting:
+        return self._weighting
+    
+    @property
+    def online_document_frequencies(self) -> Optional[OnlineDocumentFrequencies]:
+        return self._online_document_frequencies
+    
+    @property
+    def sentiment_words(self) -> FrozenSet[str]:
+        return self._load_sentiment_words()
     
     def extract(self, text: str, max_keywords: int = 5) -> List[str]:
         if not self._is_valid_text(text):
             return []
         
-        words = self._tokenize_text(text)
-        if not words:
+        return self.extract_from_document(TokenizedDocument.from_text(text), max_keywords)
+    
+    def extract_from_document(self, document: TokenizedDocument, max_keywords: int = 5) -> List[str]:
+        return self.extract_from_counts(self.count_words(document.lowered_tokens), max_keywords)
+    
+    def count_words(self, lowered_tokens: Iterable[str], word_counts: Optional[Counter] = None) -> Counter:
+        if word_counts is None:
+            word_counts = Counter()
+        word_counts.update(self._filter_valid_words(lowered_tokens))
+        return word_counts
+    
+    def remove_stop_words(self, word_counts: Mapping[str, int]) -> Dict[str, int]:
+        return {word: count for word, count in word_counts.items() if not self._should_skip_word(word)}
+    
+    def index_document(self, document: TokenizedDocument, index: DocumentFrequencyIndex):
+        index.add_document(self._filter_valid_words(document.lowered_tokens))
+    
+    def extract_from_counts(self, word_counts: Counter, max_keywords: int = 5) -> List[str]:
+        if not word_counts:
             return []
+        if self._online_document_frequencies is not None:
+            self._online_document_frequencies.add_word_counts(word_counts)
         
-        tf_idf_scores = self._calculate_tf_idf_scores(words)
-        filtered_scores = self._filter_keywords_by_sentiment(tf_idf_scores)
-        keywords = self._get_top_keywords(filtered_scores, max_keywords)
-        
-        return keywords
+        scored_words = self._score_keywords(word_counts, sum(word_counts.values()))
+        return self._select_top_keywords(scored_words, len(word_counts), max_keywords)
     
     def _is_valid_text(self, text: str) -> bool:
         return text and text.strip()
     
-    def _calculate_tf_idf_scores(self, words: List[str]) -> Dict[str, float]:
-        if not words:
-            return {}
-        
-        word_counts = Counter(words)
-        total_words = len(words)
+    def _score_keywords(self, word_counts: Mapping[str, int], total_words: int) -> Iterator[Tuple[str, float]]:
+        document_frequencies = self._get_document_frequencies()
+        if document_frequencies is None:
+            return self._score_by_approximation(word_counts, total_words)
+        if self._weighting == KeywordWeighting.BM25:
+            return self._score_by_bm25(document_frequencies, word_counts, total_words)
         
-        tf_scores = self._calculate_term_frequency_scores(word_counts, total_words)
-        tf_idf_scores = self._calculate_tf_idf_approximation(tf_scores)
-        
-        return tf_idf_scores
+        return self._score_by_corpus_tf_idf(document_frequencies, word_counts, total_words)
     
-    def _calculate_term_frequency_scores(self, word_counts: Counter, total_words: int) -> Dict[str, float]:
-        tf_scores = {}
-        for word, count in word_counts.items():
-            if self._should_skip_word(word):
-                continue
-            tf_scores[word] = count / total_words
-        return tf_scores
+    def _get_document_frequencies(self) -> Optional[DocumentFrequencyWeights]:
+        if self._online_document_frequencies is not None:
+            return self._online_document_frequencies.snapshot()
+        return self._document_frequency_index
     
     def _should_skip_word(self, word: str) -> bool:
-        return word in self.stop_words or len(word) < MIN_WORD_LENGTH_FOR_KEYWORD_EXTRACTION
+        return word in self._stop_words or len(word) < MIN_WORD_LENGTH_FOR_KEYWORD_EXTRACTION
     
-    def _calculate_tf_idf_approximation(self, tf_scores: Dict[str, float]) -> Dict[str, float]:
-        tf_idf_scores = {}
-        for word, tf_score in tf_scores.items():
+    def _score_by_approximation(self, word_counts: Mapping[str, int], total_words: int) -> Iterator[Tuple[str, float]]:
+        stop_words = self._stop_words
+        sentiment_words = self.sentiment_words
+        
+        for word, count in word_counts.items():
+            if word in stop_words or len(word) < MIN_WORD_LENGTH_FOR_KEYWORD_EXTRACTION:
+                continue
+            tf_score = count / total_words
             word_length_factor = min(len(word) / MAX_WORD_LENGTH_FOR_NORMALIZATION, 1.0)
             frequency_factor = 1.0 / (1.0 + tf_score * FREQUENCY_BOOST_FACTOR)
-            tf_idf_scores[word] = tf_score * word_length_factor * frequency_factor
-        return tf_idf_scores
+            score = tf_score * word_length_factor * frequency_factor
+            yield word, score * SENTIMENT_KEYWORD_BOOST_FACTOR if word in sentiment_words else score
     
-    def _filter_keywords_by_sentiment(self, tf_idf_scores: Dict[str, float]) -> Dict[str, float]:
-        sentiment_boost_factor = 2.0
-        filtered_scores = {}
+    def _score_by_corpus_tf_idf(
+        self, index: DocumentFrequencyWeights, word_counts: Mapping[str, int], total_words: int
+    ) -> Iterator[Tuple[str, float]]:
+        stop_words = self._stop_words
+        sentiment_words = self.sentiment_words
         
-        for word, score in tf_idf_scores.items():
-            if word in self.sentiment_words:
-                filtered_scores[word] = score * sentiment_boost_factor
-            else:
-                filtered_scores[word] = score
+        for word, count in word_counts.items():
+            if word in stop_words or len(word) < MIN_WORD_LENGTH_FOR_KEYWORD_EXTRACTION:
+                continue
+            score = count / total_words * index.idf(word)
+            yield word, score * SENTIMENT_KEYWORD_BOOST_FACTOR if word in sentiment_words else score
+    
+    def _score_by_bm25(
+        self, index: DocumentFrequencyWeights, word_counts: Mapping[str, int], total_words: int
+    ) -> Iterator[Tuple[str, float]]:
+        stop_words = self._stop_words
+        sentiment_words = self.sentiment_words
+        length_penalty = self._calculate_bm25_length_penalty(total_words, index.average_document_length)
         
-        return filtered_scores
-    
-    def _load_sentiment_words(self) -> Set[str]:
-        try:
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            lexicon_path = os.path.join(current_dir, "data", "persian_sentiment_lexicon.json")
-            
-            with open(lexicon_path, 'r', encoding='utf-8') as f:
-                lexicon_data = json.load(f)
-            
-            sentiment_words = set()
-            sentiment_words.update(lexicon_data.get("positive_words", {}).keys())
-            sentiment_words.update(lexicon_data.get("negative_words", {}).keys())
-            
-            return sentiment_words
-        except (FileNotFoundError, json.JSONDecodeError, KeyError):
-            return set()
+        for word, count in word_counts.items():
+            if word in stop_words or len(word) < MIN_WORD_LENGTH_FOR_KEYWORD_EXTRACTION:
+                continue
+            saturation = count * (BM25_TERM_SATURATION + 1.0) / (count + length_penalty)
+            score = index.bm25_idf(word) * saturation
+            yield word, score * SENTIMENT_KEYWORD_BOOST_FACTOR if word in sentiment_words else score
+    
+    def _calculate_bm25_length_penalty(self, total_words: int, average_document_length: float) -> float:
+        length_ratio = total_words / average_document_length if average_document_length else 1.0
+        return BM25_TERM_SATURATION * (1.0 - BM25_LENGTH_NORMALIZATION + BM25_LENGTH_NORMALIZATION * length_ratio)
+    
+    def _load_sentiment_words(self) -> FrozenSet[str]:
+        return self._lexicon_store.sentiment_words
     
     def _tokenize_text(self, text: str) -> List[str]:
-        words = re.findall(r'\b\w+\b', text.lower())
+        return self._filter_valid_words(WORD_PATTERN.findall(text.lower()))
+    
+    def _filter_valid_words(self, words: Iterable[str]) -> List[str]:
         return [word for word in words if self._is_valid_word(word)]
     
     def _is_valid_word(self, word: str) -> bool:
         return len(word) >= MIN_WORD_LENGTH_FOR_KEYWORD_EXTRACTION and not word.isdigit()
     
     def _get_top_keywords(self, scores: Dict[str, float], max_keywords: int) -> List[str]:
-        if not scores:
-            return []
-        
-        sorted_words = sorted(scores.items(), key=lambda x: x[1], reverse=True)
-        return [word for word, score in sorted_words[:max_keywords]] 
\ No newline at end of file
+        return self._select_top_keywords(scores.items(), len(scores), max_keywords)
+    
+    def _select_top_keywords(
+        self, scored_words: Iterable[Tuple[str, float]], candidate_count: int, max_keywords: int
+    ) -> List[str]:
+        if candidate_count <= max_keywords:
+            ranked_words = sorted(scored_words, key=itemgetter(1), reverse=True)
+        else:
+            ranked_words = heapq.nlargest(max_keywords, scored_words, key=itemgetter(1))
+        return [word for word, score in ranked_words]
\ No newline at end of file
@@ -0,0 +1,297 @@
+"""
+Sentiment lexicon storage shared by the sentiment and keyword components.
+
+Besides the JSON source, a lexicon can be compiled into a binary artifact that is
+memory-mapped at runtime:
+
+    python -m leximood.lexicon compile [--input LEXICON.json] [--output LEXICON.lxm]
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import threading
+import zlib
+from array import array
+from collections.abc import Mapping
+from typing import Dict, FrozenSet, Iterator, List, Optional, Union
+from .binary_tables import UINT32_SIZE, build_string_table, to_little_endian
+from .constants import DATA_DIRECTORY, SENTIMENT_LEXICON_FILENAME, COMPILED_LEXICON_EXTENSION
+
+COMPILED_LEXICON_MAGIC = b"LXMDLEX\x00"
+COMPILED_LEXICON_FORMAT_VERSION = 2
+COMPILED_LEXICON_HEADER = struct.Struct("<8sIIII16s")
+LEXICON_DIGEST_SIZE = 16
+FLOAT64_SIZE = 8
+EMPTY_SLOT = 0
+
+
+class CompiledLexicon(Mapping):
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._read_layout()
+    
+    @property
+    def version(self) -> str:
+        return self._version
+    
+    def get(self, word: str, default: Optional[float] = None) -> Optional[float]:
+        entry_index = self._find_entry(word.encode('utf-8'))
+        if entry_index < 0:
+            return default
+        return self._scores[entry_index]
+    
+    def __getitem__(self, word: str) -> float:
+        entry_index = self._find_entry(word.encode('utf-8'))
+        if entry_index < 0:
+            raise KeyError(word)
+        return self._scores[entry_index]
+    
+    def __contains__(self, word: object) -> bool:
+        return isinstance(word, str) and self._find_entry(word.encode('utf-8')) >= 0
+    
+    def __iter__(self) -> Iterator[str]:
+        for entry_index in range(self._entry_count):
+            yield self._read_word(entry_index)
+    
+    def __len__(self) -> int:
+        return self._entry_count
+    
+    def close(self):
+        self._offsets.release()
+        self._scores.release()
+        self._slots.release()
+        self._buffer.close()
+    
+    def _read_layout(self):
+        magic, format_version, entry_count, slot_count, blob_size, digest = (
+            COMPILED_LEXICON_HEADER.unpack_from(self._buffer, 0)
+        )
+        self._validate_header(magic, format_version)
+        
+        view = memoryview(self._buffer)
+        scores_start = COMPILED_LEXICON_HEADER.size
+        slots_start = scores_start + entry_count * FLOAT64_SIZE
+        offsets_start = slots_start + slot_count * UINT32_SIZE
+        self._blob_start = offsets_start + (entry_count + 1) * UINT32_SIZE
+        
+        self._scores = view[scores_start:slots_start].cast('d')
+        self._slots = view[slots_start:offsets_start].cast('I')
+        self._offsets = view[offsets_start:self._blob_start].cast('I')
+        self._entry_count = entry_count
+        self._slot_mask = slot_count - 1
+        self._version = digest.hex()
+        view.release()
+    
+    def _validate_header(self, magic: bytes, format_version: int):
+        if magic != COMPILED_LEXICON_MAGIC:
+            raise ValueError(f"{self.path} is not a compiled LexiMood lexicon")
+        if format_version != COMPILED_LEXICON_FORMAT_VERSION:
+            raise ValueError(f"Unsupported compiled lexicon format version: {format_version}")
+        if sys.byteorder != 'little':
+            raise ValueError("Compiled lexicons require a little-endian platform")
+    
+    def _find_entry(self, encoded_word: bytes) -> int:
+        slot = zlib.crc32(encoded_word) & self._slot_mask
+        while True:
+            entry = self._slots[slot]
+            if entry == EMPTY_SLOT:
+                return -1
+            if self._entry_equals(entry - 1, encoded_word):
+                return entry - 1
+            slot = (slot + 1) & self._slot_mask
+    
+    def _entry_equals(self, entry_index: int, encoded_word: bytes) -> bool:
+        start = self._offsets[entry_index]
+        end = self._offsets[entry_index + 1]
+        if end - start != len(encoded_word):
+            return False
+        return self._buffer[self._blob_start + start:self._blob_start + end] == encoded_word
+    
+    def _read_word(self, entry_index: int) -> str:
+        start = self._blob_start + self._offsets[entry_index]
+        end = self._blob_start + self._offsets[entry_index + 1]
+        return self._buffer[start:end].decode('utf-8')
+
+
+class LexiconStore:
+    def __init__(self, path: str):
+        self.path = path
+        self.compiled_path = get_compiled_lexicon_path(path)
+        self._scores: Optional[Mapping] = None
+        self._sentiment_words: Optional[Union[FrozenSet[str], CompiledLexicon]] = None
+        self._version: Optional[str] = None
+        self._lock = threading.Lock()
+    
+    @property
+    def scores(self) -> Mapping:
+        self.load()
+        return self._scores
+    
+    @property
+    def sentiment_words(self) -> Union[FrozenSet[str], CompiledLexicon]:
+        self.load()
+        return self._sentiment_words
+    
+    @property
+    def version(self) -> str:
+        self.load()
+        return self._version
+    
+    def load(self):
+        if self._scores is not None:
+            return
+        
+        with self._lock:
+            if self._scores is None:
+                self._load_scores()
+    
+    def score(self, word: str) -> float:
+        return self.scores.get(word, 0.0)
+    
+    def as_lexicon_dict(self) -> Dict[str, Dict[str, float]]:
+        return {
+            "positive_words": {word: score for word, score in self.scores.items() if score > 0},
+            "negative_words": {word: score for word, score in self.scores.items() if score < 0}
+        }
+    
+    def __contains__(self, word: str) -> bool:
+        return word in self.sentiment_words
+    
+    def __len__(self) -> int:
+        return len(self.scores)
+    
+    def _load_scores(self):
+        if self._has_current_compiled_lexicon():
+            self._load_compiled_scores()
+            return
+        
+        self._load_json_scores()
+    
+    def _has_current_compiled_lexicon(self) -> bool:
+        if not os.path.exists(self.compiled_path):
+            return False
+        if not os.path.exists(self.path):
+            return True
+        return os.path.getmtime(self.compiled_path) >= os.path.getmtime(self.path)
+    
+    def _load_compiled_scores(self):
+        compiled_lexicon = CompiledLexicon(self.compiled_path)
+        self._sentiment_words = compiled_lexicon
+        self._version = compiled_lexicon.version
+        self._scores = compiled_lexicon
+    
+    def _load_json_scores(self):
+        lexicon_bytes = self._read_lexicon_bytes()
+        lexicon_data = self._parse_lexicon(lexicon_bytes)
+        scores = merge_lexicon_scores(lexicon_data)
+        
+        self._sentiment_words = frozenset(scores)
+        self._version = calculate_lexicon_version(lexicon_bytes)
+        self._scores = scores
+    
+    def _read_lexicon_bytes(self) -> bytes:
+        try:
+            with open(self.path, 'rb') as f:
+                return f.read()
+        except FileNotFoundError as e:
+            print(f"Warning: Could not load sentiment lexicon: {e}", file=sys.stderr)
+            return b""
+    
+    def _parse_lexicon(self, lexicon_bytes: bytes) -> Dict[str, Dict[str, float]]:
+        if not lexicon_bytes:
+            return {}
+        
+        try:
+            return json.loads(lexicon_bytes.decode('utf-8'))
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            print(f"Warning: Could not load sentiment lexicon: {e}", file=sys.stderr)
+            return {}
+
+
+def merge_lexicon_scores(lexicon_data: Dict[str, Dict[str, float]]) -> Dict[str, float]:
+    scores = dict(lexicon_data.get("negative_words", {}))
+    scores.update(lexicon_data.get("positive_words", {}))
+    return scores
+
+
+def calculate_lexicon_version(lexicon_bytes: bytes) -> str:
+    return hashlib.blake2b(lexicon_bytes, digest_size=LEXICON_DIGEST_SIZE).hexdigest()
+
+
+def get_compiled_lexicon_path(source_path: str) -> str:
+    return os.path.splitext(source_path)[0] + COMPILED_LEXICON_EXTENSION
+
+
+def compile_lexicon(source_path: str, output_path: Optional[str] = None) -> int:
+    with open(source_path, 'rb') as f:
+        lexicon_bytes = f.read()
+    
+    scores = merge_lexicon_scores(json.loads(lexicon_bytes.decode('utf-8')))
+    digest = bytes.fromhex(calculate_lexicon_version(lexicon_bytes))
+    words = sorted(word.encode('utf-8') for word in scores)
+    word_scores = [scores[word.decode('utf-8')] for word in words]
+    
+    output_path = output_path or get_compiled_lexicon_path(source_path)
+    _write_compiled_lexicon(output_path, words, word_scores, digest)
+    return len(words)
+
+
+def _write_compiled_lexicon(output_path: str, words: List[bytes], word_scores: List[float], digest: bytes):
+    slots = _build_hash_slots(words)
+    offsets, blob = build_string_table(words)
+    header = COMPILED_LEXICON_HEADER.pack(
+        COMPILED_LEXICON_MAGIC, COMPILED_LEXICON_FORMAT_VERSION,
+        len(words), len(slots), len(blob), digest
+    )
+    
+    temporary_path = output_path + ".tmp"
+    with open(temporary_path, 'wb') as f:
+        f.write(header)
+        f.write(to_little_endian(array('d', word_scores)).tobytes())
+        f.write(to_little_endian(slots).tobytes())
+        f.write(to_little_endian(offsets).tobytes())
+        f.write(blob)
+    os.replace(temporary_path, output_path)
+
+
+def _build_hash_slots(words: List[bytes]) -> array:
+    slot_count = 1
+    while slot_count < len(words) * 2:
+        slot_count *= 2
+    
+    slot_mask = slot_count - 1
+    slots = array('I', [EMPTY_SLOT]) * slot_count
+    for entry_index, word in enumerate(words):
+        slot = zlib.crc32(word) & slot_mask
+        while slots[slot] != EMPTY_SLOT:
+            slot = (slot + 1) & slot_mask
+        slots[slot] = entry_index + 1
+    return slots
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m leximood.lexicon", description="LexiMood lexicon tools")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    compile_parser = subparsers.add_parser("compile", help="Compile a JSON lexicon into a memory-mappable file")
+    compile_parser.add_argument(
+        "--input", default=os.path.join(DATA_DIRECTORY, SENTIMENT_LEXICON_FILENAME),
+        help="Path of the JSON lexicon to compile"
+    )
+    compile_parser.add_argument("--output", help="Path of the compiled lexicon (defaults to INPUT with .lxm)")
+    
+    args = parser.parse_args(argv)
+    entry_count = compile_lexicon(args.input, args.output)
+    print(f"Compiled {entry_count} entries to {args.output or get_compiled_lexicon_path(args.input)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -2,13 +2,17 @@
 Data models for LexiMood sentiment analysis results.
 """
 
-from dataclasses import dataclass
-from typing import List, Optional
+import sys
+from dataclasses import dataclass, field
+from typing import List, NamedTuple, Optional
 from enum import Enum
 from .constants import (
     SENTIMENT_SCORE_MIN, SENTIMENT_SCORE_MAX,
     CONFIDENCE_MIN, CONFIDENCE_MAX
 )
+from .patterns import WORD_PATTERN, SENTENCE_BOUNDARY_PATTERN
+
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 class SentimentLabel(Enum):
@@ -17,7 +21,89 @@ class SentimentLabel(Enum):
     NEUTRAL = "neutral"
 
 
+class SentenceSpan(NamedTuple):
+    token_start: int
+    token_end: int
+    char_start: int
+    char_end: int
+
+
 @dataclass
+class TokenizedDocument:
+    text: str
+    tokens: List[str]
+    lowered_tokens: List[str]
+    _offsets: Optional[List[int]] = field(default=None, repr=False, compare=False)
+    sentences: Optional[List[SentenceSpan]] = field(default=None, repr=False, compare=False)
+    
+    @classmethod
+    def from_text(cls, text: str) -> "TokenizedDocument":
+        tokens = WORD_PATTERN.findall(text)
+        return cls(text, tokens, cls._lower_tokens(text, tokens))
+    
+    @classmethod
+    def from_text_with_sentences(cls, text: str) -> "TokenizedDocument":
+        tokens = []
+        sentences = []
+        sentence_char_start = 0
+        
+        for boundary in SENTENCE_BOUNDARY_PATTERN.finditer(text):
+            cls._append_sentence(text, tokens, sentences, sentence_char_start, boundary.start(), boundary.end())
+            sentence_char_start = boundary.end()
+        cls._append_sentence(text, tokens, sentences, sentence_char_start, len(text), len(text))
+        
+        return cls(text, tokens, cls._lower_tokens(text, tokens), None, sentences)
+    
+    @staticmethod
+    def _append_sentence(
+        text: str,
+        tokens: List[str],
+        sentences: List[SentenceSpan],
+        char_start: int,
+        content_end: int,
+        char_end: int
+    ):
+        token_start = len(tokens)
+        tokens.extend(WORD_PATTERN.findall(text, char_start, content_end))
+        if len(tokens) > token_start:
+            sentences.append(SentenceSpan(token_start, len(tokens), char_start, char_end))
+        elif sentences:
+            sentences[-1] = sentences[-1]._replace(char_end=char_end)
+    
+    @staticmethod
+    def _lower_tokens(text: str, tokens: List[str]) -> List[str]:
+        if text.lower() == text:
+            return tokens
+        return [token.lower() for token in tokens]
+    
+    @property
+    def offsets(self) -> List[int]:
+        if self._offsets is None:
+            self._offsets = [match.start() for match in WORD_PATTERN.finditer(self.text)]
+        return self._offsets
+    
+    def sentence_text(self, sentence: SentenceSpan) -> str:
+        return self.text[sentence.char_start:sentence.char_end].strip()
+    
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class SentenceResult:
+    text: str
+    sentiment: SentimentLabel
+    score: float
+    
+    def to_dict(self) -> dict:
+        return {
+            "text": self.text,
+            "sentiment": self.sentiment.value,
+            "score": self.score
+        }
+
+
+@dataclass(**DATACLASS_SLOTS)
 class AnalysisResult:
     sentiment: SentimentLabel
     score: float
@@ -25,11 +111,33 @@ class AnalysisResult:
     confidence: float
     text: str
     analysis_level: str
+    sentences: List[SentenceResult] = field(default_factory=list)
     
     def __post_init__(self):
         self._validate_score()
         self._validate_confidence()
     
+    @classmethod
+    def from_trusted_values(
+        cls,
+        sentiment: SentimentLabel,
+        score: float,
+        keywords: List[str],
+        confidence: float,
+        text: str,
+        analysis_level: str,
+        sentences: List[SentenceResult]
+    ) -> "AnalysisResult":
+        result = cls.__new__(cls)
+        result.sentiment = sentiment
+        result.score = score
+        result.keywords = keywords
+        result.confidence = confidence
+        result.text = text
+        result.analysis_level = analysis_level
+        result.sentences = sentences
+        return result
+    
     def _validate_score(self):
         if SENTIMENT_SCORE_MIN <= self.score <= SENTIMENT_SCORE_MAX:
             return
@@ -43,7 +151,7 @@ class AnalysisResult:
         raise ValueError(f"confidence must be between {CONFIDENCE_MIN} and {CONFIDENCE_MAX}")
     
     def to_dict(self) -> dict:
-        return {
+        result_dict = {
             "sentiment": self.sentiment.value,
             "score": self.score,
             "keywords": self.keywords,
@@ -51,6 +159,9 @@ class AnalysisResult:
             "text": self.text,
             "analysis_level": self.analysis_level
         }
+        if self.sentences:
+            result_dict["sentences"] = [sentence.to_dict() for sentence in self.sentences]
+        return result_dict
     
     def __str__(self) -> str:
-        return f"AnalysisResult(sentiment={self.sentiment.value}, score={self.score:.3f}, confidence={self.confidence:.3f})" 
\ No newline at end of file
+        return f"AnalysisResult(sentiment={self.sentiment.value}, score={self.score:.3f}, confidence={self.confidence:.3f})"
\ No newline at end of file
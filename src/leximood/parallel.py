@@ -0,0 +1,163 @@
+"""
+Multi-process analysis module for spreading LexiMood work across CPU cores.
+"""
+
+import multiprocessing
+import os
+from collections import deque
+from itertools import islice
+from multiprocessing.pool import AsyncResult
+from typing import Iterable, Iterator, List, Optional, Tuple
+from .analyzer import Analyzer
+from .batch import BatchResult, BatchResultBuilder
+from .config import AnalysisConfig
+from .heavy_hitters import KeywordAggregator
+from .models import AnalysisResult
+from .constants import (
+    DEFAULT_PARALLEL_CHUNK_SIZE, MIN_PARALLEL_WORKERS, MIN_BATCH_SIZE,
+    MAX_PENDING_CHUNKS_PER_WORKER
+)
+
+FORK_START_METHOD = "fork"
+
+_worker_analyzer = None
+
+
+def _initialize_worker(analyzer: Optional[Analyzer], config: Optional[AnalysisConfig]):
+    global _worker_analyzer
+    _worker_analyzer = analyzer if analyzer is not None else Analyzer(config)
+
+
+def _analyze_chunk(chunk: List[str]) -> List[AnalysisResult]:
+    return _worker_analyzer.analyze_texts(chunk, len(chunk))
+
+
+def _analyze_and_aggregate_chunk(chunk: List[str], capacity: int) -> Tuple[List[AnalysisResult], KeywordAggregator]:
+    keyword_aggregator = KeywordAggregator(capacity)
+    return _worker_analyzer.analyze_texts(chunk, len(chunk), keyword_aggregator), keyword_aggregator
+
+
+class ParallelAnalyzer:
+    def __init__(
+        self,
+        config: Optional[AnalysisConfig] = None,
+        workers: Optional[int] = None,
+        chunk_size: int = DEFAULT_PARALLEL_CHUNK_SIZE
+    ):
+        self.analyzer = Analyzer(config)
+        self.workers = workers or os.cpu_count() or MIN_PARALLEL_WORKERS
+        self.chunk_size = chunk_size
+        self._pool = None
+        self._validate_workers()
+        self._validate_chunk_size()
+    
+    def __enter__(self) -> "ParallelAnalyzer":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def analyze_many(
+        self, texts: Iterable[str], keyword_aggregator: Optional[KeywordAggregator] = None
+    ) -> List[AnalysisResult]:
+        return list(self.iter_analyze(texts, keyword_aggregator))
+    
+    def analyze_batch(
+        self,
+        texts: Iterable[str],
+        include_texts: bool = False,
+        keyword_aggregator: Optional[KeywordAggregator] = None
+    ) -> BatchResult:
+        builder = BatchResultBuilder(self.analyzer.analysis_level, include_texts)
+        builder.extend(self.iter_analyze(texts, keyword_aggregator))
+        return builder.build()
+    
+    def iter_analyze(
+        self, texts: Iterable[str], keyword_aggregator: Optional[KeywordAggregator] = None
+    ) -> Iterator[AnalysisResult]:
+        if self.workers == MIN_PARALLEL_WORKERS:
+            yield from self.analyzer.iter_analyze_texts(texts, self.chunk_size, keyword_aggregator)
+            return
+        
+        yield from self._iter_pool_results(texts, keyword_aggregator)
+    
+    def close(self):
+        if self._pool is None:
+            return
+        
+        self._pool.close()
+        self._pool.join()
+        self._pool = None
+    
+    def _validate_workers(self):
+        if self.workers >= MIN_PARALLEL_WORKERS:
+            return
+        
+        raise ValueError(f"workers must be at least {MIN_PARALLEL_WORKERS}")
+    
+    def _validate_chunk_size(self):
+        if self.chunk_size >= MIN_BATCH_SIZE:
+            return
+        
+        raise ValueError(f"chunk_size must be at least {MIN_BATCH_SIZE}")
+    
+    def _iter_pool_results(
+        self, texts: Iterable[str], keyword_aggregator: Optional[KeywordAggregator]
+    ) -> Iterator[AnalysisResult]:
+        pool = self._get_pool()
+        max_pending_chunks = self.workers * MAX_PENDING_CHUNKS_PER_WORKER
+        pending_chunks = deque()
+        
+        for chunk in self._split_into_chunks(texts):
+            pending_chunks.append(self._submit_chunk(pool, chunk, keyword_aggregator))
+            if len(pending_chunks) >= max_pending_chunks:
+                yield from self._collect_chunk(pending_chunks.popleft(), keyword_aggregator)
+        
+        while pending_chunks:
+            yield from self._collect_chunk(pending_chunks.popleft(), keyword_aggregator)
+    
+    def _submit_chunk(self, pool, chunk: List[str], keyword_aggregator: Optional[KeywordAggregator]) -> AsyncResult:
+        if keyword_aggregator is None:
+            return pool.apply_async(_analyze_chunk, (chunk,))
+        return pool.apply_async(_analyze_and_aggregate_chunk, (chunk, keyword_aggregator.capacity))
+    
+    def _collect_chunk(
+        self, pending_chunk: AsyncResult, keyword_aggregator: Optional[KeywordAggregator]
+    ) -> List[AnalysisResult]:
+        if keyword_aggregator is None:
+            return pending_chunk.get()
+        
+        results, chunk_aggregator = pending_chunk.get()
+        keyword_aggregator.merge(chunk_aggregator)
+        return results
+    
+    def _split_into_chunks(self, texts: Iterable[str]) -> Iterator[List[str]]:
+        iterator = iter(texts)
+        chunk = list(islice(iterator, self.chunk_size))
+        while chunk:
+            yield chunk
+            chunk = list(islice(iterator, self.chunk_size))
+    
+    def _get_pool(self):
+        if self._pool is None:
+            self._pool = self._create_pool()
+        return self._pool
+    
+    def _create_pool(self):
+        self.analyzer.registry.preload()
+        if FORK_START_METHOD in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context(FORK_START_METHOD)
+            return context.Pool(self.workers, _initialize_worker, (self.analyzer, None))
+        
+        return multiprocessing.Pool(self.workers, _initialize_worker, (None, self.analyzer.config))
+
+
+def analyze_many(
+    texts: Iterable[str],
+    config: Optional[AnalysisConfig] = None,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_PARALLEL_CHUNK_SIZE,
+    keyword_aggregator: Optional[KeywordAggregator] = None
+) -> List[AnalysisResult]:
+    with ParallelAnalyzer(config, workers, chunk_size) as parallel_analyzer:
+        return parallel_analyzer.analyze_many(texts, keyword_aggregator)
\ No newline at end of file
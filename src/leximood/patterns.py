@@ -0,0 +1,25 @@
+"""
+Pre-compiled regular expressions shared by the LexiMood text processing modules.
+"""
+
+import re
+from .constants import (
+    SINGLE_SPACE, EMPTY_STRING, SENTENCE_TERMINATORS,
+    PERSIAN_COMMA, PERSIAN_SEMICOLON, PERSIAN_QUESTION_MARK,
+    EXCLAMATION_MARK, PERIOD, COLON
+)
+
+PUNCTUATION_SPACING_MARKS = [PERSIAN_COMMA, PERSIAN_SEMICOLON, PERSIAN_QUESTION_MARK, EXCLAMATION_MARK, PERIOD, COLON]
+
+WORD_PATTERN = re.compile(r'\b\w+\b')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+SPACE_BEFORE_PUNCTUATION_PATTERN = re.compile(
+    SINGLE_SPACE + '(?=[' + EMPTY_STRING.join(re.escape(mark) for mark in PUNCTUATION_SPACING_MARKS) + '])'
+)
+SENTENCE_SPLIT_PATTERN = re.compile(
+    r'(' + '|'.join(re.escape(terminator) for terminator in sorted(SENTENCE_TERMINATORS)) + r')'
+)
+STREAM_SPLIT_PATTERN = re.compile(r'.*\s(?=\w)', re.DOTALL)
+SENTENCE_BOUNDARY_PATTERN = re.compile(
+    r'[' + EMPTY_STRING.join(re.escape(terminator) for terminator in sorted(SENTENCE_TERMINATORS)) + r']+'
+)
\ No newline at end of file
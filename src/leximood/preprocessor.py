@@ -2,10 +2,8 @@
 Text preprocessing module for Persian text normalization and tokenization.
 """
 
-import re
-import json
-import os
-from typing import List, Dict, Set
+from functools import lru_cache
+from typing import List, Dict, Iterable, Iterator, Set, Optional
 from .constants import (
     SINGLE_SPACE, EMPTY_STRING,
     CONTROL_CHARACTERS_START, CONTROL_CHARACTERS_END,
@@ -16,22 +14,36 @@ from .constants import (
     PERSIAN_COMMA, PERSIAN_SEMICOLON, PERSIAN_QUESTION_MARK,
     EXCLAMATION_MARK, PERIOD, COLON, SENTENCE_TERMINATORS, PERSIAN_STOP_WORDS,
     PERSIAN_SUFFIXES, PERSIAN_PREFIXES, PERSIAN_VERB_SUFFIXES, PERSIAN_VERB_PREFIXES,
-    MIN_WORD_LENGTH_FOR_STEMMING, MIN_WORD_LENGTH_FOR_PROCESSING
+    MIN_WORD_LENGTH_FOR_STEMMING, MIN_WORD_LENGTH_FOR_PROCESSING, STEM_CACHE_SIZE
 )
+from .affixes import AffixTrie
+from .resources import ResourceRegistry, get_resource_registry
+from .models import TokenizedDocument
+from .patterns import (
+    SPACE_BEFORE_PUNCTUATION_PATTERN, SENTENCE_SPLIT_PATTERN, WHITESPACE_PATTERN, STREAM_SPLIT_PATTERN
+)
+
+SUFFIX_TRIE = AffixTrie.for_suffixes(PERSIAN_SUFFIXES)
+PREFIX_TRIE = AffixTrie.for_prefixes(PERSIAN_PREFIXES)
+VERB_SUFFIX_TRIE = AffixTrie.for_suffixes(PERSIAN_VERB_SUFFIXES)
+VERB_PREFIX_TRIE = AffixTrie.for_prefixes(PERSIAN_VERB_PREFIXES)
 
 
 class TextPreprocessor:
-    def __init__(self):
+    def __init__(self, registry: Optional[ResourceRegistry] = None):
+        self._registry = registry or get_resource_registry()
         self._arabic_to_persian_mapping = self._create_arabic_to_persian_mapping()
         self._characters_to_remove = self._create_characters_to_remove_set()
         self._punctuation_marks = self._create_punctuation_marks_set()
+        self._arabic_to_persian_table = str.maketrans(self._arabic_to_persian_mapping)
+        self._control_characters_table = self._create_deletion_table(self._create_control_characters_set())
+        self._text_direction_marks_table = self._create_deletion_table(self._create_text_direction_marks_set())
+        self._normalization_table = self._create_normalization_table()
         self._stop_words = PERSIAN_STOP_WORDS
         self._sentence_terminators = SENTENCE_TERMINATORS
         self._persian_roots = self._load_persian_roots()
-        self._suffixes = PERSIAN_SUFFIXES
-        self._prefixes = PERSIAN_PREFIXES
-        self._verb_suffixes = PERSIAN_VERB_SUFFIXES
-        self._verb_prefixes = PERSIAN_VERB_PREFIXES
+        self._root_index = self._registry.persian_root_index()
+        self._cached_stem = lru_cache(maxsize=STEM_CACHE_SIZE)(self._compute_stem)
     
     def preprocess(self, text: str) -> str:
         if not self._is_valid_text(text):
@@ -42,16 +54,27 @@ class TextPreprocessor:
         if not self._is_valid_text(text):
             return text
         
-        text_copy = str(text)
-        text_copy = self._convert_arabic_to_persian(text_copy)
-        text_copy = self._remove_unwanted_characters(text_copy)
-        text_copy = self._remove_control_characters(text_copy)
-        text_copy = self._remove_text_direction_marks(text_copy)
-        text_copy = self._normalize_whitespace(text_copy)
-        text_copy = self._normalize_punctuation_spacing(text_copy)
-        text_copy = self._final_cleanup(text_copy)
-        
-        return text_copy
+        normalized_text = str(text).translate(self._normalization_table)
+        normalized_text = self._final_cleanup(normalized_text)
+        return self._remove_space_before_punctuation(normalized_text)
+    
+    def normalize_stream(self, chunks: Iterable[str]) -> Iterator[str]:
+        separator = EMPTY_STRING
+        for segment in self._split_translated_stream(chunks):
+            normalized_segment = self._remove_space_before_punctuation(self._final_cleanup(segment))
+            if normalized_segment:
+                yield separator + normalized_segment
+                separator = SINGLE_SPACE
+    
+    def tokenize_document(self, text: str, with_sentences: bool = False) -> TokenizedDocument:
+        if not self._is_valid_text(text):
+            return TokenizedDocument.from_text(EMPTY_STRING)
+        return self.tokenize_preprocessed(self.normalize_text(text), with_sentences)
+    
+    def tokenize_preprocessed(self, preprocessed_text: str, with_sentences: bool = False) -> TokenizedDocument:
+        if with_sentences:
+            return TokenizedDocument.from_text_with_sentences(preprocessed_text)
+        return TokenizedDocument.from_text(preprocessed_text)
     
     def tokenize_text(self, text: str) -> List[str]:
         if not self._is_valid_text(text):
@@ -68,6 +91,10 @@ class TextPreprocessor:
         words = self._split_into_words(sentence)
         return self._remove_stop_words(words)
     
+    @property
+    def root_index(self) -> Dict[str, str]:
+        return self._root_index
+    
     def stem_words(self, words: List[str]) -> List[str]:
         if not words:
             return []
@@ -78,16 +105,7 @@ class TextPreprocessor:
         return text is not None and text.strip() != EMPTY_STRING
     
     def _load_persian_roots(self) -> Dict[str, List[str]]:
-        try:
-            data_dir = os.path.join(os.path.dirname(__file__), 'data')
-            roots_file = os.path.join(data_dir, 'persian_roots.json')
-            
-            if os.path.exists(roots_file):
-                with open(roots_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            return {}
-        except Exception:
-            return {}
+        return self._registry.persian_roots()
     
     def _create_arabic_to_persian_mapping(self) -> Dict[str, str]:
         return {
@@ -122,62 +140,57 @@ class TextPreprocessor:
             EXCLAMATION_MARK, PERIOD, COLON, '(', ')', '[', ']', '{', '}', '"', "'", '«', '»'
         }
     
-    def _convert_arabic_to_persian(self, text: str) -> str:
-        for arabic_char, persian_char in self._arabic_to_persian_mapping.items():
-            text = text.replace(arabic_char, persian_char)
-        return text
+    def _create_control_characters_set(self) -> Set[str]:
+        control_characters = self._create_character_range(CONTROL_CHARACTERS_START, CONTROL_CHARACTERS_END)
+        control_characters |= self._create_character_range(CONTROL_CHARACTERS_MIDDLE_START, CONTROL_CHARACTERS_MIDDLE_END)
+        control_characters |= self._create_character_range(CONTROL_CHARACTERS_LATE_START, CONTROL_CHARACTERS_LATE_END)
+        control_characters |= self._create_character_range(ZERO_WIDTH_START, ZERO_WIDTH_END)
+        return control_characters | {chr(DELETE_CHARACTER), chr(ZERO_WIDTH_NO_BREAK_SPACE)}
+    
+    def _create_text_direction_marks_set(self) -> Set[str]:
+        return {chr(LEFT_TO_RIGHT_MARK), chr(RIGHT_TO_LEFT_MARK)}
+    
+    def _create_character_range(self, first_code_point: int, last_code_point: int) -> Set[str]:
+        return {chr(code_point) for code_point in range(first_code_point, last_code_point + 1)}
+    
+    def _create_deletion_table(self, characters: Set[str]) -> Dict[int, None]:
+        return {ord(char): None for char in characters}
+    
+    def _create_normalization_table(self) -> Dict[int, Optional[str]]:
+        normalization_table = dict(self._arabic_to_persian_table)
+        normalization_table.update(self._create_deletion_table(self._characters_to_remove))
+        normalization_table.update(self._control_characters_table)
+        normalization_table.update(self._text_direction_marks_table)
+        return normalization_table
+    
+    def _split_translated_stream(self, chunks: Iterable[str]) -> Iterator[str]:
+        pending = EMPTY_STRING
+        for chunk in chunks:
+            search_start = max(len(pending) - 1, 0)
+            pending += chunk.translate(self._normalization_table)
+            split_point = STREAM_SPLIT_PATTERN.match(pending, search_start)
+            if split_point is not None:
+                yield pending[:split_point.end()]
+                pending = pending[split_point.end():]
+        yield pending
     
-    def _remove_unwanted_characters(self, text: str) -> str:
-        for char in self._characters_to_remove:
-            text = text.replace(char, EMPTY_STRING)
-        return text
+    def _convert_arabic_to_persian(self, text: str) -> str:
+        return text.translate(self._arabic_to_persian_table)
     
     def _remove_control_characters(self, text: str) -> str:
-        control_char_pattern = self._create_control_character_pattern()
-        text = re.sub(control_char_pattern, EMPTY_STRING, text)
-        
-        zero_width_pattern = self._create_zero_width_pattern()
-        text = re.sub(zero_width_pattern, EMPTY_STRING, text)
-        
-        return text
-    
-    def _create_control_character_pattern(self) -> str:
-        return f'[{chr(CONTROL_CHARACTERS_START)}-{chr(CONTROL_CHARACTERS_END)}{chr(CONTROL_CHARACTERS_MIDDLE_START)}{chr(CONTROL_CHARACTERS_MIDDLE_END)}{chr(CONTROL_CHARACTERS_LATE_START)}-{chr(CONTROL_CHARACTERS_LATE_END)}{chr(DELETE_CHARACTER)}]'
-    
-    def _create_zero_width_pattern(self) -> str:
-        return f'[{chr(ZERO_WIDTH_START)}-{chr(ZERO_WIDTH_END)}{chr(ZERO_WIDTH_NO_BREAK_SPACE)}]'
+        return text.translate(self._control_characters_table)
     
     def _remove_text_direction_marks(self, text: str) -> str:
-        direction_marks_pattern = f'[{chr(LEFT_TO_RIGHT_MARK)}{chr(RIGHT_TO_LEFT_MARK)}]'
-        return re.sub(direction_marks_pattern, EMPTY_STRING, text)
-    
-    def _normalize_whitespace(self, text: str) -> str:
-        return re.sub(r'\s+', SINGLE_SPACE, text)
-    
-    def _normalize_punctuation_spacing(self, text: str) -> str:
-        punctuation_marks = [PERSIAN_COMMA, PERSIAN_SEMICOLON, PERSIAN_QUESTION_MARK, EXCLAMATION_MARK, PERIOD, COLON]
-        
-        for punctuation_mark in punctuation_marks:
-            text = self._remove_space_before_punctuation(text, punctuation_mark)
-            text = self._normalize_space_after_punctuation(text, punctuation_mark)
-        
-        return text
-    
-    def _remove_space_before_punctuation(self, text: str, punctuation_mark: str) -> str:
-        pattern = r'\s+' + re.escape(punctuation_mark)
-        return re.sub(pattern, punctuation_mark, text)
+        return text.translate(self._text_direction_marks_table)
     
-    def _normalize_space_after_punctuation(self, text: str, punctuation_mark: str) -> str:
-        pattern = re.escape(punctuation_mark) + r'\s+'
-        return re.sub(pattern, punctuation_mark + SINGLE_SPACE, text)
+    def _remove_space_before_punctuation(self, text: str) -> str:
+        return SPACE_BEFORE_PUNCTUATION_PATTERN.sub(EMPTY_STRING, text)
     
     def _final_cleanup(self, text: str) -> str:
-        text = text.strip()
-        return re.sub(r'\s+', SINGLE_SPACE, text)
+        return SINGLE_SPACE.join(text.split())
     
     def _split_into_sentences(self, text: str) -> List[str]:
-        sentence_pattern = self._create_sentence_split_pattern()
-        sentences = re.split(sentence_pattern, text)
+        sentences = SENTENCE_SPLIT_PATTERN.split(text)
         return self._reconstruct_sentences(sentences)
     
     def _reconstruct_sentences(self, sentences: List[str]) -> List[str]:
@@ -199,15 +212,11 @@ class TextPreprocessor:
         
         return cleaned_sentences
     
-    def _create_sentence_split_pattern(self) -> str:
-        terminators = [re.escape(term) for term in self._sentence_terminators]
-        return r'(' + '|'.join(terminators) + r')'
-    
     def _clean_sentences(self, sentences: List[str]) -> List[str]:
         return [sentence for sentence in sentences if len(sentence) > MIN_WORD_LENGTH_FOR_PROCESSING]
     
     def _split_into_words(self, sentence: str) -> List[str]:
-        words = re.split(r'\s+', sentence.strip())
+        words = WHITESPACE_PATTERN.split(sentence.strip())
         return [self._clean_word(word) for word in words if word]
     
     def _clean_word(self, word: str) -> str:
@@ -217,6 +226,9 @@ class TextPreprocessor:
         return [word for word in words if word not in self._stop_words]
     
     def _stem_word(self, word: str) -> str:
+        return self._cached_stem(word)
+    
+    def _compute_stem(self, word: str) -> str:
         if len(word) < MIN_WORD_LENGTH_FOR_STEMMING:
             return word
         
@@ -227,10 +239,7 @@ class TextPreprocessor:
         return self._apply_rule_based_stemming(word)
     
     def _lookup_in_dictionary(self, word: str) -> str:
-        for root, inflections in self._persian_roots.items():
-            if word in inflections:
-                return root
-        return EMPTY_STRING
+        return self._root_index.get(word, EMPTY_STRING)
     
     def _apply_rule_based_stemming(self, word: str) -> str:
         original_word = word
@@ -246,37 +255,32 @@ class TextPreprocessor:
         return original_word
     
     def _remove_suffixes(self, word: str) -> str:
-        return self._remove_affixes(word, self._suffixes, self._remove_suffix_from_word)
+        return self._remove_affixes(word, SUFFIX_TRIE, self._remove_suffix_from_word)
     
     def _remove_prefixes(self, word: str) -> str:
-        return self._remove_affixes(word, self._prefixes, self._remove_prefix_from_word)
+        return self._remove_affixes(word, PREFIX_TRIE, self._remove_prefix_from_word)
     
     def _remove_verb_suffixes(self, word: str) -> str:
-        return self._remove_affixes(word, self._verb_suffixes, self._remove_suffix_from_word)
+        return self._remove_affixes(word, VERB_SUFFIX_TRIE, self._remove_suffix_from_word)
     
     def _remove_verb_prefixes(self, word: str) -> str:
-        return self._remove_affixes(word, self._verb_prefixes, self._remove_prefix_from_word)
+        return self._remove_affixes(word, VERB_PREFIX_TRIE, self._remove_prefix_from_word)
     
-    def _remove_affixes(self, word: str, affixes: List[str], removal_function) -> str:
-        for affix in sorted(affixes, key=len, reverse=True):
-            stemmed = removal_function(word, affix)
-            if stemmed != word and self._is_valid_stem(stemmed):
+    def _remove_affixes(self, word: str, affix_trie: AffixTrie, removal_function) -> str:
+        for affix_length in reversed(affix_trie.match_lengths(word)):
+            if len(word) <= affix_length + MIN_WORD_LENGTH_FOR_STEMMING:
+                continue
+            
+            stemmed = removal_function(word, affix_length)
+            if self._is_valid_stem(stemmed):
                 return stemmed
         return word
     
-    def _remove_suffix_from_word(self, word: str, suffix: str) -> str:
-        if word.endswith(suffix) and len(word) > len(suffix) + MIN_WORD_LENGTH_FOR_STEMMING:
-            return word[:-len(suffix)]
-        if word.endswith('\u200c' + suffix) and len(word) > len(suffix) + 1 + MIN_WORD_LENGTH_FOR_STEMMING:
-            return word[:-len(suffix)-1]
-        return word
+    def _remove_suffix_from_word(self, word: str, suffix_length: int) -> str:
+        return word[:-suffix_length]
     
-    def _remove_prefix_from_word(self, word: str, prefix: str) -> str:
-        if word.startswith(prefix) and len(word) > len(prefix) + MIN_WORD_LENGTH_FOR_STEMMING:
-            return word[len(prefix):]
-        if word.startswith(prefix + '\u200c') and len(word) > len(prefix) + 1 + MIN_WORD_LENGTH_FOR_STEMMING:
-            return word[len(prefix)+1:]
-        return word
+    def _remove_prefix_from_word(self, word: str, prefix_length: int) -> str:
+        return word[prefix_length:]
     
     def _is_valid_stem(self, stem: str) -> bool:
         if len(stem) < MIN_WORD_LENGTH_FOR_STEMMING:
@@ -285,4 +289,4 @@ class TextPreprocessor:
         if '\u200c' in stem or '\u200d' in stem:
             return False
         
-        return True 
\ No newline at end of file
+        return True
\ No newline at end of file
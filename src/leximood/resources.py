@@ -0,0 +1,94 @@
+"""
+Process-wide registry of shared, read-only resources used by the analysis components.
+"""
+
+import json
+import os
+import threading
+from functools import partial
+from typing import Any, Callable, Dict, List
+from .lexicon import LexiconStore
+from .document_frequency import DocumentFrequencyIndex
+from .vectorized import VectorizedLexicon
+from .constants import DATA_DIRECTORY, SENTIMENT_LEXICON_FILENAME, PERSIAN_ROOTS_FILENAME
+
+SENTIMENT_LEXICON_RESOURCE = "sentiment_lexicon"
+PERSIAN_ROOTS_RESOURCE = "persian_roots"
+PERSIAN_ROOT_INDEX_RESOURCE = "persian_root_index"
+DOCUMENT_FREQUENCY_INDEX_RESOURCE = "document_frequency_index"
+VECTORIZED_LEXICON_RESOURCE = "vectorized_lexicon"
+MISSING_RESOURCE = object()
+
+
+class ResourceRegistry:
+    def __init__(self, data_directory: str = DATA_DIRECTORY):
+        self.data_directory = data_directory
+        self._resources: Dict[str, Any] = {}
+        self._lock = threading.RLock()
+    
+    def get(self, name: str, loader: Callable[[], Any]) -> Any:
+        resource = self._resources.get(name, MISSING_RESOURCE)
+        if resource is not MISSING_RESOURCE:
+            return resource
+        
+        with self._lock:
+            resource = self._resources.get(name, MISSING_RESOURCE)
+            if resource is MISSING_RESOURCE:
+                resource = loader()
+                self._resources[name] = resource
+            return resource
+    
+    def clear(self):
+        with self._lock:
+            self._resources.clear()
+    
+    def preload(self):
+        self.lexicon_store().load()
+        self.persian_root_index()
+    
+    def lexicon_store(self) -> LexiconStore:
+        return self.get(SENTIMENT_LEXICON_RESOURCE, self._create_lexicon_store)
+    
+    def persian_roots(self) -> Dict[str, List[str]]:
+        return self.get(PERSIAN_ROOTS_RESOURCE, self._load_persian_roots)
+    
+    def persian_root_index(self) -> Dict[str, str]:
+        return self.get(PERSIAN_ROOT_INDEX_RESOURCE, self._build_persian_root_index)
+    
+    def vectorized_lexicon(self) -> VectorizedLexicon:
+        return self.get(VECTORIZED_LEXICON_RESOURCE, self._create_vectorized_lexicon)
+    
+    def document_frequency_index(self, path: str) -> DocumentFrequencyIndex:
+        resource_name = f"{DOCUMENT_FREQUENCY_INDEX_RESOURCE}:{os.path.abspath(path)}"
+        return self.get(resource_name, partial(DocumentFrequencyIndex.load, path))
+    
+    def _create_lexicon_store(self) -> LexiconStore:
+        return LexiconStore(os.path.join(self.data_directory, SENTIMENT_LEXICON_FILENAME))
+    
+    def _create_vectorized_lexicon(self) -> VectorizedLexicon:
+        return VectorizedLexicon(self.lexicon_store().scores)
+    
+    def _load_persian_roots(self) -> Dict[str, List[str]]:
+        try:
+            return self._read_json(PERSIAN_ROOTS_FILENAME)
+        except Exception:
+            return {}
+    
+    def _build_persian_root_index(self) -> Dict[str, str]:
+        root_index = {}
+        for root, inflections in self.persian_roots().items():
+            for inflection in inflections:
+                root_index.setdefault(inflection, root)
+        return root_index
+    
+    def _read_json(self, filename: str) -> Any:
+        path = os.path.join(self.data_directory, filename)
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+
+_default_registry = ResourceRegistry()
+
+
+def get_resource_registry() -> ResourceRegistry:
+    return _default_registry
\ No newline at end of file
@@ -2,74 +2,131 @@
 Sentiment analysis module for Persian text.
 """
 
-import json
-import os
-import re
-from typing import Dict, Any, List
+from itertools import chain, islice
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+import numpy as np
 from .constants import (
     SENTIMENT_POSITIVE_THRESHOLD, SENTIMENT_NEGATIVE_THRESHOLD,
     SENTIMENT_SCORE_MIN, SENTIMENT_SCORE_MAX
 )
+from .resources import ResourceRegistry, get_resource_registry
+from .models import TokenizedDocument
+from .patterns import WORD_PATTERN
+from .vectorized import VectorizedLexicon
 
 
 class  SentimentAnalyzer:
-    def __init__(self):
-        self.lexicon = self._load_sentiment_lexicon()
+    def __init__(self, registry: Optional[ResourceRegistry] = None):
+        self._registry = registry or get_resource_registry()
+        self._lexicon_store = self._registry.lexicon_store()
+    
+    @property
+    def lexicon_scores(self) -> Dict[str, float]:
+        return self._lexicon_store.scores
+    
+    @property
+    def lexicon(self) -> Dict[str, Any]:
+        return self._load_sentiment_lexicon()
     
     def analyze(self, text: str) -> float:
         if not self._is_valid_text(text):
             return 0.0
         
-        words = self._tokenize_text(text)
-        raw_score = self._calculate_sentiment_score(words)
-        normalized_score = self._normalize_score(raw_score)
-        return normalized_score
+        return self.analyze_document(TokenizedDocument.from_text(text))
+    
+    def analyze_document(self, document: TokenizedDocument) -> float:
+        raw_score = self._calculate_lowered_tokens_score(document.lowered_tokens)
+        return self._normalize_score(raw_score)
+    
+    def analyze_document_sentences(self, document: TokenizedDocument) -> Tuple[float, List[float]]:
+        lexicon_scores = self._lexicon_store.scores
+        lowered_tokens = document.lowered_tokens
+        total_score = 0.0
+        word_count = 0
+        sentence_scores = []
+        
+        for sentence in document.sentences or ():
+            sentence_total = 0.0
+            sentence_word_count = 0
+            for token in lowered_tokens[sentence.token_start:sentence.token_end]:
+                word_score = lexicon_scores.get(token, 0.0)
+                if word_score != 0:
+                    sentence_total += word_score
+                    total_score += word_score
+                    sentence_word_count += 1
+            
+            word_count += sentence_word_count
+            sentence_scores.append(self.score_from_totals(sentence_total, sentence_word_count))
+        
+        return self.score_from_totals(total_score, word_count), sentence_scores
+    
+    def analyze_documents(self, documents: Sequence[TokenizedDocument]) -> List[float]:
+        vectorized_lexicon = self._registry.vectorized_lexicon()
+        token_ids = vectorized_lexicon.encode(chain.from_iterable(document.lowered_tokens for document in documents))
+        document_lengths = [len(document.lowered_tokens) for document in documents]
+        return self._score_segments(vectorized_lexicon, token_ids, document_lengths)
+    
+    def analyze_documents_sentences(self, documents: Sequence[TokenizedDocument]) -> List[Tuple[float, List[float]]]:
+        vectorized_lexicon = self._registry.vectorized_lexicon()
+        sentence_spans = [document.sentences or () for document in documents]
+        token_ids = vectorized_lexicon.encode(
+            token
+            for document, spans in zip(documents, sentence_spans)
+            for span in spans
+            for token in document.lowered_tokens[span.token_start:span.token_end]
+        )
+        sentence_lengths = [span.token_end - span.token_start for spans in sentence_spans for span in spans]
+        document_lengths = [sum(span.token_end - span.token_start for span in spans) for spans in sentence_spans]
+        
+        document_scores = self._score_segments(vectorized_lexicon, token_ids, document_lengths)
+        sentence_scores = iter(self._score_segments(vectorized_lexicon, token_ids, sentence_lengths))
+        return [
+            (document_score, list(islice(sentence_scores, len(spans))))
+            for document_score, spans in zip(document_scores, sentence_spans)
+        ]
+    
+    def score_from_totals(self, total_score: float, word_count: int) -> float:
+        return self._normalize_score(self._average_score(total_score, word_count))
     
     def _is_valid_text(self, text: str) -> bool:
         return text and text.strip()
     
     def _calculate_sentiment_score(self, words: List[str]) -> float:
-        if not words:
-            return 0.0
-        
+        lowered_tokens = [word.strip().lower() for word in words]
+        return self._calculate_lowered_tokens_score(lowered_tokens)
+    
+    def _calculate_lowered_tokens_score(self, lowered_tokens: List[str]) -> float:
+        lexicon_scores = self._lexicon_store.scores
         total_score = 0.0
         word_count = 0
         
-        for word in words:
-            word = word.strip().lower()
-            if not word:
-                continue
-            
-            word_score = self._get_word_sentiment_score(word)
+        for token in lowered_tokens:
+            word_score = lexicon_scores.get(token, 0.0)
             if word_score != 0:
                 total_score += word_score
                 word_count += 1
         
+        return self._average_score(total_score, word_count)
+    
+    def _score_segments(
+        self, vectorized_lexicon: VectorizedLexicon, token_ids: np.ndarray, segment_lengths: List[int]
+    ) -> List[float]:
+        segment_totals = vectorized_lexicon.score_segments(token_ids, segment_lengths)
+        counts = segment_totals.counts
+        averages = np.divide(segment_totals.totals, counts, out=np.zeros(len(counts)), where=counts > 0)
+        return np.clip(averages, SENTIMENT_SCORE_MIN, SENTIMENT_SCORE_MAX).tolist()
+    
+    def _average_score(self, total_score: float, word_count: int) -> float:
         return total_score / word_count if word_count > 0 else 0.0
     
     def _get_word_sentiment_score(self, word: str) -> float:
-        if word in self.lexicon["positive_words"]:
-            return self.lexicon["positive_words"][word]
-        if word in self.lexicon["negative_words"]:
-            return self.lexicon["negative_words"][word]
-        return 0.0
+        return self._lexicon_store.score(word)
     
     def _load_sentiment_lexicon(self) -> Dict[str, Any]:
-        try:
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            lexicon_path = os.path.join(current_dir, "data", "persian_sentiment_lexicon.json")
-            
-            with open(lexicon_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError, KeyError) as e:
-            print(f"Warning: Could not load sentiment lexicon: {e}")
-            return {
-                "positive_words": {},
-                "negative_words": {}
-            }
+        return self._lexicon_store.as_lexicon_dict()
     
     def _tokenize_text(self, text: str) -> List[str]:
-        return re.findall(r'\b\w+\b', text)
+        return WORD_PATTERN.findall(text)
     
     def _normalize_score(self, score: float) -> float:
         return max(SENTIMENT_SCORE_MIN, min(SENTIMENT_SCORE_MAX, score))
@@ -79,4 +136,4 @@ class  SentimentAnalyzer:
             return "positive"
         if score < SENTIMENT_NEGATIVE_THRESHOLD:
             return "negative"
-        return "neutral" 
\ No newline at end of file
+        return "neutral"
\ No newline at end of file
@@ -0,0 +1,285 @@
+"""
+Asyncio HTTP server exposing LexiMood analysis over TCP or a Unix-domain socket.
+
+    POST /analyze   {"text": "..."} or {"texts": ["...", ...]}
+    GET  /health
+    GET  /stats
+"""
+
+import asyncio
+import json
+import logging
+import time
+from http import HTTPStatus
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+from .async_analyzer import AsyncAnalyzer
+from .config import AnalysisConfig
+from .constants import (
+    DEFAULT_SERVER_HOST, DEFAULT_SERVER_PORT, DEFAULT_MICRO_BATCH_SIZE, DEFAULT_MICRO_BATCH_WAIT_MS,
+    MAX_REQUEST_BODY_SIZE, MAX_REQUEST_HEADERS
+)
+
+HTTP_ENCODING = "latin-1"
+JSON_CONTENT_TYPE = "application/json; charset=utf-8"
+KEEP_ALIVE_VERSION = "HTTP/1.1"
+
+logger = logging.getLogger(__name__)
+
+
+class HTTPError(Exception):
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class HTTPRequest(NamedTuple):
+    method: str
+    path: str
+    version: str
+    headers: Dict[str, str]
+    body: bytes
+    
+    @property
+    def keep_alive(self) -> bool:
+        connection = self.headers.get("connection", "").lower()
+        if self.version == KEEP_ALIVE_VERSION:
+            return connection != "close"
+        return connection == "keep-alive"
+
+
+class AnalysisServer:
+    def __init__(
+        self,
+        config: Optional[AnalysisConfig] = None,
+        host: str = DEFAULT_SERVER_HOST,
+        port: int = DEFAULT_SERVER_PORT,
+        unix_socket: Optional[str] = None,
+        max_batch_size: int = DEFAULT_MICRO_BATCH_SIZE,
+        max_wait_ms: float = DEFAULT_MICRO_BATCH_WAIT_MS,
+        workers: Optional[int] = None,
+        use_processes: bool = False
+    ):
+        self.host = host
+        self.port = port
+        self.unix_socket = unix_socket
+        self.async_analyzer = AsyncAnalyzer(config, max_batch_size, max_wait_ms, workers, use_processes)
+        self.request_count = 0
+        self.text_count = 0
+        self.error_count = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._started_at = time.monotonic()
+        self._routes = {
+            ("POST", "/analyze"): self._handle_analyze,
+            ("GET", "/health"): self._handle_health,
+            ("GET", "/stats"): self._handle_stats,
+        }
+    
+    async def __aenter__(self) -> "AnalysisServer":
+        await self.start()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+    
+    @property
+    def bound_port(self) -> Optional[int]:
+        if self._server is None or self.unix_socket is not None:
+            return None
+        return self._server.sockets[0].getsockname()[1]
+    
+    async def start(self):
+        self.async_analyzer.analyzer.registry.preload()
+        if self.unix_socket is not None:
+            self._server = await asyncio.start_unix_server(self._handle_connection, self.unix_socket)
+        else:
+            self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self._started_at = time.monotonic()
+    
+    async def serve_forever(self):
+        if self._server is None:
+            await self.start()
+        await self._server.serve_forever()
+    
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        await self.async_analyzer.close()
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "requests": self.request_count,
+            "texts": self.text_count,
+            "errors": self.error_count,
+            "batches": self.async_analyzer.batch_count,
+            "uptime_seconds": round(time.monotonic() - self._started_at, 3)
+        }
+    
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            await self._serve_requests(reader, writer)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+    
+    async def _serve_requests(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        while True:
+            try:
+                request = await self._read_request(reader)
+            except HTTPError as e:
+                self.error_count += 1
+                self._write_response(writer, e.status, {"error": e.message}, False)
+                await writer.drain()
+                return
+            
+            if request is None:
+                return
+            
+            status, payload = await self._dispatch(request)
+            self._write_response(writer, status, payload, request.keep_alive)
+            await writer.drain()
+            if not request.keep_alive:
+                return
+    
+    async def _read_request(self, reader: asyncio.StreamReader) -> Optional[HTTPRequest]:
+        request_line = await self._read_line(reader, HTTPStatus.REQUEST_URI_TOO_LONG, "Request line too long")
+        if not request_line.strip():
+            return None
+        
+        method, path, version = self._parse_request_line(request_line)
+        headers = await self._read_headers(reader)
+        body = await reader.readexactly(self._get_content_length(headers))
+        return HTTPRequest(method, path, version, headers, body)
+    
+    def _parse_request_line(self, request_line: bytes) -> Tuple[str, str, str]:
+        parts = request_line.decode(HTTP_ENCODING).split()
+        if len(parts) != 3:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Malformed request line")
+        
+        method, target, version = parts
+        return method.upper(), target.split("?", 1)[0], version
+    
+    async def _read_headers(self, reader: asyncio.StreamReader) -> Dict[str, str]:
+        headers = {}
+        for _ in range(MAX_REQUEST_HEADERS):
+            line = await self._read_line(reader, HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "Header line too long")
+            if not line.strip():
+                return headers
+            
+            name, separator, value = line.decode(HTTP_ENCODING).partition(":")
+            if not separator:
+                raise HTTPError(HTTPStatus.BAD_REQUEST, "Malformed header line")
+            headers[name.strip().lower()] = value.strip()
+        
+        raise HTTPError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "Too many header lines")
+    
+    async def _read_line(self, reader: asyncio.StreamReader, status: HTTPStatus, message: str) -> bytes:
+        try:
+            return await reader.readline()
+        except ValueError:
+            raise HTTPError(status, message)
+    
+    def _get_content_length(self, headers: Dict[str, str]) -> int:
+        try:
+            content_length = int(headers.get("content-length", "0"))
+        except ValueError:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length header")
+        
+        if content_length < 0:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length header")
+        if content_length > MAX_REQUEST_BODY_SIZE:
+            raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Request body too large")
+        return content_length
+    
+    async def _dispatch(self, request: HTTPRequest) -> Tuple[HTTPStatus, Dict[str, Any]]:
+        self.request_count += 1
+        try:
+            handler = self._find_handler(request)
+            return HTTPStatus.OK, await handler(request)
+        except HTTPError as e:
+            self.error_count += 1
+            return e.status, {"error": e.message}
+        except Exception:
+            logger.exception("Error while handling %s %s", request.method, request.path)
+            self.error_count += 1
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "Internal server error"}
+    
+    def _find_handler(self, request: HTTPRequest):
+        handler = self._routes.get((request.method, request.path))
+        if handler is not None:
+            return handler
+        
+        if any(path == request.path for _, path in self._routes):
+            raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED, f"Method {request.method} not allowed")
+        raise HTTPError(HTTPStatus.NOT_FOUND, f"Unknown path {request.path}")
+    
+    async def _handle_analyze(self, request: HTTPRequest) -> Dict[str, Any]:
+        payload = self._parse_json_body(request.body)
+        if "texts" in payload:
+            texts = self._validate_texts(payload["texts"])
+            results = await self._analyze_texts(texts)
+            return {"results": [result.to_dict() for result in results]}
+        
+        if "text" in payload:
+            text = self._validate_texts([payload["text"]])[0]
+            result = (await self._analyze_texts([text]))[0]
+            return result.to_dict()
+        
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Request body must contain 'text' or 'texts'")
+    
+    async def _handle_health(self, request: HTTPRequest) -> Dict[str, Any]:
+        return {"status": "ok"}
+    
+    async def _handle_stats(self, request: HTTPRequest) -> Dict[str, Any]:
+        return self.stats()
+    
+    async def _analyze_texts(self, texts: List[str]) -> list:
+        try:
+            results = await self.async_analyzer.analyze_many(texts)
+        except ValueError as e:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, str(e))
+        
+        self.text_count += len(texts)
+        return results
+    
+    def _parse_json_body(self, body: bytes) -> Dict[str, Any]:
+        try:
+            payload = json.loads(body.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Request body must be valid JSON")
+        
+        if not isinstance(payload, dict):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Request body must be a JSON object")
+        return payload
+    
+    def _validate_texts(self, texts: Any) -> List[str]:
+        if not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Texts must be strings")
+        return texts
+    
+    def _write_response(
+        self, writer: asyncio.StreamWriter, status: HTTPStatus, payload: Dict[str, Any], keep_alive: bool
+    ):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        connection = "keep-alive" if keep_alive else "close"
+        head = (
+            f"{KEEP_ALIVE_VERSION} {status.value} {status.phrase}\r\n"
+            f"Content-Type: {JSON_CONTENT_TYPE}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {connection}\r\n\r\n"
+        )
+        writer.write(head.encode(HTTP_ENCODING) + body)
+
+
+def run_server(server: AnalysisServer):
+    async def serve():
+        async with server:
+            await server.serve_forever()
+    
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
\ No newline at end of file
@@ -0,0 +1,257 @@
+"""
+Persistent SQLite backend for cached analysis results, for re-running jobs over mostly unchanged corpora.
+
+The cache file can be shrunk from the command line:
+    
+    python -m leximood.sqlite_cache prune CACHE.db --max-bytes BYTES
+"""
+
+import argparse
+import json
+import sqlite3
+import sys
+import threading
+import time
+from itertools import groupby, islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from .cache import CachedAnalysis, ResultCacheKey
+from .models import SentenceResult, SentimentLabel
+from .constants import SQLITE_CACHE_BATCH_SIZE, MIN_BATCH_SIZE
+
+CREATE_RESULTS_TABLE = """
+CREATE TABLE IF NOT EXISTS analysis_results (
+    config_key TEXT NOT NULL,
+    lexicon_version TEXT NOT NULL,
+    text_hash BLOB NOT NULL,
+    sentiment TEXT NOT NULL,
+    score REAL NOT NULL,
+    keywords TEXT NOT NULL,
+    confidence REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    sentences TEXT NOT NULL,
+    PRIMARY KEY (config_key, lexicon_version, text_hash)
+) WITHOUT ROWID
+"""
+CREATE_ACCESSED_AT_INDEX = (
+    "CREATE INDEX IF NOT EXISTS analysis_results_accessed_at ON analysis_results (accessed_at)"
+)
+SELECT_RESULTS = (
+    "SELECT text_hash, sentiment, score, keywords, confidence, sentences FROM analysis_results "
+    "WHERE config_key = ? AND lexicon_version = ? AND text_hash IN ({placeholders})"
+)
+INSERT_RESULT = "INSERT OR REPLACE INTO analysis_results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+UPDATE_ACCESSED_AT = (
+    "UPDATE analysis_results SET accessed_at = ? "
+    "WHERE config_key = ? AND lexicon_version = ? AND text_hash IN ({placeholders})"
+)
+DELETE_LEAST_RECENTLY_USED_RESULTS = (
+    "DELETE FROM analysis_results WHERE (config_key, lexicon_version, text_hash) IN ("
+    "SELECT config_key, lexicon_version, text_hash FROM analysis_results ORDER BY accessed_at LIMIT ?)"
+)
+COUNT_RESULTS = "SELECT COUNT(*) FROM analysis_results"
+KEYWORD_SEPARATOR = "\x1f"
+
+
+class SQLiteResultCache:
+    def __init__(self, path: str, batch_size: int = SQLITE_CACHE_BATCH_SIZE):
+        self.path = path
+        self.batch_size = batch_size
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._validate_batch_size()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._initialize_database()
+    
+    def __enter__(self) -> "SQLiteResultCache":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def get(self, key: ResultCacheKey) -> Optional[CachedAnalysis]:
+        return self.get_many([key]).get(key)
+    
+    def put(self, key: ResultCacheKey, entry: CachedAnalysis):
+        self.put_many([(key, entry)])
+    
+    def get_many(self, keys: Iterable[ResultCacheKey]) -> Dict[ResultCacheKey, CachedAnalysis]:
+        unique_keys = sorted(set(keys), key=self._namespace_of)
+        accessed_at = time.time()
+        found = {}
+        
+        with self._lock, self._connection:
+            for (config_key, lexicon_version), namespace_keys in groupby(unique_keys, key=self._namespace_of):
+                text_hashes = [text_hash for text_hash, _, _ in namespace_keys]
+                for chunk in self._split_into_chunks(text_hashes):
+                    rows = self._select_results(config_key, lexicon_version, chunk)
+                    for row in rows:
+                        found[(row[0], config_key, lexicon_version)] = self._row_to_entry(row)
+                    self._touch_results(config_key, lexicon_version, [row[0] for row in rows], accessed_at)
+            
+            self.hits += len(found)
+            self.misses += len(unique_keys) - len(found)
+        return found
+    
+    def put_many(self, entries: Iterable[Tuple[ResultCacheKey, CachedAnalysis]]):
+        accessed_at = time.time()
+        rows = [self._entry_to_row(key, entry, accessed_at) for key, entry in entries]
+        if not rows:
+            return
+        
+        with self._lock, self._connection:
+            self._connection.executemany(INSERT_RESULT, rows)
+    
+    def prune(self, max_bytes: int) -> int:
+        removed_count = 0
+        
+        with self._lock:
+            while self._database_size() > max_bytes:
+                row_count = self._count_rows()
+                if row_count == 0:
+                    break
+                
+                rows_to_remove = self._estimate_rows_to_remove(row_count, max_bytes)
+                with self._connection:
+                    self._connection.execute(DELETE_LEAST_RECENTLY_USED_RESULTS, (rows_to_remove,))
+                self._compact()
+                removed_count += rows_to_remove
+        return removed_count
+    
+    def clear(self):
+        with self._lock:
+            with self._connection:
+                self._connection.execute("DELETE FROM analysis_results")
+            self.hits = 0
+            self.misses = 0
+    
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": self._count_rows(),
+                "bytes": self._database_size()
+            }
+    
+    def close(self):
+        with self._lock:
+            self._connection.close()
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return self._count_rows()
+    
+    def _validate_batch_size(self):
+        if self.batch_size >= MIN_BATCH_SIZE:
+            return
+        
+        raise ValueError(f"batch_size must be at least {MIN_BATCH_SIZE}")
+    
+    def _initialize_database(self):
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        with self._connection:
+            self._connection.execute(CREATE_RESULTS_TABLE)
+            self._connection.execute(CREATE_ACCESSED_AT_INDEX)
+    
+    def _namespace_of(self, key: ResultCacheKey) -> Tuple[str, str]:
+        return key[1], key[2]
+    
+    def _split_into_chunks(self, values: List[bytes]) -> Iterator[List[bytes]]:
+        iterator = iter(values)
+        chunk = list(islice(iterator, self.batch_size))
+        while chunk:
+            yield chunk
+            chunk = list(islice(iterator, self.batch_size))
+    
+    def _select_results(self, config_key: str, lexicon_version: str, text_hashes: List[bytes]) -> List[Tuple]:
+        query = SELECT_RESULTS.format(placeholders=", ".join("?" * len(text_hashes)))
+        return self._connection.execute(query, (config_key, lexicon_version, *text_hashes)).fetchall()
+    
+    def _touch_results(self, config_key: str, lexicon_version: str, text_hashes: List[bytes], accessed_at: float):
+        if not text_hashes:
+            return
+        
+        query = UPDATE_ACCESSED_AT.format(placeholders=", ".join("?" * len(text_hashes)))
+        self._connection.execute(query, (accessed_at, config_key, lexicon_version, *text_hashes))
+    
+    def _row_to_entry(self, row: Tuple) -> CachedAnalysis:
+        _, sentiment, score, keywords, confidence, sentences = row
+        return CachedAnalysis(
+            SentimentLabel(sentiment), score, self._split_keywords(keywords), confidence,
+            self._decode_sentences(sentences)
+        )
+    
+    def _entry_to_row(self, key: ResultCacheKey, entry: CachedAnalysis, accessed_at: float) -> Tuple:
+        text_hash, config_key, lexicon_version = key
+        return (
+            config_key, lexicon_version, text_hash, entry.sentiment.value,
+            entry.score, KEYWORD_SEPARATOR.join(entry.keywords), entry.confidence, accessed_at,
+            self._encode_sentences(entry.sentences)
+        )
+    
+    def _split_keywords(self, keywords: str) -> Tuple[str, ...]:
+        if not keywords:
+            return ()
+        return tuple(keywords.split(KEYWORD_SEPARATOR))
+    
+    def _encode_sentences(self, sentences: Tuple[SentenceResult, ...]) -> str:
+        if not sentences:
+            return ""
+        return json.dumps(
+            [[sentence.text, sentence.sentiment.value, sentence.score] for sentence in sentences],
+            ensure_ascii=False
+        )
+    
+    def _decode_sentences(self, sentences: str) -> Tuple[SentenceResult, ...]:
+        if not sentences:
+            return ()
+        return tuple(
+            SentenceResult(text, SentimentLabel(sentiment), score) for text, sentiment, score in json.loads(sentences)
+        )
+    
+    def _estimate_rows_to_remove(self, row_count: int, max_bytes: int) -> int:
+        rows_to_keep = int(row_count * max_bytes / self._database_size())
+        return max(row_count - rows_to_keep, 1)
+    
+    def _compact(self):
+        self._connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        self._connection.execute("VACUUM")
+    
+    def _count_rows(self) -> int:
+        return self._connection.execute(COUNT_RESULTS).fetchone()[0]
+    
+    def _database_size(self) -> int:
+        page_count = self._connection.execute("PRAGMA page_count").fetchone()[0]
+        page_size = self._connection.execute("PRAGMA page_size").fetchone()[0]
+        return page_count * page_size
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m leximood.sqlite_cache", description="LexiMood result cache tools")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    prune_parser = subparsers.add_parser(
+        "prune", help="Remove the least recently used cached results until the file fits a size"
+    )
+    prune_parser.add_argument("path", help="Path of the SQLite cache file")
+    prune_parser.add_argument("--max-bytes", type=int, required=True, help="Target size of the cache file in bytes")
+    
+    stats_parser = subparsers.add_parser("stats", help="Show the number of cached results and the file size")
+    stats_parser.add_argument("path", help="Path of the SQLite cache file")
+    
+    args = parser.parse_args(argv)
+    with SQLiteResultCache(args.path) as cache:
+        if args.command == "prune":
+            removed_count = cache.prune(args.max_bytes)
+            print(f"Removed {removed_count} cached results from {args.path}")
+            return 0
+        
+        stats = cache.stats()
+        print(f"{stats['entries']} cached results, {stats['bytes']} bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
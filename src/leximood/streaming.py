@@ -0,0 +1,129 @@
+"""
+Incremental analysis state for documents read as a stream of normalized text pieces.
+"""
+
+from collections import Counter
+from functools import partial
+from typing import Iterable, Iterator, List, Optional, TextIO, Tuple, Union
+from .constants import EMPTY_STRING
+from .keywords import KeywordExtractor
+from .patterns import SENTENCE_BOUNDARY_PATTERN, WORD_PATTERN
+from .sentiment import SentimentAnalyzer
+
+TextSource = Union[str, TextIO, Iterable[str]]
+
+
+class StreamingDocument:
+    def __init__(
+        self,
+        sentiment_analyzer: SentimentAnalyzer,
+        keyword_extractor: Optional[KeywordExtractor] = None,
+        track_sentences: bool = False
+    ):
+        self.sentiment_analyzer = sentiment_analyzer
+        self.keyword_extractor = keyword_extractor
+        self.track_sentences = track_sentences
+        self.total_score = 0.0
+        self.word_count = 0
+        self.token_count = 0
+        self.word_counts: Counter = Counter()
+        self.sentence_scores: List[Tuple[str, float]] = []
+        self._lexicon_scores = sentiment_analyzer.lexicon_scores
+        self._sentence_parts: List[str] = []
+        self._sentence_total = 0.0
+        self._sentence_word_count = 0
+        self._sentence_token_count = 0
+        self._closed_sentence: Optional[Tuple[List[str], float, int]] = None
+    
+    @property
+    def score(self) -> float:
+        return self.sentiment_analyzer.score_from_totals(self.total_score, self.word_count)
+    
+    def feed(self, text: str):
+        if not self.track_sentences:
+            self._add_tokens(WORD_PATTERN.findall(text))
+            return
+        
+        position = 0
+        for boundary in SENTENCE_BOUNDARY_PATTERN.finditer(text):
+            self._add_sentence_text(text[position:boundary.end()], WORD_PATTERN.findall(text, position, boundary.start()))
+            self._close_sentence()
+            position = boundary.end()
+        self._add_sentence_text(text[position:], WORD_PATTERN.findall(text, position))
+    
+    def finish(self):
+        if not self.track_sentences:
+            return
+        
+        self._close_sentence()
+        self._flush_closed_sentence()
+    
+    def _add_tokens(self, tokens: List[str]):
+        lowered_tokens = [token.lower() for token in tokens]
+        lexicon_scores = self._lexicon_scores
+        total_score = self.total_score
+        sentence_total = self._sentence_total
+        word_count = 0
+        
+        for token in lowered_tokens:
+            word_score = lexicon_scores.get(token, 0.0)
+            if word_score != 0:
+                total_score += word_score
+                sentence_total += word_score
+                word_count += 1
+        
+        self.total_score = total_score
+        self.word_count += word_count
+        self.token_count += len(lowered_tokens)
+        self._sentence_total = sentence_total
+        self._sentence_word_count += word_count
+        self._sentence_token_count += len(lowered_tokens)
+        if self.keyword_extractor is not None:
+            self.keyword_extractor.count_words(lowered_tokens, self.word_counts)
+    
+    def _add_sentence_text(self, text: str, tokens: List[str]):
+        self._sentence_parts.append(text)
+        self._add_tokens(tokens)
+    
+    def _close_sentence(self):
+        if self._sentence_token_count == 0:
+            if self._closed_sentence is not None:
+                self._closed_sentence[0].extend(self._sentence_parts)
+            self._sentence_parts = []
+            return
+        
+        self._flush_closed_sentence()
+        self._closed_sentence = (self._sentence_parts, self._sentence_total, self._sentence_word_count)
+        self._sentence_parts = []
+        self._sentence_total = 0.0
+        self._sentence_word_count = 0
+        self._sentence_token_count = 0
+    
+    def _flush_closed_sentence(self):
+        if self._closed_sentence is None:
+            return
+        
+        parts, sentence_total, sentence_word_count = self._closed_sentence
+        sentence_score = self.sentiment_analyzer.score_from_totals(sentence_total, sentence_word_count)
+        self.sentence_scores.append((EMPTY_STRING.join(parts).strip(), sentence_score))
+        self._closed_sentence = None
+
+
+class TextChunks:
+    def __init__(self, source: TextSource, chunk_size: int):
+        self.source = source
+        self.chunk_size = chunk_size
+        self.has_text = False
+    
+    def __iter__(self) -> Iterator[str]:
+        for chunk in self._iter_source_chunks():
+            if not self.has_text and chunk.strip():
+                self.has_text = True
+            yield chunk
+    
+    def _iter_source_chunks(self) -> Iterator[str]:
+        if isinstance(self.source, str):
+            return iter((self.source,))
+        if hasattr(self.source, "read"):
+            return iter(partial(self.source.read, self.chunk_size), EMPTY_STRING)
+        return iter(self.source)
\ No newline at end of file
@@ -0,0 +1,38 @@
+"""
+Tests for the affix trie module.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pytest
+from leximood.affixes import AffixTrie
+
+
+class TestAffixTrie:
+    """Test cases for the affix trie."""
+    
+    def test_prefix_match_lengths(self):
+        """Test that every matching prefix length is reported, shortest first."""
+        trie = AffixTrie.for_prefixes(["م", "می", "نمی", "بی"])
+        
+        assert trie.match_lengths("میخورند") == [1, 2]
+        assert trie.match_lengths("نمیدانستند") == [3]
+        assert trie.match_lengths("کتاب") == []
+    
+    def test_suffix_match_lengths(self):
+        """Test that suffixes are matched from the end of the word."""
+        trie = AffixTrie.for_suffixes(["ها", "ی", "یی", "ی‌ها"])
+        
+        assert trie.match_lengths("کتابها") == [2]
+        assert trie.match_lengths("کتابی‌ها") == [2, 4]
+        assert trie.match_lengths("زیبایی") == [1, 2]
+        assert trie.match_lengths("کتاب") == []
+    
+    def test_empty_affixes_are_ignored(self):
+        """Test that empty affixes never match."""
+        trie = AffixTrie.for_suffixes(["", "ها"])
+        
+        assert trie.match_lengths("کتاب") == []
+        assert trie.match_lengths("") == []
\ No newline at end of file
@@ -7,9 +7,10 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 import pytest
-from leximood.analyzer import analyze_text, Analyzer
-from leximood.config import AnalysisConfig
+from leximood.analyzer import analyze_text, analyze_texts, Analyzer, _get_global_analyzer
+from leximood.config import AnalysisConfig, AnalysisLevel
 from leximood.models import SentimentLabel
+from leximood.cache import ResultCache
 
 
 class TestAnalyzer:
@@ -115,4 +116,173 @@ class TestAnalyzer:
         assert isinstance(result.keywords, list)
         assert isinstance(result.confidence, float)
         assert isinstance(result.text, str)
-        assert isinstance(result.analysis_level, str) 
\ No newline at end of file
+        assert isinstance(result.analysis_level, str)
+    
+    def test_analyze_texts_preserves_input_order(self):
+        """Test that batch analysis returns results in input order."""
+        texts = ["امروز خیلی خوشحالم", "دیروز ناراحت بودم", "متن تست"]
+        results = analyze_texts(texts, batch_size=2)
+        
+        assert len(results) == len(texts)
+        assert [result.text for result in results] == texts
+    
+    def test_analyze_texts_matches_single_analysis(self):
+        """Test that batch results match one-by-one analysis."""
+        analyzer = Analyzer()
+        texts = ["امروز خیلی خوشحالم", "دیروز ناراحت بودم", "امروز خیلی خوشحالم"]
+        
+        batch_results = analyzer.analyze_texts(iter(texts))
+        single_results = [analyzer.analyze(text) for text in texts]
+        
+        assert batch_results == single_results
+    
+    def test_analyze_texts_deduplicates_identical_inputs(self):
+        """Test that duplicate inputs get independent but equal results."""
+        analyzer = Analyzer()
+        results = analyzer.analyze_texts(["متن تست", "متن   تست", "متن تست"])
+        
+        assert results[0].score == results[1].score == results[2].score
+        assert results[1].text == "متن   تست"
+        assert results[0] is not results[2]
+        assert results[0].keywords is not results[2].keywords
+    
+    def test_analyze_texts_empty_input(self):
+        """Test batch analysis with no texts."""
+        assert analyze_texts([]) == []
+    
+    def test_analyze_texts_rejects_empty_text(self):
+        """Test that batch analysis validates every text."""
+        with pytest.raises(ValueError, match="Text cannot be empty"):
+            analyze_texts(["متن تست", "  "])
+    
+    def test_analyze_texts_invalid_batch_size(self):
+        """Test that batch size must be positive."""
+        with pytest.raises(ValueError, match="batch_size must be at least 1"):
+            analyze_texts(["متن تست"], batch_size=0)
+    
+    def test_equal_configs_share_cached_analyzer(self):
+        """Test that passing an equal config does not rebuild the analyzer."""
+        first = _get_global_analyzer(AnalysisConfig(max_keywords=2))
+        second = _get_global_analyzer(AnalysisConfig(max_keywords=2))
+        other = _get_global_analyzer(AnalysisConfig(max_keywords=3))
+        
+        assert first is second
+        assert first is not other
+    
+    def test_cached_analyzer_ignores_later_config_mutation(self):
+        """Test that mutating a config after use does not affect cached analyzers."""
+        config = AnalysisConfig(include_keywords=True, max_keywords=4)
+        analyzer = _get_global_analyzer(config)
+        config.include_keywords = False
+        
+        assert analyzer.config.include_keywords is True
+        assert _get_global_analyzer(config) is not analyzer
+    
+    def test_default_analyzer_unaffected_by_config_calls(self):
+        """Test that calls without config keep using the default configuration."""
+        analyze_text("امروز خیلی خوشحالم", AnalysisConfig(include_keywords=False))
+        result = analyze_text("امروز خیلی خوشحالم")
+        
+        assert len(result.keywords) > 0
+    
+    def test_result_cache_is_disabled_by_default(self):
+        """Test that analyzers do not cache results unless asked to."""
+        assert Analyzer().result_cache is None
+    
+    def test_result_cache_serves_normalized_duplicates(self):
+        """Test that texts normalizing to the same string hit the cache."""
+        cache = ResultCache(max_entries=10)
+        analyzer = Analyzer(result_cache=cache)
+        
+        first = analyzer.analyze("امروز روز خوبی است")
+        second = analyzer.analyze("  امروز   روز خوبی است ")
+        
+        assert cache.hits == 1
+        assert cache.misses == 1
+        assert second.text == "  امروز   روز خوبی است "
+        assert second.score == first.score
+        assert second.sentiment == first.sentiment
+        assert second.keywords == first.keywords
+    
+    def test_cached_results_are_not_shared(self):
+        """Test that mutating a returned result does not corrupt the cache."""
+        analyzer = Analyzer(AnalysisConfig(include_keywords=True), result_cache=ResultCache())
+        
+        first = analyzer.analyze("این محصول عالی و خوب است")
+        expected_keywords = list(first.keywords)
+        first.keywords.append("تغییر")
+        second = analyzer.analyze("این محصول عالی و خوب است")
+        
+        assert second is not first
+        assert second.keywords == expected_keywords
+    
+    def test_result_cache_keyed_by_config(self):
+        """Test that analyzers with different configs sharing a cache do not collide."""
+        cache = ResultCache()
+        with_keywords = Analyzer(AnalysisConfig(include_keywords=True), result_cache=cache)
+        without_keywords = Analyzer(AnalysisConfig(include_keywords=False), result_cache=cache)
+        
+        with_keywords.analyze("این محصول عالی و خوب است")
+        result = without_keywords.analyze("این محصول عالی و خوب است")
+        
+        assert result.keywords == []
+        assert cache.hits == 0
+        assert len(cache) == 2
+    
+    def test_result_cache_shared_across_output_options(self):
+        """Test that options which do not change results share cache entries."""
+        cache = ResultCache()
+        text = "این محصول عالی و خوب است"
+        expected = Analyzer(result_cache=cache).analyze(text)
+        
+        for config in [
+            AnalysisConfig(include_text=False),
+            AnalysisConfig(vectorized_scoring=True),
+            AnalysisConfig(confidence_threshold=0.9),
+        ]:
+            result = Analyzer(config, result_cache=cache).analyze(text)
+            assert (result.sentiment, result.score, result.keywords) == (
+                expected.sentiment, expected.score, expected.keywords
+            )
+        
+        assert cache.hits == 3
+        assert len(cache) == 1
+    
+    def test_result_cache_used_by_batch_analysis(self):
+        """Test that batch analysis reuses cached results across calls."""
+        cache = ResultCache()
+        analyzer = Analyzer(result_cache=cache)
+        texts = ["متن اول خوب", "متن دوم بد"]
+        
+        first = analyzer.analyze_texts(texts)
+        second = analyzer.analyze_texts(texts)
+        
+        assert cache.misses == 2
+        assert cache.hits == 2
+        assert [result.score for result in first] == [result.score for result in second]
+    
+    def test_text_can_be_omitted(self):
+        """Test that results do not retain the input when include_text is disabled."""
+        text = "امروز خیلی خوشحالم"
+        result = Analyzer(AnalysisConfig(include_text=False)).analyze(text)
+        batch_results = Analyzer(AnalysisConfig(include_text=False)).analyze_texts([text, text])
+        
+        assert result.text == ""
+        assert [batch_result.text for batch_result in batch_results] == ["", ""]
+        assert result.score == analyze_text(text).score
+    
+    def test_sentence_level_analysis(self):
+        """Test that sentence-level analysis reports every sentence and the document aggregate."""
+        text = "امروز خیلی خوشحالم. ولی دیروز ناراحت بودم! فردا؟"
+        sentence_result = Analyzer(AnalysisConfig(analysis_level=AnalysisLevel.SENTENCE)).analyze(text)
+        document_result = Analyzer(AnalysisConfig(analysis_level=AnalysisLevel.DOCUMENT)).analyze(text)
+        
+        assert [sentence.text for sentence in sentence_result.sentences] == [
+            "امروز خیلی خوشحالم.", "ولی دیروز ناراحت بودم!", "فردا؟"
+        ]
+        for sentence in sentence_result.sentences:
+            assert sentence.score == analyze_text(sentence.text).score
+            assert sentence.sentiment == analyze_text(sentence.text).sentiment
+        assert sentence_result.score == document_result.score
+        assert sentence_result.keywords == document_result.keywords
+        assert document_result.sentences == []
\ No newline at end of file
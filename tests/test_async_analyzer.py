@@ -0,0 +1,135 @@
+"""
+Tests for the asyncio micro-batching analyzer module.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import asyncio
+import pytest
+from leximood.analyzer import Analyzer
+from leximood.async_analyzer import AsyncAnalyzer, analyze_text_async
+from leximood.config import AnalysisConfig
+
+
+class TestAsyncAnalyzer:
+    """Test cases for the async analyzer."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.texts = [f"متن شماره {index} خیلی خوب است" for index in range(10)]
+        self.expected = Analyzer().analyze_texts(self.texts)
+    
+    def test_concurrent_callers_are_coalesced(self):
+        """Test that concurrent requests share micro-batches and keep their own results."""
+        async def run():
+            async with AsyncAnalyzer(max_batch_size=4, max_wait_ms=50) as async_analyzer:
+                results = await asyncio.gather(*(async_analyzer.analyze(text) for text in self.texts))
+                return results, async_analyzer.batch_count
+        
+        results, batch_count = asyncio.run(run())
+        
+        assert results == self.expected
+        assert batch_count == 3
+    
+    def test_partial_batch_flushed_after_max_wait(self):
+        """Test that a lone request is answered once the wait time elapses."""
+        async def run():
+            async with AsyncAnalyzer(max_batch_size=100, max_wait_ms=1) as async_analyzer:
+                return await async_analyzer.analyze(self.texts[0])
+        
+        assert asyncio.run(run()) == self.expected[0]
+    
+    def test_analyze_many(self):
+        """Test analyzing an iterable of texts."""
+        async def run():
+            async with AsyncAnalyzer(max_batch_size=3) as async_analyzer:
+                return await async_analyzer.analyze_many(self.texts)
+        
+        assert asyncio.run(run()) == self.expected
+    
+    def test_empty_text_rejected_immediately(self):
+        """Test that invalid texts fail without joining a batch."""
+        async def run():
+            async with AsyncAnalyzer() as async_analyzer:
+                with pytest.raises(ValueError, match="Text cannot be empty"):
+                    await async_analyzer.analyze("  ")
+                return async_analyzer.batch_count
+        
+        assert asyncio.run(run()) == 0
+    
+    def test_batch_errors_reach_every_caller(self, monkeypatch):
+        """Test that a failing batch raises in each awaiting caller."""
+        async def run():
+            async with AsyncAnalyzer(max_batch_size=2, workers=1) as async_analyzer:
+                monkeypatch.setattr(async_analyzer.analyzer, "analyze_texts", self.fail_batch)
+                return await asyncio.gather(
+                    *(async_analyzer.analyze(text) for text in self.texts[:2]), return_exceptions=True
+                )
+        
+        results = asyncio.run(run())
+        
+        assert all(isinstance(result, RuntimeError) for result in results)
+    
+    def fail_batch(self, texts, batch_size):
+        """Stand-in batch analysis that always fails."""
+        raise RuntimeError("analysis failed")
+    
+    def test_process_executor(self):
+        """Test running micro-batches in worker processes."""
+        async def run():
+            async with AsyncAnalyzer(max_batch_size=4, workers=2, use_processes=True) as async_analyzer:
+                return await async_analyzer.analyze_many(self.texts)
+        
+        assert asyncio.run(run()) == self.expected
+    
+    def test_invalid_settings(self):
+        """Test validation of micro-batching settings."""
+        with pytest.raises(ValueError, match="max_batch_size must be at least 1"):
+            AsyncAnalyzer(max_batch_size=0)
+        
+        with pytest.raises(ValueError, match="max_wait_ms cannot be negative"):
+            AsyncAnalyzer(max_wait_ms=-1)
+    
+    def test_analyze_text_async(self):
+        """Test the module-level coroutine with and without a config."""
+        config = AnalysisConfig(include_keywords=False)
+        
+        async def run():
+            return await asyncio.gather(
+                analyze_text_async(self.texts[0]),
+                analyze_text_async(self.texts[0], config)
+            )
+        
+        default_result, configured_result = asyncio.run(run())
+        
+        assert default_result == self.expected[0]
+        assert configured_result.keywords == []
+    
+    def test_analyze_text_async_across_event_loops(self):
+        """Test that a request abandoned by one event loop does not stall the next."""
+        async def abandon():
+            asyncio.ensure_future(analyze_text_async(self.texts[0]))
+            await asyncio.sleep(0)
+        
+        asyncio.run(abandon())
+        
+        assert asyncio.run(asyncio.wait_for(analyze_text_async(self.texts[1]), 5)) == self.expected[1]
+        assert asyncio.run(asyncio.wait_for(analyze_text_async(self.texts[2]), 5)) == self.expected[2]
+    
+    def test_analyzer_reused_across_event_loops(self):
+        """Test that one analyzer serves successive asyncio.run calls."""
+        async_analyzer = AsyncAnalyzer(max_batch_size=100, max_wait_ms=1000)
+        
+        async def abandon():
+            asyncio.ensure_future(async_analyzer.analyze(self.texts[0]))
+            await asyncio.sleep(0)
+        
+        async def run():
+            async_analyzer.max_wait_ms = 1
+            return await asyncio.wait_for(async_analyzer.analyze_many(self.texts[:3]), 5)
+        
+        asyncio.run(abandon())
+        
+        assert asyncio.run(run()) == self.expected[:3]
\ No newline at end of file
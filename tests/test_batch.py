@@ -0,0 +1,132 @@
+"""
+Tests for the columnar batch result module.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import numpy as np
+import pytest
+from leximood.analyzer import Analyzer, analyze_batch
+from leximood.batch import BatchResultBuilder
+from leximood.config import AnalysisConfig, AnalysisLevel
+from leximood.models import AnalysisResult, SentenceResult, SentimentLabel
+
+
+class TestBatchResult:
+    """Test cases for columnar batch results."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.texts = [
+            "امروز خیلی خوشحالم. فردا؟",
+            "دیروز ناراحت بودم",
+            "این محصول عالی است",
+            "خدمات بد بود",
+            "امروز هوا معمولی است",
+        ]
+        self.analyzer = Analyzer()
+        self.expected = self.analyzer.analyze_texts(self.texts)
+        self.batch = self.analyzer.analyze_batch(self.texts, include_texts=True)
+    
+    def assert_matches(self, view, expected):
+        """Assert that a row view matches a regular analysis result."""
+        assert view.sentiment == expected.sentiment
+        assert view.score == pytest.approx(expected.score, abs=1e-6)
+        assert view.confidence == pytest.approx(expected.confidence, abs=1e-6)
+        assert view.keywords == expected.keywords
+        assert view.text == expected.text
+        assert view.analysis_level == expected.analysis_level
+        assert [sentence.text for sentence in view.sentences] == [sentence.text for sentence in expected.sentences]
+    
+    def test_column_types(self):
+        """Test that columns use compact NumPy types."""
+        assert len(self.batch) == len(self.texts)
+        assert self.batch.scores.dtype == np.float32
+        assert self.batch.confidences.dtype == np.float32
+        assert self.batch.label_codes.dtype == np.uint8
+        assert len(self.batch.keyword_offsets) == len(self.texts) + 1
+    
+    def test_row_views_match_analysis_results(self):
+        """Test that lazily created rows match analyze_texts results."""
+        for view, expected in zip(self.batch, self.expected):
+            assert isinstance(view, AnalysisResult)
+            self.assert_matches(view, expected)
+        
+        self.assert_matches(self.batch[-1], self.expected[-1])
+        assert self.batch.sentiments == [result.sentiment for result in self.expected]
+    
+    def test_slices_share_memory(self):
+        """Test that contiguous slices are views over the same columns."""
+        sliced = self.batch[1:4]
+        
+        assert len(sliced) == 3
+        assert np.shares_memory(sliced.scores, self.batch.scores)
+        assert sliced.keyword_offsets[0] == self.batch.keyword_offsets[1]
+        for view, expected in zip(sliced, self.expected[1:4]):
+            self.assert_matches(view, expected)
+        self.assert_matches(sliced[1:][0], self.expected[2])
+    
+    def test_stepped_slices(self):
+        """Test slices with a step other than one."""
+        sliced = self.batch[::-2]
+        
+        assert len(sliced) == 3
+        for view, expected in zip(sliced, self.expected[::-2]):
+            self.assert_matches(view, expected)
+    
+    def test_index_out_of_range(self):
+        """Test that rows outside the batch are rejected."""
+        with pytest.raises(IndexError):
+            self.batch[len(self.texts)]
+        with pytest.raises(IndexError):
+            self.batch[1:3][2]
+    
+    def test_texts_are_omitted_by_default(self):
+        """Test that input texts are only kept on request."""
+        batch = analyze_batch(self.texts)
+        
+        assert batch.columns.texts is None
+        assert batch[0].text == ""
+    
+    def test_empty_batch(self):
+        """Test building a batch without rows."""
+        batch = self.analyzer.analyze_batch([])
+        
+        assert len(batch) == 0
+        assert list(batch) == []
+        assert batch.scores.shape == (0,)
+    
+    def test_document_level_batches_have_no_sentences(self):
+        """Test that document-level rows carry no sentence results."""
+        analyzer = Analyzer(AnalysisConfig(analysis_level=AnalysisLevel.DOCUMENT))
+        batch = analyzer.analyze_batch(self.texts)
+        
+        assert batch.analysis_level == "document"
+        assert all(row.sentences == [] for row in batch)
+    
+    def test_builder_deduplicates_keywords(self):
+        """Test that repeated keywords are stored once in the vocabulary."""
+        builder = BatchResultBuilder("sentence")
+        for _ in range(3):
+            builder.append(AnalysisResult(
+                sentiment=SentimentLabel.POSITIVE, score=0.5, keywords=["خوب", "عالی"], confidence=0.8,
+                text="", analysis_level="sentence",
+                sentences=[SentenceResult("خوب عالی", SentimentLabel.POSITIVE, 0.5)]
+            ))
+        
+        batch = builder.build()
+        
+        assert batch.columns.keyword_vocabulary == ["خوب", "عالی"]
+        assert batch.columns.keyword_ids.tolist() == [0, 1, 0, 1, 0, 1]
+        assert batch.sentences(2) == [SentenceResult("خوب عالی", SentimentLabel.POSITIVE, 0.5)]
+    
+    def test_to_pandas(self):
+        """Test converting the batch to a DataFrame."""
+        pytest.importorskip("pandas")
+        frame = self.batch[1:].to_pandas()
+        
+        assert list(frame.columns) == ["sentiment", "score", "confidence", "keywords", "text"]
+        assert frame["sentiment"].tolist() == [result.sentiment.value for result in self.expected[1:]]
+        assert frame["keywords"].tolist() == [result.keywords for result in self.expected[1:]]
\ No newline at end of file
@@ -0,0 +1,88 @@
+"""
+Tests for the analysis result cache module.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pytest
+from leximood.cache import CachedAnalysis, ResultCache, hash_text
+from leximood.models import SentimentLabel
+
+
+class TestResultCache:
+    """Test cases for the result cache."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.entry = CachedAnalysis(SentimentLabel.POSITIVE, 0.5, ("خوب",), 0.7)
+    
+    def test_get_counts_hits_and_misses(self):
+        """Test that lookups update the hit and miss counters."""
+        cache = ResultCache(max_entries=10)
+        
+        assert cache.get("missing") is None
+        cache.put("key", self.entry)
+        assert cache.get("key") == self.entry
+        
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["entries"] == 1
+    
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test LRU eviction once the entry limit is exceeded."""
+        cache = ResultCache(max_entries=2)
+        cache.put("first", self.entry)
+        cache.put("second", self.entry)
+        cache.get("first")
+        cache.put("third", self.entry)
+        
+        assert "first" in cache
+        assert "second" not in cache
+        assert "third" in cache
+        assert len(cache) == 2
+    
+    def test_byte_limit_evicts_entries(self):
+        """Test that the byte budget bounds the cache size."""
+        cache = ResultCache(max_entries=1000, max_bytes=1000)
+        for index in range(100):
+            cache.put(f"key-{index}", self.entry)
+        
+        assert 0 < len(cache) < 100
+        assert cache.total_bytes <= 1000
+        assert "key-99" in cache
+    
+    def test_replacing_entry_keeps_size_accounting(self):
+        """Test that re-inserting a key does not double count its size."""
+        cache = ResultCache()
+        cache.put("key", self.entry)
+        size = cache.total_bytes
+        cache.put("key", self.entry)
+        
+        assert cache.total_bytes == size
+        assert len(cache) == 1
+    
+    def test_clear_resets_entries_and_counters(self):
+        """Test clearing the cache."""
+        cache = ResultCache()
+        cache.put("key", self.entry)
+        cache.get("key")
+        cache.clear()
+        
+        assert cache.stats() == {"hits": 0, "misses": 0, "entries": 0, "bytes": 0}
+    
+    def test_invalid_limits(self):
+        """Test validation of cache limits."""
+        with pytest.raises(ValueError, match="max_entries must be at least"):
+            ResultCache(max_entries=0)
+        
+        with pytest.raises(ValueError, match="max_bytes must be positive"):
+            ResultCache(max_bytes=0)
+    
+    def test_hash_text_is_stable(self):
+        """Test that text hashes are deterministic and distinguish texts."""
+        assert hash_text("سلام") == hash_text("سلام")
+        assert hash_text("سلام") != hash_text("خداحافظ")
+        assert len(hash_text("سلام")) == 16
\ No newline at end of file
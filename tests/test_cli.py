@@ -0,0 +1,194 @@
+"""
+Tests for the command-line interface module.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import bz2
+import gzip
+import io
+import json
+import lzma
+import pytest
+from leximood.analyzer import analyze_text
+from leximood.cli import main
+from leximood.document_frequency import DocumentFrequencyIndex
+
+
+class TestAnalyzeCommand:
+    """Test cases for the analyze command."""
+    
+    def read_output(self, capsys):
+        """Parse the JSONL written to standard output."""
+        return [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    
+    def test_analyze_plain_text_from_stdin(self, monkeypatch, capsys):
+        """Test analyzing one text per line from standard input."""
+        monkeypatch.setattr(sys, "stdin", io.StringIO("این محصول عالی است\n\nخدمات بد بود\n"))
+        
+        assert main(["analyze"]) == 0
+        
+        records = self.read_output(capsys)
+        assert [record["text"] for record in records] == ["این محصول عالی است", "خدمات بد بود"]
+        assert records[0] == analyze_text("این محصول عالی است").to_dict()
+        assert set(records[0]) == {"sentiment", "score", "keywords", "confidence", "text", "analysis_level", "sentences"}
+    
+    @pytest.mark.parametrize("extension,opener", [(".gz", gzip.open), (".bz2", bz2.open), (".xz", lzma.open)])
+    def test_analyze_compressed_files(self, tmp_path, capsys, extension, opener):
+        """Test reading compressed plain-text inputs."""
+        path = str(tmp_path / f"texts.txt{extension}")
+        with opener(path, "wt", encoding="utf-8") as f:
+            f.write("امروز روز خوبی است\nهوا بد است\n")
+        
+        assert main(["analyze", path]) == 0
+        assert len(self.read_output(capsys)) == 2
+    
+    def test_analyze_jsonl_with_text_field(self, tmp_path, capsys):
+        """Test extracting texts from JSONL records."""
+        path = tmp_path / "posts.jsonl.gz"
+        with gzip.open(str(path), "wt", encoding="utf-8") as f:
+            f.write(json.dumps({"id": 1, "body": "خیلی خوب بود"}, ensure_ascii=False) + "\n")
+            f.write(json.dumps({"id": 2, "body": "افتضاح بود"}, ensure_ascii=False) + "\n")
+        
+        assert main(["analyze", str(path), "--text-field", "body"]) == 0
+        assert [record["text"] for record in self.read_output(capsys)] == ["خیلی خوب بود", "افتضاح بود"]
+    
+    def test_analyze_csv_with_text_field(self, tmp_path, capsys):
+        """Test extracting texts from a CSV column."""
+        path = tmp_path / "reviews.csv"
+        path.write_text('id,review\n1,"خوب، عالی"\n2,بد\n', encoding="utf-8")
+        
+        assert main(["analyze", str(path), "--text-field", "review"]) == 0
+        assert [record["text"] for record in self.read_output(capsys)] == ["خوب، عالی", "بد"]
+    
+    def test_missing_text_field_is_reported(self, tmp_path, capsys):
+        """Test that records without the text field fail with a clear message."""
+        path = tmp_path / "posts.jsonl"
+        path.write_text('{"id": 1}\n', encoding="utf-8")
+        
+        assert main(["analyze", str(path)]) == 1
+        assert "posts.jsonl:1: record has no 'text' field" in capsys.readouterr().err
+    
+    def test_blank_records_are_reported(self, tmp_path, capsys):
+        """Test that empty or non-string texts in records fail instead of being dropped."""
+        jsonl_path = tmp_path / "posts.jsonl"
+        jsonl_path.write_text('{"text": "خوب"}\n{"text": ""}\n{"text": "بد"}\n', encoding="utf-8")
+        csv_path = tmp_path / "reviews.csv"
+        csv_path.write_text("id,text\n1,خوب\n2,\n", encoding="utf-8")
+        number_path = tmp_path / "numbers.jsonl"
+        number_path.write_text('{"text": 5}\n', encoding="utf-8")
+        
+        assert main(["analyze", str(jsonl_path)]) == 1
+        assert "posts.jsonl:2: 'text' field is empty" in capsys.readouterr().err
+        assert main(["analyze", str(csv_path)]) == 1
+        assert "reviews.csv:3: 'text' field is empty" in capsys.readouterr().err
+        assert main(["analyze", str(number_path)]) == 1
+        assert "numbers.jsonl:1: 'text' field is not a string" in capsys.readouterr().err
+    
+    def test_closed_output_pipe(self, tmp_path, monkeypatch):
+        """Test that a reader closing the pipe early ends the run without a traceback."""
+        class ClosedPipe(io.StringIO):
+            def write(self, text):
+                raise BrokenPipeError()
+            
+            def fileno(self):
+                return replaced_output.fileno()
+        
+        replaced_output = open(tmp_path / "stdout", "w")
+        monkeypatch.setattr(sys, "stdin", io.StringIO("خوب\nبد\n"))
+        monkeypatch.setattr(sys, "stdout", ClosedPipe())
+        
+        try:
+            assert main(["analyze"]) == 1
+        finally:
+            replaced_output.close()
+    
+    def test_output_file_with_workers(self, tmp_path, capsys):
+        """Test writing results to a file using worker processes."""
+        input_path = tmp_path / "texts.txt"
+        output_path = tmp_path / "results.jsonl"
+        texts = [f"متن شماره {index} خوب است" for index in range(20)]
+        input_path.write_text("\n".join(texts), encoding="utf-8")
+        
+        exit_code = main([
+            "analyze", str(input_path), "--workers", "2", "--batch-size", "3", "--output", str(output_path)
+        ])
+        
+        assert exit_code == 0
+        records = [json.loads(line) for line in output_path.read_text(encoding="utf-8").splitlines()]
+        assert [record["text"] for record in records] == texts
+    
+    def test_invalid_batch_size_is_reported(self, monkeypatch, capsys):
+        """Test that invalid options produce an error exit code."""
+        monkeypatch.setattr(sys, "stdin", io.StringIO("متن\n"))
+        
+        assert main(["analyze", "--batch-size", "0"]) == 1
+        assert "must be at least 1" in capsys.readouterr().err
+
+class TestKeywordsCommand:
+    """Test cases for the keywords command."""
+    
+    def test_reports_top_keywords_per_sentiment(self, monkeypatch, capsys):
+        """Test reporting corpus keyword counts for every sentiment."""
+        monkeypatch.setattr(sys, "stdin", io.StringIO("محصول عالی است\nمحصول خوب است\nهوا معمولی است\n"))
+        
+        assert main(["keywords", "--top", "1"]) == 0
+        
+        report = json.loads(capsys.readouterr().out)
+        assert set(report) == {"positive", "negative", "neutral"}
+        assert sum(entry["documents"] for entry in report.values()) == 3
+        assert all(len(entry["keywords"]) <= 1 for entry in report.values())
+        assert {"word": "محصول", "count": 2, "error": 0} in [
+            keyword for entry in report.values() for keyword in entry["keywords"]
+        ]
+
+
+class TestIndexCommand:
+    """Test cases for the index command."""
+    
+    def test_build_and_merge_indexes(self, tmp_path, capsys):
+        """Test building shard indexes and merging them."""
+        first_shard = tmp_path / "first.txt"
+        second_shard = tmp_path / "second.jsonl"
+        first_shard.write_text("محصول عالی است\nمحصول بد است\n", encoding="utf-8")
+        second_shard.write_text(json.dumps({"text": "ارسال سریع بود"}, ensure_ascii=False) + "\n", encoding="utf-8")
+        
+        assert main(["index", "build", str(first_shard), "--output", str(tmp_path / "first.lxdf")]) == 0
+        assert main(["index", "build", str(second_shard), "-o", str(tmp_path / "second.lxdf")]) == 0
+        assert main([
+            "index", "merge", str(tmp_path / "first.lxdf"), str(tmp_path / "second.lxdf"),
+            "--output", str(tmp_path / "corpus.lxdf")
+        ]) == 0
+        
+        index = DocumentFrequencyIndex.load(str(tmp_path / "corpus.lxdf"))
+        assert index.document_count == 3
+        assert index.document_frequency("محصول") == 2
+        assert "Merged 3 documents" in capsys.readouterr().err
+    
+    def test_analyze_with_index(self, tmp_path, monkeypatch, capsys):
+        """Test analyzing texts with BM25 keyword weighting."""
+        index = DocumentFrequencyIndex()
+        index.add_document(["محصول"])
+        index_path = str(tmp_path / "corpus.lxdf")
+        index.save(index_path)
+        monkeypatch.setattr(sys, "stdin", io.StringIO("محصول محصول کیفیت\n"))
+        
+        assert main(["analyze", "--document-frequency-index", index_path, "--keyword-weighting", "bm25"]) == 0
+        
+        record = json.loads(capsys.readouterr().out)
+        assert record["keywords"] == ["کیفیت", "محصول"]
+    
+    def test_merge_missing_index_is_reported(self, tmp_path, capsys):
+        """Test that missing indexes produce an error exit code."""
+        assert main(["index", "merge", str(tmp_path / "missing.lxdf"), "-o", str(tmp_path / "out.lxdf")]) == 1
+        assert "missing.lxdf" in capsys.readouterr().err
+    
+    def test_analyze_missing_index_is_reported(self, tmp_path, monkeypatch, capsys):
+        """Test that a missing document frequency index fails without a traceback."""
+        monkeypatch.setattr(sys, "stdin", io.StringIO("متن\n"))
+        missing_path = str(tmp_path / "missing.lxdf")
+        
+        assert main(["analyze", "--document-frequency-index", missing_path]) == 1
+        assert f"leximood: error: {missing_path}: No such file or directory" in capsys.readouterr().err
\ No newline at end of file
@@ -0,0 +1,180 @@
+"""
+Tests for sharing analyzers across threads.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+import leximood.analyzer as analyzer_module
+from leximood.analyzer import Analyzer, analyze_text, _get_global_analyzer
+from leximood.cache import ResultCache
+from leximood.config import AnalysisConfig
+from leximood.resources import ResourceRegistry
+
+
+THREAD_COUNT = 8
+
+
+class TestAnalyzerImmutability:
+    """Test cases for the read-only analyzer state."""
+    
+    def test_components_cannot_be_replaced(self):
+        """Test that analyzer components are read-only."""
+        analyzer = Analyzer()
+        
+        for name in ["config", "registry", "result_cache", "preprocessor", "sentiment_analyzer", "keyword_extractor"]:
+            with pytest.raises(AttributeError):
+                setattr(analyzer, name, None)
+    
+    def test_keyword_settings_cannot_be_replaced(self):
+        """Test that the keyword extractor settings behind the result cache key are read-only."""
+        keyword_extractor = Analyzer().keyword_extractor
+        
+        for name in ["stop_words", "document_frequency_index", "weighting", "online_document_frequencies"]:
+            with pytest.raises(AttributeError):
+                setattr(keyword_extractor, name, None)
+        with pytest.raises(AttributeError):
+            keyword_extractor.stop_words.add("محصول")
+    
+    def test_config_is_copied_on_construction(self):
+        """Test that mutating the caller's config does not change the analyzer."""
+        config = AnalysisConfig(include_keywords=True, max_keywords=3)
+        analyzer = Analyzer(config)
+        config.include_keywords = False
+        
+        assert analyzer.config.include_keywords is True
+        assert len(analyzer.analyze("این محصول عالی و خوب است").keywords) > 0
+    
+    def test_returned_config_is_a_copy(self):
+        """Test that mutating the exposed config does not change the analyzer."""
+        analyzer = Analyzer(AnalysisConfig(include_keywords=True))
+        analyzer.config.include_keywords = False
+        
+        assert analyzer.config.include_keywords is True
+
+
+class TestAnalyzerConcurrency:
+    """Test cases for concurrent use of analyzers from many threads."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.texts = [f"متن شماره {index} خیلی خوب و عالی است اما قیمت بد بود" for index in range(200)]
+    
+    def test_shared_analyzer_matches_serial_results(self):
+        """Test that one analyzer used from many threads gives the serial results."""
+        analyzer = Analyzer()
+        expected = [analyzer.analyze(text) for text in self.texts]
+        
+        with ThreadPoolExecutor(THREAD_COUNT) as executor:
+            results = list(executor.map(analyzer.analyze, self.texts * 4))
+        
+        assert results == expected * 4
+    
+    def test_shared_analyzer_batches_from_many_threads(self):
+        """Test concurrent batch analysis with a shared result cache."""
+        analyzer = Analyzer(result_cache=ResultCache(max_entries=50))
+        expected = Analyzer().analyze_texts(self.texts)
+        
+        with ThreadPoolExecutor(THREAD_COUNT) as executor:
+            batches = list(executor.map(lambda _: analyzer.analyze_texts(self.texts, 16), range(THREAD_COUNT)))
+        
+        assert all(batch == expected for batch in batches)
+    
+    def test_first_use_from_many_threads_loads_resources_once(self, monkeypatch):
+        """Test that resources are loaded once when first requested concurrently."""
+        registry = ResourceRegistry()
+        load_count = []
+        original_loader = registry._load_persian_roots
+        
+        def slow_loader():
+            load_count.append(1)
+            time.sleep(0.01)
+            return original_loader()
+        
+        monkeypatch.setattr(registry, "_load_persian_roots", slow_loader)
+        barrier = threading.Barrier(THREAD_COUNT)
+        
+        def build_analyzer(_):
+            barrier.wait()
+            return Analyzer(registry=registry).analyze(self.texts[0])
+        
+        with ThreadPoolExecutor(THREAD_COUNT) as executor:
+            results = list(executor.map(build_analyzer, range(THREAD_COUNT)))
+        
+        assert len(load_count) == 1
+        assert all(result == results[0] for result in results)
+    
+    def test_default_singleton_created_once(self, monkeypatch):
+        """Test that concurrent first calls create a single default analyzer."""
+        monkeypatch.setattr(analyzer_module, "_global_analyzer_instance", None)
+        barrier = threading.Barrier(THREAD_COUNT)
+        
+        def get_default(_):
+            barrier.wait()
+            return _get_global_analyzer(None)
+        
+        with ThreadPoolExecutor(THREAD_COUNT) as executor:
+            analyzers = list(executor.map(get_default, range(THREAD_COUNT)))
+        
+        assert all(analyzer is analyzers[0] for analyzer in analyzers)
+    
+    def test_cached_analyzer_created_once(self):
+        """Test that concurrent first calls with one config share a single analyzer."""
+        config = AnalysisConfig(max_keywords=6)
+        barrier = threading.Barrier(THREAD_COUNT)
+        
+        def get_cached(_):
+            barrier.wait()
+            return _get_global_analyzer(config)
+        
+        with ThreadPoolExecutor(THREAD_COUNT) as executor:
+            analyzers = list(executor.map(get_cached, range(THREAD_COUNT)))
+        
+        assert all(analyzer is analyzers[0] for analyzer in analyzers)
+    
+    def test_building_analyzer_does_not_block_cached_configs(self, monkeypatch):
+        """Test that a slow analyzer construction does not block lookups of other configs."""
+        cached_config = AnalysisConfig(max_keywords=3)
+        cached_analyzer = _get_global_analyzer(cached_config)
+        building = threading.Event()
+        release = threading.Event()
+        
+        class SlowAnalyzer(Analyzer):
+            def __init__(self, config=None):
+                building.set()
+                release.wait(5)
+                super().__init__(config)
+        
+        monkeypatch.setattr(analyzer_module, "Analyzer", SlowAnalyzer)
+        with ThreadPoolExecutor(2) as executor:
+            slow_build = executor.submit(_get_global_analyzer, AnalysisConfig(max_keywords=4))
+            building.wait(5)
+            try:
+                assert executor.submit(_get_global_analyzer, cached_config).result(timeout=1) is cached_analyzer
+            finally:
+                release.set()
+            assert slow_build.result().config.max_keywords == 4
+    
+    def test_mixed_configs_do_not_interfere(self):
+        """Test that threads using different configs always get their own settings."""
+        with_keywords = AnalysisConfig(include_keywords=True, max_keywords=2)
+        without_keywords = AnalysisConfig(include_keywords=False)
+        text = "این محصول عالی و خوب است"
+        
+        def analyze_with(index):
+            config = with_keywords if index % 2 else without_keywords
+            return index, analyze_text(text, config)
+        
+        with ThreadPoolExecutor(THREAD_COUNT) as executor:
+            results = list(executor.map(analyze_with, range(200)))
+        
+        for index, result in results:
+            if index % 2:
+                assert 0 < len(result.keywords) <= 2
+            else:
+                assert result.keywords == []
\ No newline at end of file
@@ -7,7 +7,7 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 import pytest
-from leximood.config import AnalysisConfig, AnalysisLevel, Language
+from leximood.config import AnalysisConfig, AnalysisLevel, KeywordWeighting, Language
 
 
 class TestAnalysisConfig:
@@ -22,6 +22,7 @@ class TestAnalysisConfig:
         assert config.include_keywords is True
         assert config.max_keywords == 5
         assert config.confidence_threshold == 0.5
+        assert config.include_text is True
     
     def test_custom_config(self):
         """Test custom configuration values."""
@@ -45,6 +46,13 @@ class TestAnalysisConfig:
         with pytest.raises(ValueError, match="max_keywords must be at least 1"):
             AnalysisConfig(max_keywords=-1)
     
+    def test_invalid_online_keyword_weighting(self):
+        """Test validation of online keyword weighting options."""
+        with pytest.raises(ValueError, match="cannot be combined with document_frequency_index"):
+            AnalysisConfig(online_keyword_weighting=True, document_frequency_index="corpus.lxdf")
+        with pytest.raises(ValueError, match="document_frequency_half_life must be positive"):
+            AnalysisConfig(document_frequency_half_life=0)
+    
     def test_invalid_confidence_threshold(self):
         """Test validation of confidence_threshold parameter."""
         with pytest.raises(ValueError, match="confidence_threshold must be between 0.0 and 1.0"):
@@ -64,4 +72,9 @@ class TestEnums:
     
     def test_language_enum(self):
         """Test Language enumeration."""
-        assert Language.PERSIAN.value == "persian" 
\ No newline at end of file
+        assert Language.PERSIAN.value == "persian"
+    
+    def test_keyword_weighting_enum(self):
+        """Test KeywordWeighting enumeration."""
+        assert KeywordWeighting.TF_IDF.value == "tfidf"
+        assert KeywordWeighting.BM25.value == "bm25"
\ No newline at end of file
@@ -0,0 +1,273 @@
+"""
+Tests for the document frequency index module.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import math
+import threading
+import pytest
+from leximood.analyzer import Analyzer
+from leximood.cache import ResultCache
+from leximood.config import AnalysisConfig, KeywordWeighting
+from leximood.document_frequency import DocumentFrequencyIndex, DocumentFrequencyWeights, OnlineDocumentFrequencies
+from leximood.keywords import KeywordExtractor
+from leximood.models import TokenizedDocument
+
+CORPUS = [
+    "این محصول عالی است",
+    "محصول بد بود و ارسال دیر انجام شد",
+    "ارسال سریع بود",
+    "محصول را دوست دارم",
+]
+
+
+class TestDocumentFrequencyIndex:
+    """Test cases for counting and storing document frequencies."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.index = DocumentFrequencyIndex()
+        self.index.add_document(["محصول", "عالی", "محصول"])
+        self.index.add_document(["محصول", "ارسال"])
+    
+    def test_counts_each_word_once_per_document(self):
+        """Test that repeated words count once towards their document frequency."""
+        assert self.index.document_count == 2
+        assert self.index.total_word_count == 5
+        assert self.index.average_document_length == 2.5
+        assert self.index.document_frequency("محصول") == 2
+        assert self.index.document_frequency("عالی") == 1
+        assert self.index.document_frequency("ناشناخته") == 0
+        assert "ارسال" in self.index
+        assert len(self.index) == 3
+    
+    def test_idf_weights(self):
+        """Test smoothed TF-IDF and BM25 inverse document frequencies."""
+        assert self.index.idf("محصول") == pytest.approx(1.0)
+        assert self.index.idf("عالی") == pytest.approx(math.log(3 / 2) + 1.0)
+        assert self.index.idf("ناشناخته") > self.index.idf("عالی")
+        assert self.index.bm25_idf("محصول") == pytest.approx(math.log(1.0 + 0.5 / 2.5))
+        assert self.index.bm25_idf("عالی") > self.index.bm25_idf("محصول")
+    
+    def test_save_and_load(self, tmp_path):
+        """Test that a saved index loads with the same counts and version."""
+        path = str(tmp_path / "corpus.lxdf")
+        self.index.save(path)
+        
+        loaded = DocumentFrequencyIndex.load(path)
+        
+        assert loaded.document_count == 2
+        assert loaded.total_word_count == 5
+        assert loaded.document_frequency("محصول") == 2
+        assert len(loaded) == 3
+        assert loaded.version == self.index.version
+        assert not os.path.exists(path + ".tmp")
+    
+    def test_merge_matches_single_pass(self):
+        """Test that merging shard indexes equals indexing the whole corpus."""
+        analyzer = Analyzer()
+        whole = analyzer.build_document_frequency_index(CORPUS)
+        merged = analyzer.build_document_frequency_index(CORPUS[:2])
+        merged.merge(analyzer.build_document_frequency_index(CORPUS[2:]))
+        
+        assert merged.document_count == whole.document_count == len(CORPUS)
+        assert merged.version == whole.version
+        assert merged.document_frequency("محصول") == 3
+    
+    def test_version_changes_with_counts(self):
+        """Test that adding documents changes the index version."""
+        version = self.index.version
+        self.index.add_document(["عالی"])
+        
+        assert self.index.version != version
+    
+    def test_rejects_other_files(self, tmp_path):
+        """Test that files without the index header are rejected."""
+        path = tmp_path / "other.lxdf"
+        path.write_bytes(b"not an index" * 10)
+        
+        with pytest.raises(ValueError, match="not a LexiMood document frequency index"):
+            DocumentFrequencyIndex.load(str(path))
+    
+    def test_weights_require_counts(self):
+        """Test that weights cannot be created without document counts and frequencies."""
+        with pytest.raises(TypeError):
+            DocumentFrequencyWeights()
+    
+    def test_build_skips_empty_texts(self):
+        """Test that blank corpus entries are not counted as documents."""
+        index = Analyzer().build_document_frequency_index(["", "   ", "محصول خوب"])
+        
+        assert index.document_count == 1
+
+
+class TestCorpusKeywordWeighting:
+    """Test cases for keyword extraction weighted by corpus statistics."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.index = DocumentFrequencyIndex()
+        for _ in range(9):
+            self.index.add_document(["محصول", "ارسال"])
+        self.index.add_document(["محصول", "کیفیت"])
+        self.document = TokenizedDocument.from_text("محصول محصول کیفیت")
+    
+    @pytest.mark.parametrize("weighting", [KeywordWeighting.TF_IDF, KeywordWeighting.BM25])
+    def test_rare_words_outrank_common_words(self, weighting):
+        """Test that words rare in the corpus rank above frequent ones."""
+        extractor = KeywordExtractor(document_frequency_index=self.index, weighting=weighting)
+        
+        assert extractor.extract_from_document(self.document) == ["کیفیت", "محصول"]
+    
+    def test_without_index_uses_approximation(self):
+        """Test that extraction without an index keeps the corpus-free weighting."""
+        assert KeywordExtractor().extract_from_document(self.document) == ["محصول", "کیفیت"]
+    
+    def test_analyzer_loads_index_from_config(self, tmp_path):
+        """Test that analyzers weight keywords with the configured index file."""
+        path = str(tmp_path / "corpus.lxdf")
+        self.index.save(path)
+        
+        analyzer = Analyzer(AnalysisConfig(document_frequency_index=path, keyword_weighting=KeywordWeighting.BM25))
+        
+        assert analyzer.keyword_extractor.document_frequency_index.version == self.index.version
+        assert analyzer.keyword_extractor.weighting == KeywordWeighting.BM25
+        assert analyzer.analyze("محصول محصول کیفیت").keywords == ["کیفیت", "محصول"]
+    
+    def test_streaming_uses_index(self, tmp_path):
+        """Test that streamed documents are weighted like whole texts."""
+        path = str(tmp_path / "corpus.lxdf")
+        self.index.save(path)
+        analyzer = Analyzer(AnalysisConfig(document_frequency_index=path))
+        
+        assert analyzer.analyze_stream(iter(["محصول محص", "ول کیفیت"])).keywords == ["کیفیت", "محصول"]
+
+
+class TestOnlineDocumentFrequencies:
+    """Test cases for sketched, decaying document frequencies."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.now = 0.0
+        self.frequencies = OnlineDocumentFrequencies(
+            width=1024, half_life=10.0, snapshot_interval=2, clock=lambda: self.now
+        )
+    
+    def test_counts_documents_without_decay(self):
+        """Test that estimates match exact counts for a small vocabulary."""
+        frequencies = OnlineDocumentFrequencies(width=1024, half_life=None, snapshot_interval=1)
+        frequencies.add_document(["محصول", "عالی", "محصول"])
+        frequencies.add_document(["محصول", "ارسال"])
+        
+        snapshot = frequencies.snapshot()
+        
+        assert snapshot.document_count == 2
+        assert snapshot.average_document_length == 2.5
+        assert snapshot.document_frequency("محصول") == 2
+        assert snapshot.document_frequency("عالی") == 1
+        assert snapshot.document_frequency("ناشناخته") == 0
+    
+    def test_counts_decay_with_half_life(self):
+        """Test that older documents weigh exponentially less."""
+        self.frequencies.add_document(["قدیمی"])
+        self.now = 10.0
+        self.frequencies.add_document(["جدید"])
+        
+        snapshot = self.frequencies.snapshot()
+        
+        assert snapshot.document_count == pytest.approx(1.5)
+        assert snapshot.document_frequency("قدیمی") == pytest.approx(0.5)
+        assert snapshot.document_frequency("جدید") == pytest.approx(1.0)
+    
+    def test_rescaling_keeps_relative_weights(self):
+        """Test that counters are rescaled before the decay factor overflows."""
+        self.frequencies.add_document(["قدیمی"])
+        self.now = 10.0 * 70
+        self.frequencies.add_document(["جدید"])
+        
+        snapshot = self.frequencies.publish()
+        
+        assert snapshot.document_count == pytest.approx(1.0)
+        assert snapshot.document_frequency("جدید") == pytest.approx(1.0)
+        assert snapshot.document_frequency("قدیمی") < 1e-20
+    
+    def test_snapshots_are_isolated_from_updates(self):
+        """Test that published snapshots do not change and are refreshed periodically."""
+        self.frequencies.add_document(["محصول"])
+        first = self.frequencies.snapshot()
+        self.frequencies.add_document(["محصول"])
+        
+        assert first.document_count == 0
+        second = self.frequencies.snapshot()
+        assert second is not first
+        assert second.document_frequency("محصول") == 2
+        assert first.document_frequency("محصول") == 0
+        assert self.frequencies.snapshot() is second
+    
+    def test_memory_is_bounded(self):
+        """Test that the sketch size does not grow with the vocabulary."""
+        memory_size = self.frequencies.memory_size
+        for number in range(5000):
+            self.frequencies.add_document([f"واژه{number}"])
+        self.frequencies.publish()
+        
+        assert self.frequencies.memory_size == memory_size
+    
+    def test_concurrent_updates_and_reads(self):
+        """Test that snapshots can be read while other threads add documents."""
+        frequencies = OnlineDocumentFrequencies(width=1024, half_life=None, snapshot_interval=10)
+        
+        def add_documents():
+            for _ in range(500):
+                frequencies.add_document(["محصول"])
+                frequencies.snapshot().idf("محصول")
+        
+        threads = [threading.Thread(target=add_documents) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        snapshot = frequencies.publish()
+        assert snapshot.document_count == 2000
+        assert snapshot.document_frequency("محصول") == 2000
+    
+    @pytest.mark.parametrize("options,message", [
+        ({"width": 0}, "width must be at least 1"),
+        ({"depth": 0}, "depth must be at least 1"),
+        ({"half_life": 0}, "half_life must be positive"),
+        ({"snapshot_interval": 0}, "snapshot_interval must be at least 1"),
+    ])
+    def test_invalid_options(self, options, message):
+        """Test that invalid sketch options are rejected."""
+        with pytest.raises(ValueError, match=message):
+            OnlineDocumentFrequencies(**options)
+    
+    def test_extractor_learns_from_extracted_documents(self):
+        """Test that online extraction updates frequencies and weights rare words higher."""
+        frequencies = OnlineDocumentFrequencies(width=1024, snapshot_interval=1)
+        extractor = KeywordExtractor(online_document_frequencies=frequencies)
+        for _ in range(9):
+            extractor.extract_from_document(TokenizedDocument.from_text("محصول ارسال"))
+        
+        keywords = extractor.extract_from_document(TokenizedDocument.from_text("محصول محصول کیفیت"))
+        
+        assert keywords == ["کیفیت", "محصول"]
+        assert frequencies.snapshot().document_count == pytest.approx(10, rel=1e-3)
+    
+    def test_analyzer_online_mode(self):
+        """Test enabling online keyword weighting through the configuration."""
+        analyzer = Analyzer(AnalysisConfig(online_keyword_weighting=True, document_frequency_half_life=None))
+        analyzer.analyze_texts(["محصول ارسال", "محصول سریع", "محصول قیمت", "محصول رنگ", "محصول بسته", "محصول کیفیت"])
+        
+        frequencies = analyzer.keyword_extractor.online_document_frequencies
+        assert frequencies.publish().document_frequency("محصول") == 6
+        assert analyzer.analyze("محصول محصول کیفیت").keywords == ["کیفیت", "محصول"]
+    
+    def test_online_mode_rejects_result_cache(self):
+        """Test that cached results cannot be combined with drifting statistics."""
+        with pytest.raises(ValueError, match="result_cache cannot be used with online_keyword_weighting"):
+            Analyzer(AnalysisConfig(online_keyword_weighting=True), result_cache=ResultCache())
\ No newline at end of file
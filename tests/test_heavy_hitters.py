@@ -0,0 +1,154 @@
+"""
+Tests for the heavy-hitter keyword aggregation module.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import io
+import pytest
+from collections import Counter
+from leximood.analyzer import Analyzer
+from leximood.cache import ResultCache
+from leximood.heavy_hitters import HeavyHitter, KeywordAggregator, MisraGriesSummary
+from leximood.models import SentimentLabel, TokenizedDocument
+
+
+def skewed_stream():
+    """Return a stream of words with a few frequent words and a long tail."""
+    words = []
+    for number in range(300):
+        words.extend(["محصول"] * 5 + ["ارسال"] * 3 + ["کیفیت"] * 2 + [f"واژه{number}"])
+    return words
+
+
+class TestMisraGriesSummary:
+    """Test cases for the Misra-Gries frequency summary."""
+    
+    def test_counts_are_exact_below_capacity(self):
+        """Test that counts are exact while the vocabulary fits the summary."""
+        summary = MisraGriesSummary(capacity=10)
+        summary.add_counts({"محصول": 3, "ارسال": 1})
+        summary.add("محصول")
+        
+        assert summary.top(2) == [HeavyHitter("محصول", 4, 0), HeavyHitter("ارسال", 1, 0)]
+        assert summary.total == 5
+        assert summary.error == 0
+    
+    def test_error_bounds_hold_for_long_tails(self):
+        """Test that estimates stay within the reported error of the true counts."""
+        words = skewed_stream()
+        summary = MisraGriesSummary(capacity=5)
+        for word in words:
+            summary.add(word)
+        
+        exact = Counter(words)
+        assert len(summary) <= 2 * summary.capacity
+        assert summary.error <= summary.total / (summary.capacity + 1)
+        for word, count in exact.items():
+            assert summary.estimate(word) <= count <= summary.estimate(word) + summary.error
+        assert [heavy_hitter.word for heavy_hitter in summary.top(3)] == ["محصول", "ارسال", "کیفیت"]
+    
+    def test_merged_summaries_keep_error_bounds(self):
+        """Test that summaries built on separate shards can be merged."""
+        words = skewed_stream()
+        shards = [MisraGriesSummary(capacity=5) for _ in range(3)]
+        for position, word in enumerate(words):
+            shards[position % 3].add(word)
+        
+        merged = MisraGriesSummary(capacity=5)
+        for shard in shards:
+            merged.merge(shard)
+        merged.compact()
+        
+        exact = Counter(words)
+        assert merged.total == len(words)
+        assert len(merged) <= merged.capacity
+        for word, count in exact.items():
+            assert merged.estimate(word) <= count <= merged.estimate(word) + merged.error
+        assert merged.top(1)[0].word == "محصول"
+    
+    def test_invalid_capacity(self):
+        """Test that capacities below the minimum are rejected."""
+        with pytest.raises(ValueError, match="capacity must be at least 1"):
+            MisraGriesSummary(capacity=0)
+
+
+class TestKeywordAggregator:
+    """Test cases for corpus keyword aggregation per sentiment."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.texts = [
+            "این محصول عالی است و محصول خوب است",
+            "ارسال محصول بد بود",
+            "امروز هوا معمولی است",
+            "این محصول عالی است و محصول خوب است",
+        ]
+        self.analyzer = Analyzer()
+    
+    def test_aggregates_batch_analysis_by_sentiment(self):
+        """Test that batch analysis feeds word counts under each result's sentiment."""
+        aggregator = KeywordAggregator()
+        results = self.analyzer.analyze_texts(self.texts, batch_size=3, keyword_aggregator=aggregator)
+        
+        expected = {label: Counter() for label in SentimentLabel}
+        for text, result in zip(self.texts, results):
+            words = [word for word in text.split() if word not in ("این", "است", "و", "بود")]
+            expected[result.sentiment].update(words)
+        
+        for label in SentimentLabel:
+            assert dict((word, count) for word, count, _ in aggregator.top(100, label)) == dict(expected[label])
+            assert aggregator.document_counts[label] == sum(result.sentiment == label for result in results)
+        assert aggregator.top(1)[0] == HeavyHitter("محصول", 5, 0)
+    
+    def test_batch_texts_are_tokenized_once(self, monkeypatch):
+        """Test that aggregation reuses computed documents and tokenizes only cached texts again."""
+        tokenized_texts = []
+        
+        def counting(tokenize):
+            def counting_tokenize(text):
+                tokenized_texts.append(text)
+                return tokenize(text)
+            return counting_tokenize
+        
+        monkeypatch.setattr(TokenizedDocument, "from_text", counting(TokenizedDocument.from_text))
+        monkeypatch.setattr(
+            TokenizedDocument, "from_text_with_sentences", counting(TokenizedDocument.from_text_with_sentences)
+        )
+        analyzer = Analyzer(result_cache=ResultCache())
+        
+        analyzer.analyze_texts(self.texts, keyword_aggregator=KeywordAggregator())
+        assert len(tokenized_texts) == len(set(self.texts))
+        
+        tokenized_texts.clear()
+        aggregator = KeywordAggregator()
+        analyzer.analyze_texts(self.texts, keyword_aggregator=aggregator)
+        assert len(tokenized_texts) == len(set(self.texts))
+        assert aggregator.top(1)[0] == HeavyHitter("محصول", 5, 0)
+    
+    def test_aggregates_streamed_documents(self):
+        """Test that streaming analysis feeds the document's word counts."""
+        aggregator = KeywordAggregator()
+        result = self.analyzer.analyze_stream(io.StringIO(self.texts[0]), 4, aggregator)
+        
+        assert aggregator.top(2, result.sentiment) == [HeavyHitter("محصول", 2, 0), HeavyHitter("عالی", 1, 0)]
+    
+    def test_merge_combines_workers(self):
+        """Test that aggregators from separate workers merge into corpus totals."""
+        first = KeywordAggregator()
+        second = KeywordAggregator()
+        self.analyzer.analyze_batch(self.texts[:2], keyword_aggregator=first)
+        self.analyzer.analyze_batch(self.texts[2:], keyword_aggregator=second)
+        
+        first.merge(second)
+        
+        assert sum(first.document_counts.values()) == len(self.texts)
+        assert first.top(1)[0] == HeavyHitter("محصول", 5, 0)
+    
+    def test_top_by_sentiment_reports_every_label(self):
+        """Test that reports contain every sentiment label."""
+        aggregator = KeywordAggregator()
+        
+        assert aggregator.top_by_sentiment(10) == {label: [] for label in SentimentLabel}
\ No newline at end of file
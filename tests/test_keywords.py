@@ -8,6 +8,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 import pytest
 from leximood.keywords import KeywordExtractor
+from leximood.models import TokenizedDocument
 
 
 class TestKeywordExtractor:
@@ -22,7 +23,7 @@ class TestKeywordExtractor:
         assert self.extractor is not None
         assert hasattr(self.extractor, 'sentiment_words')
         assert hasattr(self.extractor, 'stop_words')
-        assert isinstance(self.extractor.sentiment_words, set)
+        assert isinstance(self.extractor.sentiment_words, frozenset)
         assert len(self.extractor.sentiment_words) > 0
     
     def test_extract_empty_text(self):
@@ -157,7 +158,7 @@ class TestKeywordExtractor:
         """Test that sentiment words are loaded correctly."""
         sentiment_words = self.extractor._load_sentiment_words()
         
-        assert isinstance(sentiment_words, set)
+        assert isinstance(sentiment_words, frozenset)
         assert len(sentiment_words) > 0
         
         # Check that we have both positive and negative words
@@ -192,4 +193,11 @@ class TestKeywordExtractor:
             keywords = self.extractor.extract(text, max_keywords=5)
             assert isinstance(keywords, list)
             assert len(keywords) <= 5
-            assert all(isinstance(keyword, str) for keyword in keywords) 
\ No newline at end of file
+            assert all(isinstance(keyword, str) for keyword in keywords) 
+    
+    def test_extract_from_document_matches_text(self):
+        """Test that extracting from a tokenized document matches extracting from text."""
+        text = "امروز خیلی خوشحالم چون کار مهمی تمام کردم"
+        document = TokenizedDocument.from_text(text)
+        
+        assert self.extractor.extract_from_document(document, 3) == self.extractor.extract(text, 3)
\ No newline at end of file
@@ -0,0 +1,214 @@
+"""
+Tests for the shared lexicon store.
+"""
+
+import sys
+import os
+import json
+import threading
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pytest
+from leximood.analyzer import Analyzer
+from leximood.lexicon import LexiconStore, CompiledLexicon, compile_lexicon, main
+from leximood.models import SentimentLabel
+from leximood.resources import ResourceRegistry
+
+
+class TestLexiconStore:
+    """Test cases for the lexicon store."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.lexicon = {
+            "positive_words": {"خوب": 0.6, "عالی": 0.9, "مبهم": 0.2},
+            "negative_words": {"بد": -0.6, "مبهم": -0.3}
+        }
+    
+    def create_store(self, tmp_path):
+        """Write the fixture lexicon and return a store over it."""
+        path = tmp_path / "lexicon.json"
+        path.write_text(json.dumps(self.lexicon, ensure_ascii=False), encoding="utf-8")
+        return LexiconStore(str(path))
+    
+    def test_store_loads_lazily(self, tmp_path):
+        """Test that the file is not read until first use."""
+        store = self.create_store(tmp_path)
+        
+        assert store._scores is None
+        assert store.score("خوب") == 0.6
+        assert store._scores is not None
+    
+    def test_merged_scores(self, tmp_path):
+        """Test that positive and negative words share one score map."""
+        store = self.create_store(tmp_path)
+        
+        assert store.score("عالی") == 0.9
+        assert store.score("بد") == -0.6
+        assert store.score("ناشناخته") == 0.0
+        assert len(store) == 4
+    
+    def test_positive_score_wins_for_duplicate_words(self, tmp_path):
+        """Test that words listed in both lists keep their positive score."""
+        store = self.create_store(tmp_path)
+        
+        assert store.score("مبهم") == 0.2
+    
+    def test_sentiment_words_is_frozenset(self, tmp_path):
+        """Test the sentiment word set."""
+        store = self.create_store(tmp_path)
+        
+        assert store.sentiment_words == frozenset({"خوب", "عالی", "مبهم", "بد"})
+        assert "خوب" in store
+        assert "کتاب" not in store
+    
+    def test_as_lexicon_dict_splits_by_sign(self, tmp_path):
+        """Test the positive/negative view of the merged map."""
+        store = self.create_store(tmp_path)
+        lexicon = store.as_lexicon_dict()
+        
+        assert lexicon["positive_words"] == {"خوب": 0.6, "عالی": 0.9, "مبهم": 0.2}
+        assert lexicon["negative_words"] == {"بد": -0.6}
+    
+    def test_missing_file_gives_empty_store(self, tmp_path):
+        """Test that a missing lexicon file yields an empty store."""
+        store = LexiconStore(str(tmp_path / "missing.json"))
+        
+        assert len(store) == 0
+        assert store.sentiment_words == frozenset()
+    
+    def test_concurrent_first_access_loads_once(self, tmp_path, monkeypatch):
+        """Test that concurrent readers trigger a single file read."""
+        store = self.create_store(tmp_path)
+        reads = []
+        original_read = store._read_lexicon_bytes
+        
+        def counting_read():
+            reads.append(1)
+            return original_read()
+        
+        monkeypatch.setattr(store, "_read_lexicon_bytes", counting_read)
+        barrier = threading.Barrier(8)
+        
+        def worker():
+            barrier.wait()
+            store.score("خوب")
+        
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert len(reads) == 1
+
+
+class TestCompiledLexicon:
+    """Test cases for the compiled, memory-mapped lexicon."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.lexicon = {
+            "positive_words": {"خوب": 0.5, "عالی": 0.75, "مبهم": 0.25},
+            "negative_words": {"بد": -0.5, "مبهم": -0.25, "وحشتناک": -1.0}
+        }
+    
+    def write_lexicon(self, tmp_path):
+        """Write the fixture lexicon to a JSON file."""
+        path = tmp_path / "lexicon.json"
+        path.write_text(json.dumps(self.lexicon, ensure_ascii=False), encoding="utf-8")
+        return path
+    
+    def test_compiled_lookups_match_json(self, tmp_path):
+        """Test that every word scores the same as in the JSON lexicon."""
+        source = self.write_lexicon(tmp_path)
+        entry_count = compile_lexicon(str(source))
+        compiled = CompiledLexicon(str(tmp_path / "lexicon.lxm"))
+        expected = LexiconStore(str(source)).scores
+        
+        assert entry_count == len(expected) == len(compiled)
+        for word, score in expected.items():
+            assert compiled.get(word) == score
+            assert word in compiled
+        assert set(compiled) == set(expected)
+        compiled.close()
+    
+    def test_missing_words(self, tmp_path):
+        """Test lookups of words not in the lexicon."""
+        compile_lexicon(str(self.write_lexicon(tmp_path)))
+        compiled = CompiledLexicon(str(tmp_path / "lexicon.lxm"))
+        
+        assert compiled.get("کتاب", 0.0) == 0.0
+        assert "کتاب" not in compiled
+        with pytest.raises(KeyError):
+            compiled["کتاب"]
+        compiled.close()
+    
+    def test_empty_lexicon(self, tmp_path):
+        """Test compiling a lexicon without entries."""
+        source = tmp_path / "lexicon.json"
+        source.write_text("{}", encoding="utf-8")
+        compile_lexicon(str(source))
+        compiled = CompiledLexicon(str(tmp_path / "lexicon.lxm"))
+        
+        assert len(compiled) == 0
+        assert compiled.get("خوب") is None
+        compiled.close()
+    
+    def test_rejects_non_lexicon_files(self, tmp_path):
+        """Test that arbitrary files are not accepted."""
+        path = tmp_path / "other.lxm"
+        path.write_bytes(b"\x00" * 64)
+        
+        with pytest.raises(ValueError, match="not a compiled LexiMood lexicon"):
+            CompiledLexicon(str(path))
+    
+    def test_store_prefers_current_compiled_lexicon(self, tmp_path):
+        """Test that the store memory-maps an up-to-date compiled lexicon."""
+        source = self.write_lexicon(tmp_path)
+        json_version = LexiconStore(str(source)).version
+        compile_lexicon(str(source))
+        store = LexiconStore(str(source))
+        
+        assert isinstance(store.scores, CompiledLexicon)
+        assert store.version == json_version
+        assert store.score("عالی") == 0.75
+        assert "بد" in store.sentiment_words
+    
+    def test_compiled_and_json_lexicons_analyze_alike(self, tmp_path):
+        """Test that compiled scores keep full precision, even on a label threshold."""
+        self.lexicon = {"positive_words": {"خوب": 0.6}, "negative_words": {"بد": -0.9}}
+        (tmp_path / "persian_sentiment_lexicon.json").write_text(
+            json.dumps(self.lexicon, ensure_ascii=False), encoding="utf-8"
+        )
+        texts = ["خوب خوب بد", "خوب", "بد بد خوب"]
+        expected = Analyzer(registry=ResourceRegistry(str(tmp_path))).analyze_texts(texts)
+        compile_lexicon(str(tmp_path / "persian_sentiment_lexicon.json"))
+        
+        registry = ResourceRegistry(str(tmp_path))
+        
+        assert isinstance(registry.lexicon_store().scores, CompiledLexicon)
+        assert Analyzer(registry=registry).analyze_texts(texts) == expected
+        assert expected[0].score == pytest.approx(0.1)
+        assert expected[0].sentiment == SentimentLabel.NEUTRAL
+    
+    def test_store_ignores_stale_compiled_lexicon(self, tmp_path):
+        """Test that a compiled lexicon older than its source is not used."""
+        source = self.write_lexicon(tmp_path)
+        compile_lexicon(str(source))
+        compiled_path = tmp_path / "lexicon.lxm"
+        source_mtime = os.path.getmtime(source)
+        os.utime(compiled_path, (source_mtime - 10, source_mtime - 10))
+        
+        store = LexiconStore(str(source))
+        
+        assert isinstance(store.scores, dict)
+    
+    def test_compile_command(self, tmp_path, capsys):
+        """Test the compile command line entry point."""
+        source = self.write_lexicon(tmp_path)
+        output = tmp_path / "custom.lxm"
+        
+        assert main(["compile", "--input", str(source), "--output", str(output)]) == 0
+        assert "Compiled 5 entries" in capsys.readouterr().out
+        assert len(CompiledLexicon(str(output))) == 5
\ No newline at end of file
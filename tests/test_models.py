@@ -7,7 +7,7 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 import pytest
-from leximood.models import AnalysisResult, SentimentLabel
+from leximood.models import AnalysisResult, SentenceResult, SentimentLabel, TokenizedDocument
 
 
 class TestAnalysisResult:
@@ -100,6 +100,47 @@ class TestAnalysisResult:
         assert "AnalysisResult" in str_repr
         assert "neutral" in str_repr
         assert "0.000" in str_repr
+    
+    def test_to_dict_with_sentences(self):
+        """Test that sentence results are serialized only when present."""
+        sentence = SentenceResult(text="عالی بود.", sentiment=SentimentLabel.POSITIVE, score=0.9)
+        result = AnalysisResult(
+            sentiment=SentimentLabel.POSITIVE,
+            score=0.9,
+            keywords=[],
+            confidence=0.9,
+            text="عالی بود.",
+            analysis_level="sentence",
+            sentences=[sentence]
+        )
+        
+        assert result.to_dict()["sentences"] == [{"text": "عالی بود.", "sentiment": "positive", "score": 0.9}]
+        assert "sentences" not in AnalysisResult(
+            sentiment=SentimentLabel.NEUTRAL, score=0.0, keywords=[], confidence=0.0,
+            text="متن", analysis_level="document"
+        ).to_dict()
+    
+    def test_from_trusted_values(self):
+        """Test the internal constructor that skips validation of already clamped values."""
+        result = AnalysisResult.from_trusted_values(
+            SentimentLabel.NEGATIVE, -0.4, ["بد"], 0.6, "", "document", []
+        )
+        
+        assert result == AnalysisResult(
+            sentiment=SentimentLabel.NEGATIVE, score=-0.4, keywords=["بد"], confidence=0.6,
+            text="", analysis_level="document"
+        )
+    
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots require Python 3.10")
+    def test_results_use_slots(self):
+        """Test that results do not carry a per-instance dictionary."""
+        result = AnalysisResult.from_trusted_values(
+            SentimentLabel.NEUTRAL, 0.0, [], 0.0, "", "document", []
+        )
+        
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(AttributeError):
+            result.extra = True
 
 
 class TestSentimentLabel:
@@ -109,4 +150,57 @@ class TestSentimentLabel:
         """Test sentiment label values."""
         assert SentimentLabel.POSITIVE.value == "positive"
         assert SentimentLabel.NEGATIVE.value == "negative"
-        assert SentimentLabel.NEUTRAL.value == "neutral" 
\ No newline at end of file
+        assert SentimentLabel.NEUTRAL.value == "neutral"
+
+
+class TestTokenizedDocument:
+    """Test cases for TokenizedDocument class."""
+    
+    def test_from_text(self):
+        """Test tokenizing a document."""
+        document = TokenizedDocument.from_text("امروز خیلی خوشحالم! فردا؟")
+        
+        assert document.tokens == ["امروز", "خیلی", "خوشحالم", "فردا"]
+        assert document.lowered_tokens == document.tokens
+        assert len(document) == 4
+    
+    def test_lowered_tokens(self):
+        """Test that lowercased tokens stay aligned with tokens."""
+        document = TokenizedDocument.from_text("Good متن BAD")
+        
+        assert document.tokens == ["Good", "متن", "BAD"]
+        assert document.lowered_tokens == ["good", "متن", "bad"]
+    
+    def test_offsets(self):
+        """Test that offsets point at each token in the text."""
+        text = "سلام،  دنیا! Hello"
+        document = TokenizedDocument.from_text(text)
+        
+        assert document.offsets == [0, 7, 13]
+        for token, offset in zip(document.tokens, document.offsets):
+            assert text[offset:offset + len(token)] == token
+    
+    def test_empty_document(self):
+        """Test tokenizing empty text."""
+        document = TokenizedDocument.from_text("")
+        
+        assert document.tokens == []
+        assert document.offsets == []
+    
+    def test_from_text_with_sentences(self):
+        """Test splitting a document into sentences while tokenizing it."""
+        text = "سلام دنیا! حال شما خوب است؟ بله."
+        document = TokenizedDocument.from_text_with_sentences(text)
+        
+        assert document.tokens == TokenizedDocument.from_text(text).tokens
+        assert [(span.token_start, span.token_end) for span in document.sentences] == [(0, 2), (2, 6), (6, 7)]
+        assert [document.sentence_text(span) for span in document.sentences] == [
+            "سلام دنیا!", "حال شما خوب است؟", "بله."
+        ]
+    
+    def test_sentences_without_words_are_merged(self):
+        """Test that repeated terminators and leading punctuation do not create empty sentences."""
+        document = TokenizedDocument.from_text_with_sentences("!!! عالی بود!!! واقعا")
+        
+        assert [document.sentence_text(span) for span in document.sentences] == ["عالی بود!!!", "واقعا"]
+        assert TokenizedDocument.from_text_with_sentences("...").sentences == []
\ No newline at end of file
@@ -0,0 +1,102 @@
+"""
+Tests for the parallel analysis module.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pytest
+from leximood.analyzer import Analyzer
+from leximood.config import AnalysisConfig
+from leximood.heavy_hitters import KeywordAggregator
+from leximood.parallel import ParallelAnalyzer, analyze_many
+
+
+class TestParallelAnalyzer:
+    """Test cases for multi-process analysis."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.texts = [
+            "امروز خیلی خوشحالم",
+            "دیروز ناراحت بودم",
+            "این محصول عالی است",
+            "خدمات بد بود",
+            "امروز هوا معمولی است",
+        ] * 4
+    
+    def test_results_match_sequential_analysis(self):
+        """Test that worker processes produce the same results in input order."""
+        expected = Analyzer().analyze_texts(self.texts)
+        
+        with ParallelAnalyzer(workers=2, chunk_size=3) as parallel_analyzer:
+            results = parallel_analyzer.analyze_many(self.texts)
+        
+        assert results == expected
+    
+    def test_analyze_batch_matches_sequential_analysis(self):
+        """Test that parallel batch analysis returns the rows in input order."""
+        expected = Analyzer().analyze_batch(self.texts)
+        
+        with ParallelAnalyzer(workers=2, chunk_size=3) as parallel_analyzer:
+            batch = parallel_analyzer.analyze_batch(self.texts)
+        
+        assert batch.scores.tolist() == expected.scores.tolist()
+        assert batch.label_codes.tolist() == expected.label_codes.tolist()
+        assert [batch.keywords(index) for index in range(len(batch))] == [
+            expected.keywords(index) for index in range(len(expected))
+        ]
+    
+    def test_keyword_aggregators_are_merged_from_workers(self):
+        """Test that keyword summaries built in workers are merged in the parent."""
+        expected = KeywordAggregator()
+        Analyzer().analyze_texts(self.texts, keyword_aggregator=expected)
+        
+        aggregator = KeywordAggregator()
+        with ParallelAnalyzer(workers=2, chunk_size=3) as parallel_analyzer:
+            parallel_analyzer.analyze_many(self.texts, aggregator)
+        
+        assert aggregator.document_counts == expected.document_counts
+        assert aggregator.top_by_sentiment(10) == expected.top_by_sentiment(10)
+    
+    def test_pool_is_reused_across_calls(self):
+        """Test that the worker pool is started once and reused."""
+        with ParallelAnalyzer(workers=2, chunk_size=4) as parallel_analyzer:
+            first = parallel_analyzer.analyze_many(self.texts)
+            pool = parallel_analyzer._pool
+            second = parallel_analyzer.analyze_many(iter(self.texts))
+            
+            assert parallel_analyzer._pool is pool
+        
+        assert first == second
+        assert parallel_analyzer._pool is None
+    
+    def test_single_worker_runs_in_process(self):
+        """Test that one worker does not start a process pool."""
+        parallel_analyzer = ParallelAnalyzer(workers=1)
+        results = parallel_analyzer.analyze_many(self.texts)
+        
+        assert len(results) == len(self.texts)
+        assert parallel_analyzer._pool is None
+    
+    def test_config_is_applied_in_workers(self):
+        """Test that worker analyzers use the given configuration."""
+        config = AnalysisConfig(include_keywords=False)
+        results = analyze_many(self.texts, config=config, workers=2, chunk_size=5)
+        
+        assert len(results) == len(self.texts)
+        assert all(result.keywords == [] for result in results)
+    
+    def test_worker_errors_are_raised(self):
+        """Test that invalid input in a worker surfaces to the caller."""
+        with pytest.raises(ValueError, match="Text cannot be empty"):
+            analyze_many(["متن تست", ""], workers=2, chunk_size=1)
+    
+    def test_invalid_settings(self):
+        """Test validation of worker count and chunk size."""
+        with pytest.raises(ValueError, match="workers must be at least 1"):
+            ParallelAnalyzer(workers=-1)
+        
+        with pytest.raises(ValueError, match="chunk_size must be at least 1"):
+            ParallelAnalyzer(chunk_size=0)
\ No newline at end of file
@@ -4,12 +4,49 @@ Performance tests for LexiMood sentiment analysis system.
 
 import sys
 import os
+import re
 import time
+import timeit
 import random
+import tracemalloc
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import List
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 import pytest
 from leximood import analyze_text, AnalysisConfig
+from leximood.constants import SENTIMENT_SCORE_MIN, SENTIMENT_SCORE_MAX, CONFIDENCE_MIN, CONFIDENCE_MAX
+from leximood.keywords import KeywordExtractor
+from leximood.models import AnalysisResult, SentimentLabel
+from leximood.patterns import WORD_PATTERN, SENTENCE_SPLIT_PATTERN
+
+
+@dataclass
+class DictAnalysisResult:
+    sentiment: SentimentLabel
+    score: float
+    keywords: List[str]
+    confidence: float
+    text: str
+    analysis_level: str
+    sentences: list = field(default_factory=list)
+    
+    def __post_init__(self):
+        self._validate_score()
+        self._validate_confidence()
+    
+    def _validate_score(self):
+        if SENTIMENT_SCORE_MIN <= self.score <= SENTIMENT_SCORE_MAX:
+            return
+        
+        raise ValueError(f"score must be between {SENTIMENT_SCORE_MIN} and {SENTIMENT_SCORE_MAX}")
+    
+    def _validate_confidence(self):
+        if CONFIDENCE_MIN <= self.confidence <= CONFIDENCE_MAX:
+            return
+        
+        raise ValueError(f"confidence must be between {CONFIDENCE_MIN} and {CONFIDENCE_MAX}")
 
 
 class TestPerformance:
@@ -185,4 +222,90 @@ class TestPerformance:
         # Performance should scale reasonably with text length
         assert short_time < medium_time
         assert medium_time < long_time
-        assert long_time < 1.0  # Even long texts should process quickly 
\ No newline at end of file
+        assert long_time < 1.0  # Even long texts should process quickly 
+    
+    def test_precompiled_pattern_speed(self):
+        """Measure the per-call saving of module-level compiled patterns on short messages."""
+        chat_messages = ["سلام!", "خوبی؟", "مرسی عالی بود", "نه اصلاً", "باشه. فردا میام"]
+        sentence_source = SENTENCE_SPLIT_PATTERN.pattern
+        repetitions = 10000
+        
+        def tokenize_with_string_patterns():
+            for message in chat_messages:
+                re.findall(r'\b\w+\b', message)
+                re.split(sentence_source, message)
+        
+        def tokenize_with_compiled_patterns():
+            for message in chat_messages:
+                WORD_PATTERN.findall(message)
+                SENTENCE_SPLIT_PATTERN.split(message)
+        
+        string_time = min(timeit.repeat(tokenize_with_string_patterns, number=repetitions, repeat=3))
+        compiled_time = min(timeit.repeat(tokenize_with_compiled_patterns, number=repetitions, repeat=3))
+        
+        calls = repetitions * len(chat_messages) * 2
+        print(f"String pattern call: {string_time / calls * 1e9:.0f} ns")
+        print(f"Compiled pattern call: {compiled_time / calls * 1e9:.0f} ns")
+        print(f"Saving per call: {(string_time - compiled_time) / calls * 1e9:.0f} ns")
+    
+    def test_result_construction_memory_and_time(self):
+        """Compare per-result memory and construction time of dict-based and slotted results."""
+        count = 20000
+        keywords = ["خوشحالم", "عالی"]
+        
+        def build_dict_results():
+            return [
+                DictAnalysisResult(SentimentLabel.POSITIVE, 0.5, keywords, 0.7, "", "document")
+                for _ in range(count)
+            ]
+        
+        def build_slotted_results():
+            return [
+                AnalysisResult.from_trusted_values(SentimentLabel.POSITIVE, 0.5, keywords, 0.7, "", "document", [])
+                for _ in range(count)
+            ]
+        
+        def measure_memory(build):
+            tracemalloc.start()
+            results = build()
+            allocated = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            return allocated / len(results)
+        
+        dict_bytes = measure_memory(build_dict_results)
+        slotted_bytes = measure_memory(build_slotted_results)
+        dict_time = min(timeit.repeat(build_dict_results, number=1, repeat=5)) / count
+        slotted_time = min(timeit.repeat(build_slotted_results, number=1, repeat=5)) / count
+        
+        print(f"Dict-based result: {dict_bytes:.0f} bytes, {dict_time * 1e9:.0f} ns")
+        print(f"Slotted result: {slotted_bytes:.0f} bytes, {slotted_time * 1e9:.0f} ns")
+        
+        if sys.version_info >= (3, 10):
+            assert slotted_bytes < dict_bytes
+    
+    def test_keyword_selection_tweets_and_articles(self):
+        """Compare full-sort and bounded-heap keyword selection on tweets and long articles."""
+        extractor = KeywordExtractor()
+        random.seed(7)
+        vocabulary = [f"واژه{index}" for index in range(3000)]
+        tweets = [Counter(random.choices(vocabulary, k=10)) for _ in range(1000)]
+        articles = [Counter(random.choices(vocabulary, k=10000)) for _ in range(5)]
+        
+        def select_by_full_sort(word_counts):
+            scores = dict(extractor._score_keywords(word_counts, sum(word_counts.values())))
+            return [word for word, score in sorted(scores.items(), key=lambda item: item[1], reverse=True)[:5]]
+        
+        for word_counts in tweets[:50] + articles:
+            assert extractor.extract_from_counts(word_counts) == select_by_full_sort(word_counts)
+        
+        def measure(select, documents, repetitions):
+            elapsed = min(timeit.repeat(lambda: [select(c) for c in documents], number=repetitions, repeat=3))
+            return elapsed / (repetitions * len(documents))
+        
+        tweet_time = measure(extractor.extract_from_counts, tweets, 5)
+        sorted_article_time = measure(select_by_full_sort, articles, 3)
+        heap_article_time = measure(extractor.extract_from_counts, articles, 3)
+        
+        print(f"Tweet keywords (10 tokens): {tweet_time * 1e6:.1f} us")
+        print(f"Article keywords with full sort (10k tokens): {sorted_article_time * 1e3:.2f} ms")
+        print(f"Article keywords with bounded heap (10k tokens): {heap_article_time * 1e3:.2f} ms")
\ No newline at end of file
@@ -238,4 +238,61 @@ class TestTextPreprocessor:
             # Should not contain control characters
             assert "\u200b" not in processed
             assert "\u200c" not in processed
-            assert "\u200d" not in processed 
\ No newline at end of file
+            assert "\u200d" not in processed
+    
+    def test_normalize_text_exact_output(self):
+        """Test that single-pass normalization produces the expected strings."""
+        test_cases = [
+            ("  اليوم  ،  كتير\tخوب   است  ! ", "الیوم، کتیر خوب است!"),
+            ("متن\u200bتست\u200cبا\u200dکاراکترهای\u200eمخفی\u200f", "متنتستباکاراکترهایمخفی"),
+            ("عَدَد ۱۲۳ و ١٢٣ است .", "عدد و است."),
+            ("سلام\x0bدنیا\x0cو\x1fآخر\x7f", "سلامدنیاوآخر"),
+            ("خط اول\nخط دوم\r\n\u3000خط سوم :  پایان ؛", "خط اول خط دوم خط سوم: پایان؛"),
+        ]
+        
+        for text, expected in test_cases:
+            assert self.preprocessor.normalize_text(text) == expected
+    
+    def test_tokenize_document(self):
+        """Test producing a tokenized document from raw text."""
+        document = self.preprocessor.tokenize_document("  اليوم  ،  كتير خوب ")
+        
+        assert document.text == "الیوم، کتیر خوب"
+        assert document.tokens == ["الیوم", "کتیر", "خوب"]
+        
+        assert self.preprocessor.tokenize_document("   ").tokens == []
+    
+    def test_tokenize_document_with_sentences(self):
+        """Test that sentence spans are produced on request, also for preprocessed text."""
+        document = self.preprocessor.tokenize_document("خوب بود .  بد بود", with_sentences=True)
+        
+        assert document.text == "خوب بود. بد بود"
+        assert [document.sentence_text(span) for span in document.sentences] == ["خوب بود.", "بد بود"]
+        assert self.preprocessor.tokenize_preprocessed(document.text, with_sentences=True) == document
+        assert self.preprocessor.tokenize_preprocessed(document.text).sentences is None
+    
+    def test_rule_based_stemming_exact_output(self):
+        """Test that affix stripping produces the expected stems."""
+        test_cases = [
+            ("میخورند", "خورن"),
+            ("نمیدانستند", "دانست"),
+            ("کتابها", "کتاب"),
+            ("فرابرنامه", "برنام"),
+            ("خانه\u200cها", "خانه\u200cها"),
+            ("سلام", "سلام"),
+            ("هم", "هم"),
+        ]
+        
+        for word, expected in test_cases:
+            assert self.preprocessor.stem_words([word]) == [expected]
+    
+    def test_stem_words_memoizes_stems(self):
+        """Test that repeated words are stemmed once and served from the memo."""
+        words = ["کتابها", "کتابها", "میخورند", "کتابها"]
+        
+        stems = self.preprocessor.stem_words(words)
+        cache_info = self.preprocessor._cached_stem.cache_info()
+        
+        assert stems == ["کتاب", "کتاب", "خورن", "کتاب"]
+        assert cache_info.misses == 2
+        assert cache_info.hits == 2
\ No newline at end of file
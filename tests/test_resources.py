@@ -0,0 +1,136 @@
+"""
+Tests for the shared resource registry.
+"""
+
+import sys
+import os
+import json
+import threading
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pytest
+from leximood.resources import ResourceRegistry, get_resource_registry
+from leximood.sentiment import SentimentAnalyzer
+from leximood.keywords import KeywordExtractor
+from leximood.preprocessor import TextPreprocessor
+
+
+class TestResourceRegistry:
+    """Test cases for the resource registry."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.lexicon = {
+            "positive_words": {"خوب": 0.6, "عالی": 0.9},
+            "negative_words": {"بد": -0.6}
+        }
+        self.roots = {"رفت": ["رفتم", "رفتند"], "رو": ["رفتم", "میروم"]}
+    
+    def create_registry(self, tmp_path):
+        """Create a registry over a temporary data directory."""
+        (tmp_path / "persian_sentiment_lexicon.json").write_text(
+            json.dumps(self.lexicon, ensure_ascii=False), encoding="utf-8"
+        )
+        (tmp_path / "persian_roots.json").write_text(
+            json.dumps(self.roots, ensure_ascii=False), encoding="utf-8"
+        )
+        return ResourceRegistry(str(tmp_path))
+    
+    def test_loads_resources_from_data_directory(self, tmp_path):
+        """Test that resources are read from the configured directory."""
+        registry = self.create_registry(tmp_path)
+        
+        assert registry.lexicon_store().as_lexicon_dict() == self.lexicon
+        assert registry.lexicon_store().sentiment_words == {"خوب", "عالی", "بد"}
+        assert registry.persian_roots() == self.roots
+    
+    def test_resources_are_loaded_once(self):
+        """Test that a loader runs only on first access."""
+        registry = ResourceRegistry()
+        calls = []
+        
+        def loader():
+            calls.append(1)
+            return {"value": 1}
+        
+        first = registry.get("custom", loader)
+        second = registry.get("custom", loader)
+        
+        assert first is second
+        assert len(calls) == 1
+    
+    def test_concurrent_access_loads_once(self):
+        """Test that concurrent first access still runs the loader once."""
+        registry = ResourceRegistry()
+        calls = []
+        barrier = threading.Barrier(8)
+        
+        def loader():
+            calls.append(1)
+            return object()
+        
+        def worker(results):
+            barrier.wait()
+            results.append(registry.get("custom", loader))
+        
+        results = []
+        threads = [threading.Thread(target=worker, args=(results,)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+    
+    def test_clear_forces_reload(self, tmp_path):
+        """Test that clearing the registry reloads resources."""
+        registry = self.create_registry(tmp_path)
+        first = registry.lexicon_store()
+        registry.clear()
+        
+        assert registry.lexicon_store() is not first
+    
+    def test_missing_files_fall_back_to_empty_resources(self, tmp_path):
+        """Test that missing data files do not raise."""
+        registry = ResourceRegistry(str(tmp_path))
+        
+        assert registry.lexicon_store().as_lexicon_dict() == {"positive_words": {}, "negative_words": {}}
+        assert registry.lexicon_store().sentiment_words == frozenset()
+        assert registry.persian_roots() == {}
+    
+    def test_components_share_registry_resources(self, tmp_path):
+        """Test that components reuse the same loaded objects."""
+        registry = self.create_registry(tmp_path)
+        
+        first_analyzer = SentimentAnalyzer(registry)
+        second_analyzer = SentimentAnalyzer(registry)
+        extractor = KeywordExtractor(registry)
+        preprocessor = TextPreprocessor(registry)
+        
+        assert first_analyzer._lexicon_store is second_analyzer._lexicon_store
+        assert extractor.sentiment_words is registry.lexicon_store().sentiment_words
+        assert preprocessor._persian_roots is registry.persian_roots()
+        assert first_analyzer.analyze("خوب عالی") > 0
+    
+    def test_default_registry_is_shared(self):
+        """Test that components default to the process-wide registry."""
+        assert SentimentAnalyzer()._registry is get_resource_registry()
+        assert KeywordExtractor()._registry is get_resource_registry()
+    
+    def test_persian_root_index(self, tmp_path):
+        """Test the inflection to root index built from the roots file."""
+        registry = self.create_registry(tmp_path)
+        root_index = registry.persian_root_index()
+        
+        assert root_index == {"رفتم": "رفت", "رفتند": "رفت", "میروم": "رو"}
+        assert registry.persian_root_index() is root_index
+    
+    def test_preprocessor_uses_root_index(self, tmp_path):
+        """Test that stemming looks words up in the shared root index."""
+        registry = self.create_registry(tmp_path)
+        preprocessor = TextPreprocessor(registry)
+        
+        assert preprocessor.root_index is registry.persian_root_index()
+        assert preprocessor.stem_words(["رفتند", "میروم"]) == ["رفت", "رو"]
+        assert preprocessor._lookup_in_dictionary("کتاب") == ""
\ No newline at end of file
@@ -8,6 +8,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 import pytest
 from leximood.sentiment import SentimentAnalyzer
+from leximood.models import TokenizedDocument
 
 
 class TestSentimentAnalyzer:
@@ -174,4 +175,24 @@ class TestSentimentAnalyzer:
         
         assert isinstance(score, float)
         assert isinstance(label, str)
-        assert label in ["positive", "negative", "neutral"] 
\ No newline at end of file
+        assert label in ["positive", "negative", "neutral"]
+    
+    def test_analyze_document_matches_text(self):
+        """Test that analyzing a tokenized document matches analyzing its text."""
+        text = "امروز خیلی خوشحالم ولی دیروز ناراحت بودم"
+        document = TokenizedDocument.from_text(text)
+        
+        assert self.analyzer.analyze_document(document) == self.analyzer.analyze(text)
+    
+    def test_analyze_document_sentences_matches_document_score(self):
+        """Test that per-sentence scoring keeps the document score of a single pass."""
+        text = "امروز خیلی خوشحالم. ولی دیروز ناراحت بودم! فردا؟"
+        document = TokenizedDocument.from_text_with_sentences(text)
+        
+        document_score, sentence_scores = self.analyzer.analyze_document_sentences(document)
+        
+        assert document_score == self.analyzer.analyze(text)
+        assert len(sentence_scores) == 3
+        assert sentence_scores == [
+            self.analyzer.analyze(document.sentence_text(span)) for span in document.sentences
+        ]
\ No newline at end of file
@@ -0,0 +1,178 @@
+"""
+Tests for the analysis server module.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import asyncio
+import json
+import socket
+import pytest
+from leximood.analyzer import Analyzer
+from leximood.server import AnalysisServer
+
+
+async def send_request(reader, writer, method, path, payload=None, headers=""):
+    """Send one HTTP request and return the status code and decoded JSON body."""
+    body = b"" if payload is None else json.dumps(payload).encode("utf-8")
+    request = f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n{headers}\r\n"
+    writer.write(request.encode("latin-1") + body)
+    await writer.drain()
+    
+    status_line = await reader.readline()
+    response_headers = {}
+    while True:
+        line = (await reader.readline()).decode("latin-1").strip()
+        if not line:
+            break
+        name, _, value = line.partition(":")
+        response_headers[name.lower()] = value.strip()
+    
+    response_body = await reader.readexactly(int(response_headers["content-length"]))
+    return int(status_line.split()[1]), json.loads(response_body.decode("utf-8"))
+
+
+class TestAnalysisServer:
+    """Test cases for the analysis server."""
+    
+    def run_with_server(self, scenario, **server_options):
+        """Start a server on a free localhost port and run a client scenario against it."""
+        async def run():
+            async with AnalysisServer(port=0, **server_options) as server:
+                reader, writer = await asyncio.open_connection("127.0.0.1", server.bound_port)
+                try:
+                    return await scenario(server, reader, writer)
+                finally:
+                    writer.close()
+        
+        return asyncio.run(run())
+    
+    def test_health_endpoint(self):
+        """Test the health check."""
+        async def scenario(server, reader, writer):
+            return await send_request(reader, writer, "GET", "/health")
+        
+        assert self.run_with_server(scenario) == (200, {"status": "ok"})
+    
+    def test_analyze_single_text(self):
+        """Test analyzing one text per request."""
+        text = "این محصول عالی است"
+        
+        async def scenario(server, reader, writer):
+            return await send_request(reader, writer, "POST", "/analyze", {"text": text})
+        
+        status, body = self.run_with_server(scenario)
+        
+        assert status == 200
+        assert body == Analyzer().analyze(text).to_dict()
+    
+    def test_analyze_batched_texts_on_one_connection(self):
+        """Test batched requests and keep-alive across several requests."""
+        texts = ["این محصول عالی است", "خدمات بد بود", "امروز هوا خوب است"]
+        
+        async def scenario(server, reader, writer):
+            first = await send_request(reader, writer, "POST", "/analyze", {"texts": texts})
+            second = await send_request(reader, writer, "POST", "/analyze", {"texts": texts[:1]})
+            return first, second
+        
+        (first_status, first_body), (second_status, second_body) = self.run_with_server(scenario)
+        
+        assert first_status == second_status == 200
+        assert first_body["results"] == [result.to_dict() for result in Analyzer().analyze_texts(texts)]
+        assert len(second_body["results"]) == 1
+    
+    def test_concurrent_requests_are_batched(self):
+        """Test that requests arriving together share analysis batches."""
+        texts = [f"متن شماره {index} خوب است" for index in range(8)]
+        
+        async def scenario(server, reader, writer):
+            async def analyze_on_new_connection(text):
+                client_reader, client_writer = await asyncio.open_connection("127.0.0.1", server.bound_port)
+                try:
+                    return await send_request(client_reader, client_writer, "POST", "/analyze", {"text": text})
+                finally:
+                    client_writer.close()
+            
+            responses = await asyncio.gather(*(analyze_on_new_connection(text) for text in texts))
+            stats = await send_request(reader, writer, "GET", "/stats")
+            return responses, stats
+        
+        responses, (_, stats) = self.run_with_server(scenario, max_batch_size=8, max_wait_ms=200)
+        
+        assert [body["text"] for _, body in responses] == texts
+        assert stats["requests"] == 9
+        assert stats["texts"] == 8
+        assert stats["batches"] < 8
+    
+    def test_error_responses(self):
+        """Test error statuses for invalid requests."""
+        async def scenario(server, reader, writer):
+            return [
+                await send_request(reader, writer, "POST", "/analyze", {"text": "   "}),
+                await send_request(reader, writer, "POST", "/analyze", {"texts": ["خوب", ""]}),
+                await send_request(reader, writer, "POST", "/analyze", {"other": 1}),
+                await send_request(reader, writer, "POST", "/analyze", {"texts": "not a list"}),
+                await send_request(reader, writer, "GET", "/analyze"),
+                await send_request(reader, writer, "GET", "/missing"),
+                await send_request(reader, writer, "GET", "/stats"),
+            ]
+        
+        responses = self.run_with_server(scenario)
+        
+        assert [status for status, _ in responses] == [400, 400, 400, 400, 405, 404, 200]
+        assert responses[0][1] == {"error": "Text cannot be empty"}
+        assert responses[-1][1]["errors"] == 6
+        assert responses[-1][1]["texts"] == 0
+    
+    def test_invalid_json_body(self):
+        """Test that malformed JSON is rejected."""
+        async def scenario(server, reader, writer):
+            writer.write(b"POST /analyze HTTP/1.1\r\nContent-Length: 3\r\n\r\n{x}")
+            await writer.drain()
+            status_line = await reader.readline()
+            return int(status_line.split()[1])
+        
+        assert self.run_with_server(scenario) == 400
+    
+    def test_oversized_header_line(self):
+        """Test that a header line beyond the stream limit is answered with 431."""
+        async def scenario(server, reader, writer):
+            writer.write(b"GET /health HTTP/1.1\r\nX-Padding: " + b"a" * 70000 + b"\r\n\r\n")
+            await writer.drain()
+            status_line = await reader.readline()
+            return int(status_line.split()[1]), server.error_count
+        
+        assert self.run_with_server(scenario) == (431, 1)
+    
+    def test_unexpected_analysis_error(self):
+        """Test that failures inside the analysis are answered with 500 and counted."""
+        async def fail(texts):
+            raise RuntimeError("worker pool broken")
+        
+        async def scenario(server, reader, writer):
+            server.async_analyzer.analyze_many = fail
+            failed = await send_request(reader, writer, "POST", "/analyze", {"text": "خوب"})
+            stats = await send_request(reader, writer, "GET", "/stats")
+            return failed, stats
+        
+        (status, body), (_, stats) = self.run_with_server(scenario)
+        
+        assert (status, body) == (500, {"error": "Internal server error"})
+        assert stats["errors"] == 1
+    
+    @pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix-domain sockets are not available")
+    def test_unix_socket(self, tmp_path):
+        """Test serving over a Unix-domain socket."""
+        socket_path = str(tmp_path / "leximood.sock")
+        
+        async def run():
+            async with AnalysisServer(unix_socket=socket_path):
+                reader, writer = await asyncio.open_unix_connection(socket_path)
+                try:
+                    return await send_request(reader, writer, "GET", "/health")
+                finally:
+                    writer.close()
+        
+        assert asyncio.run(run()) == (200, {"status": "ok"})
\ No newline at end of file
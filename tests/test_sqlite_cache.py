@@ -0,0 +1,144 @@
+"""
+Tests for the SQLite result cache module.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pytest
+from leximood.analyzer import Analyzer
+from leximood.cache import CachedAnalysis, hash_text
+from leximood.models import SentenceResult, SentimentLabel
+from leximood.sqlite_cache import SQLiteResultCache, main
+
+
+class TestSQLiteResultCache:
+    """Test cases for the SQLite result cache."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.entry = CachedAnalysis(SentimentLabel.NEGATIVE, -0.4, ("بد", "خراب"), 0.6)
+    
+    def create_key(self, text, config_key="config", lexicon_version="v1"):
+        """Create a cache key for a text."""
+        return (hash_text(text), config_key, lexicon_version)
+    
+    def test_put_and_get_round_trip(self, tmp_path):
+        """Test that stored entries are returned unchanged."""
+        with SQLiteResultCache(str(tmp_path / "cache.db")) as cache:
+            cache.put(self.create_key("متن"), self.entry)
+            
+            assert cache.get(self.create_key("متن")) == self.entry
+            assert cache.get(self.create_key("دیگر")) is None
+            assert cache.hits == 1
+            assert cache.misses == 1
+    
+    def test_empty_keywords_round_trip(self, tmp_path):
+        """Test that entries without keywords are stored correctly."""
+        entry = CachedAnalysis(SentimentLabel.NEUTRAL, 0.0, (), 0.0)
+        with SQLiteResultCache(str(tmp_path / "cache.db")) as cache:
+            cache.put(self.create_key("متن"), entry)
+            
+            assert cache.get(self.create_key("متن")) == entry
+    
+    def test_sentences_round_trip(self, tmp_path):
+        """Test that sentence results are stored alongside the document result."""
+        sentences = (
+            SentenceResult("بد بود.", SentimentLabel.NEGATIVE, -0.6),
+            SentenceResult("خراب شد", SentimentLabel.NEGATIVE, -0.2)
+        )
+        entry = self.entry._replace(sentences=sentences)
+        with SQLiteResultCache(str(tmp_path / "cache.db")) as cache:
+            cache.put(self.create_key("متن"), entry)
+            
+            assert cache.get(self.create_key("متن")) == entry
+    
+    def test_bulk_get_and_put(self, tmp_path):
+        """Test batched lookups across several chunks and namespaces."""
+        keys = [self.create_key(f"متن {index}") for index in range(25)]
+        other_key = self.create_key("متن 0", config_key="other")
+        
+        with SQLiteResultCache(str(tmp_path / "cache.db"), batch_size=4) as cache:
+            cache.put_many((key, self.entry) for key in keys[:20])
+            found = cache.get_many(keys + [other_key])
+            
+            assert set(found) == set(keys[:20])
+            assert cache.hits == 20
+            assert cache.misses == 6
+    
+    def test_entries_persist_across_connections(self, tmp_path):
+        """Test that results survive closing and reopening the cache."""
+        path = str(tmp_path / "cache.db")
+        with SQLiteResultCache(path) as cache:
+            cache.put(self.create_key("متن"), self.entry)
+        
+        with SQLiteResultCache(path) as cache:
+            assert cache.get(self.create_key("متن")) == self.entry
+            assert len(cache) == 1
+    
+    def test_uses_write_ahead_logging(self, tmp_path):
+        """Test that the cache database is opened in WAL mode."""
+        with SQLiteResultCache(str(tmp_path / "cache.db")) as cache:
+            journal_mode = cache._connection.execute("PRAGMA journal_mode").fetchone()[0]
+        
+        assert journal_mode == "wal"
+    
+    def test_prune_removes_least_recently_used_entries(self, tmp_path):
+        """Test that pruning shrinks the file and keeps the most recently used entries."""
+        with SQLiteResultCache(str(tmp_path / "cache.db")) as cache:
+            cache.put_many((self.create_key(f"قدیمی {index}"), self.entry) for index in range(2000))
+            cache.put(self.create_key("جدید"), self.entry)
+            original_size = cache.stats()["bytes"]
+            
+            removed_count = cache.prune(original_size // 4)
+            
+            assert removed_count > 0
+            assert cache.stats()["bytes"] <= original_size // 4
+            assert len(cache) == 2001 - removed_count
+            assert cache.get(self.create_key("جدید")) == self.entry
+    
+    def test_prune_keeps_recently_read_entries(self, tmp_path):
+        """Test that reading an old entry protects it from pruning."""
+        with SQLiteResultCache(str(tmp_path / "cache.db")) as cache:
+            cache.put(self.create_key("پرکاربرد"), self.entry)
+            cache.put_many((self.create_key(f"متن {index}"), self.entry) for index in range(2000))
+            assert cache.get(self.create_key("پرکاربرد")) == self.entry
+            
+            removed_count = cache.prune(cache.stats()["bytes"] // 4)
+            
+            assert removed_count > 0
+            assert cache.get(self.create_key("پرکاربرد")) == self.entry
+    
+    def test_invalid_batch_size(self, tmp_path):
+        """Test that the lookup batch size must be positive."""
+        with pytest.raises(ValueError, match="batch_size must be at least 1"):
+            SQLiteResultCache(str(tmp_path / "cache.db"), batch_size=0)
+    
+    def test_prune_command(self, tmp_path, capsys):
+        """Test the command-line pruning entry point."""
+        path = str(tmp_path / "cache.db")
+        with SQLiteResultCache(path) as cache:
+            cache.put_many((self.create_key(f"متن {index}"), self.entry) for index in range(500))
+        
+        assert main(["prune", path, "--max-bytes", "1"]) == 0
+        assert "Removed 500 cached results" in capsys.readouterr().out
+        
+        with SQLiteResultCache(path) as cache:
+            assert len(cache) == 0
+    
+    def test_analyzer_reuses_persisted_results(self, tmp_path):
+        """Test that a second run over the same texts is served from disk."""
+        path = str(tmp_path / "cache.db")
+        texts = ["این محصول عالی است", "خدمات بد بود", "این محصول عالی است"]
+        
+        with SQLiteResultCache(path) as cache:
+            first_run = Analyzer(result_cache=cache).analyze_texts(texts)
+        
+        with SQLiteResultCache(path) as cache:
+            second_run = Analyzer(result_cache=cache).analyze_texts(texts)
+            
+            assert cache.hits == 2
+            assert cache.misses == 0
+        
+        assert second_run == first_run
\ No newline at end of file
@@ -0,0 +1,86 @@
+"""
+Tests for the streaming document analysis module.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import io
+import pytest
+from leximood.analyzer import Analyzer
+from leximood.config import AnalysisConfig, AnalysisLevel
+from leximood.preprocessor import TextPreprocessor
+from leximood.streaming import TextChunks
+
+SAMPLE_TEXT = (
+    "امروز   خیلی خوشحالم . ولي ديروز ناراحت بودم!!! \n\n"
+    "فردا؟ این محصول عالی است ،  ارسال بد بود\tو پشتیبانی خوب نبود"
+)
+
+
+class TestStreamingAnalysis:
+    """Test cases for analyzing documents as a stream of chunks."""
+    
+    def assert_same_analysis(self, streamed, whole):
+        """Assert that a streamed result matches a whole-text result."""
+        assert streamed.sentiment == whole.sentiment
+        assert streamed.score == whole.score
+        assert streamed.keywords == whole.keywords
+        assert streamed.confidence == whole.confidence
+        assert streamed.sentences == whole.sentences
+    
+    @pytest.mark.parametrize("analysis_level", [AnalysisLevel.SENTENCE, AnalysisLevel.DOCUMENT])
+    def test_matches_whole_text_for_every_chunk_size(self, analysis_level):
+        """Test that chunk boundaries anywhere in the text do not change the result."""
+        analyzer = Analyzer(AnalysisConfig(analysis_level=analysis_level))
+        whole = analyzer.analyze(SAMPLE_TEXT)
+        
+        for chunk_size in range(1, len(SAMPLE_TEXT) + 1):
+            self.assert_same_analysis(analyzer.analyze_stream(io.StringIO(SAMPLE_TEXT), chunk_size), whole)
+    
+    def test_accepts_chunk_iterators(self):
+        """Test analyzing an iterator of text chunks."""
+        analyzer = Analyzer()
+        chunks = (SAMPLE_TEXT[start:start + 7] for start in range(0, len(SAMPLE_TEXT), 7))
+        
+        result = analyzer.analyze_stream(chunks)
+        
+        self.assert_same_analysis(result, analyzer.analyze(SAMPLE_TEXT))
+        assert result.text == ""
+        assert len(result.sentences) == 4
+    
+    def test_rejects_empty_stream(self):
+        """Test that streams without text are rejected like empty texts."""
+        analyzer = Analyzer()
+        
+        with pytest.raises(ValueError, match="Text cannot be empty"):
+            analyzer.analyze_stream(iter(["  ", "\n"]))
+        with pytest.raises(ValueError, match="Text cannot be empty"):
+            analyzer.analyze_stream(io.StringIO(""))
+    
+    def test_invalid_chunk_size(self):
+        """Test that chunk sizes below the minimum are rejected."""
+        with pytest.raises(ValueError, match="chunk_size must be at least 1"):
+            Analyzer().analyze_stream(io.StringIO(SAMPLE_TEXT), 0)
+    
+    def test_text_chunks_reads_file_objects(self):
+        """Test that file objects are read in chunks of the requested size."""
+        chunks = TextChunks(io.StringIO("abcdefg"), 3)
+        
+        assert list(chunks) == ["abc", "def", "g"]
+        assert chunks.has_text
+
+
+class TestStreamNormalization:
+    """Test cases for incremental text normalization."""
+    
+    def test_matches_whole_text_normalization(self):
+        """Test that normalizing a stream produces the normalized whole text."""
+        preprocessor = TextPreprocessor()
+        
+        for chunk_size in range(1, 12):
+            chunks = TextChunks(io.StringIO(SAMPLE_TEXT), chunk_size)
+            normalized = "".join(preprocessor.normalize_stream(chunks))
+            
+            assert normalized == preprocessor.normalize_text(SAMPLE_TEXT)
\ No newline at end of file
@@ -0,0 +1,106 @@
+"""
+Tests for the vectorized lexicon scoring module.
+"""
+
+import sys
+import os
+import json
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import numpy as np
+import pytest
+from leximood.analyzer import Analyzer
+from leximood.config import AnalysisConfig, AnalysisLevel
+from leximood.models import SentimentLabel, TokenizedDocument
+from leximood.resources import ResourceRegistry
+from leximood.vectorized import OUT_OF_VOCABULARY_ID, VectorizedLexicon
+
+
+class TestVectorizedLexicon:
+    """Test cases for the vectorized lexicon."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.lexicon = VectorizedLexicon({"خوب": 0.6, "بد": -0.6, "خنثی": 0.0})
+    
+    def test_encode_maps_unknown_words_to_reserved_id(self):
+        """Test that words outside the lexicon share the out-of-vocabulary id."""
+        token_ids = self.lexicon.encode(["خوب", "کتاب", "بد"])
+        
+        assert token_ids.dtype == np.int32
+        assert token_ids[1] == OUT_OF_VOCABULARY_ID
+        assert self.lexicon.scores[token_ids].tolist() == [0.6, 0.0, -0.6]
+        assert len(self.lexicon) == 3
+    
+    def test_score_segments(self):
+        """Test per-segment totals and counts of scored words, including empty segments."""
+        token_ids = self.lexicon.encode(["خوب", "خوب", "خنثی", "کتاب", "بد"])
+        
+        segment_totals = self.lexicon.score_segments(token_ids, [3, 0, 2])
+        
+        assert segment_totals.totals.tolist() == pytest.approx([1.2, 0.0, -0.6])
+        assert segment_totals.counts.tolist() == [2, 0, 1]
+    
+    def test_empty_batch(self):
+        """Test scoring a batch without tokens."""
+        segment_totals = self.lexicon.score_segments(self.lexicon.encode([]), [])
+        
+        assert segment_totals.totals.shape == (0,)
+        assert segment_totals.counts.shape == (0,)
+
+
+class TestVectorizedScoring:
+    """Test cases for vectorized batch scoring in the analyzer."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.lexicon = {
+            "positive_words": {"خوب": 0.1, "عالی": 0.9, "خوشحالم": 0.7},
+            "negative_words": {"بد": -0.6, "ناراحت": -0.3, "خنثی": 0.0}
+        }
+        self.texts = [
+            "امروز خیلی خوشحالم. فردا؟",
+            "خوب",
+            "دیروز ناراحت بودم ولی امروز عالی است. خدمات بد بود",
+            "خنثی و معمولی",
+            "خوب خوب خوب",
+            "...",
+        ]
+    
+    def create_registry(self, tmp_path):
+        """Write the fixture lexicon and return a registry over it."""
+        (tmp_path / "persian_sentiment_lexicon.json").write_text(
+            json.dumps(self.lexicon, ensure_ascii=False), encoding="utf-8"
+        )
+        return ResourceRegistry(str(tmp_path))
+    
+    @pytest.mark.parametrize("analysis_level", [AnalysisLevel.SENTENCE, AnalysisLevel.DOCUMENT])
+    def test_matches_scalar_scoring(self, tmp_path, analysis_level):
+        """Test that vectorized batches produce the same results as word-by-word scoring."""
+        registry = self.create_registry(tmp_path)
+        scalar = Analyzer(AnalysisConfig(analysis_level=analysis_level), registry)
+        vectorized = Analyzer(AnalysisConfig(analysis_level=analysis_level, vectorized_scoring=True), registry)
+        
+        expected = scalar.analyze_texts(self.texts)
+        results = vectorized.analyze_texts(self.texts, batch_size=4)
+        
+        assert results == expected
+        assert results[1].score == 0.1
+        assert results[1].sentiment == SentimentLabel.NEUTRAL
+    
+    def test_analyze_documents_sentences(self, tmp_path):
+        """Test batch sentence scoring against per-document sentence scoring."""
+        sentiment_analyzer = Analyzer(registry=self.create_registry(tmp_path)).sentiment_analyzer
+        documents = [TokenizedDocument.from_text_with_sentences(text) for text in self.texts]
+        
+        expected = [sentiment_analyzer.analyze_document_sentences(document) for document in documents]
+        
+        assert sentiment_analyzer.analyze_documents_sentences(documents) == expected
+        assert sentiment_analyzer.analyze_documents_sentences([]) == []
+    
+    def test_vectorized_lexicon_is_shared(self, tmp_path):
+        """Test that the vectorized lexicon is built once per registry."""
+        registry = self.create_registry(tmp_path)
+        
+        assert registry.vectorized_lexicon() is registry.vectorized_lexicon()
+        assert set(registry.vectorized_lexicon().word_ids) == set(registry.lexicon_store().scores)
\ No newline at end of file